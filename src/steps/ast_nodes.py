@@ -527,6 +527,26 @@ class BinaryOpNode(ExpressionNode):
     right: ExpressionNode
 
 
+@dataclass
+class NAryOpNode(ExpressionNode):
+    """Chain of left-associative binary operations at one precedence level.
+    
+    Example: a + b - c + d, x and y and z
+    
+    Used instead of nested BinaryOpNodes when a chain has three or more
+    operands. Evaluated left to right, so it means exactly what the nested
+    form would.
+    
+    Attributes:
+        operands: Operand expressions, in source order
+        operators: Operator strings; operators[i] joins operands[i] and operands[i + 1]
+        operator_locations: Location of each operator, for error reporting
+    """
+    operands: List[ExpressionNode]
+    operators: List[str]
+    operator_locations: List[SourceLocation]
+
+
 @dataclass
 class UnaryOpNode(ExpressionNode):
     """Unary operation.
@@ -805,6 +825,9 @@ class ASTVisitor:
     def visit_BinaryOpNode(self, node: BinaryOpNode) -> Any:
         raise NotImplementedError
     
+    def visit_NAryOpNode(self, node: NAryOpNode) -> Any:
+        raise NotImplementedError
+    
     def visit_UnaryOpNode(self, node: UnaryOpNode) -> Any:
         raise NotImplementedError
     
@@ -53,6 +53,7 @@ from .comparison import (
 # Text operations
 from .text import (
     text_concatenate,
+    text_concatenate_many,
     text_split,
     text_length,
     text_character_at,
@@ -178,6 +179,7 @@ __all__ = [
     'boolean_not',
     # Text
     'text_concatenate',
+    'text_concatenate_many',
     'text_split',
     'text_length',
     'text_character_at',
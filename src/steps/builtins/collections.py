@@ -172,7 +172,7 @@ def table_set(
                 hint=f"Valid indices are 0 to {len(container.elements) - 1}."
             )
         
-        container.elements[index] = value
+        container.set(index, value)
         return
     
     # Handle table assignment
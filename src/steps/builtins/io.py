@@ -2,7 +2,7 @@
 
 import os
 import csv as _csv
-from typing import Optional
+from typing import List, Optional
 
 from ..types import (
     StepsValue, StepsText, StepsBoolean, StepsList, StepsTable,
@@ -151,7 +151,7 @@ def read_csv(
     try:
         with open(path.value, 'r', encoding='utf-8', newline='') as f:
             reader = _csv.DictReader(f)
-            rows = []
+            rows: List[StepsValue] = []
             for row in reader:
                 # Convert each row (dict) to a StepsTable
                 table = StepsTable({k: StepsText(v) for k, v in row.items()})
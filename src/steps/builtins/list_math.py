@@ -1,6 +1,6 @@
 """List aggregate math operations (min, max, sum for numeric lists)."""
 
-from typing import Optional
+from typing import List, Optional, cast
 
 from ..types import StepsValue, StepsNumber, StepsList
 from ..errors import StepsTypeError, StepsRuntimeError, ErrorCode, SourceLocation
@@ -28,8 +28,13 @@ def _validate_numeric_list(lst: StepsValue, fn_name: str, location: Optional[Sou
             hint="Make sure the list has at least one number in it."
         )
 
+    elements = lst.elements
+    if all(type(elem) is StepsNumber for elem in elements):
+        # The usual case: read the raw floats straight off the elements
+        return [elem.value for elem in cast(List[StepsNumber], elements)]
+
     numbers = []
-    for i, elem in enumerate(lst.elements):
+    for i, elem in enumerate(elements):
         if not isinstance(elem, StepsNumber):
             raise StepsTypeError(
                 code=ErrorCode.E302,
@@ -1,6 +1,6 @@
 """Text operations including new string handling functions."""
 
-from typing import Optional
+from typing import List, Optional
 
 from ..types import (
     StepsValue, StepsNumber, StepsText, StepsBoolean, StepsList,
@@ -21,6 +21,14 @@ def text_concatenate(
     return left_text.added_to(right_text)
 
 
+def text_concatenate_many(
+    values: List[StepsValue],
+    location: Optional[SourceLocation] = None
+) -> StepsText:
+    """Concatenate a chain of values as text in one pass."""
+    return StepsText.concat_many([value.as_text() for value in values])
+
+
 def text_split(
     text: StepsValue, 
     delimiter: StepsValue,
@@ -341,6 +349,5 @@ def text_characters(
         )
     
     # Convert each character to a StepsText and put in a list
-    char_list = [StepsText(c) for c in text.value]
-    return StepsList(char_list)
+    return StepsText.list_of(text.value)
 
@@ -10,9 +10,9 @@ Interpreter with debugging capabilities including:
 
 import threading
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
-from .interpreter import Interpreter, ExecutionResult
+from .interpreter import Interpreter, ExecutionResult, ExitProgram
 from .environment import Environment
 from .errors import SourceLocation, StepsError
 from .types import StepsValue, StepsNumber, StepsText, StepsBoolean, StepsList, StepsTable, StepsNothing
@@ -24,6 +24,15 @@ from .debug_state import (
 )
 
 
+class DebuggerStopped(ExitProgram):
+    """Raised at the next statement after stop() to unwind the program.
+    
+    Unwinding (rather than skipping statements) ends loops whose bodies
+    would otherwise keep spinning with nothing executed.
+    """
+    pass
+
+
 class DebugInterpreter(Interpreter):
     """Interpreter with debugging capabilities.
     
@@ -57,7 +66,8 @@ class DebugInterpreter(Interpreter):
         
         self._on_debug_event = on_debug_event or (lambda e: None)
         self._debug_mode = DebugMode.PAUSED
-        self._breakpoints: Set[Breakpoint] = set()
+        # Keyed by (file, line) so the per-statement check is one dict lookup
+        self._breakpoints: Dict[Tuple[Path, int], Breakpoint] = {}
         
         # Depth tracking for step-over/step-out
         self._call_depth = 0
@@ -65,7 +75,10 @@ class DebugInterpreter(Interpreter):
         self._step_out_depth = 0
         
         # Threading support
-        self._pause_event = threading.Event()
+        # A pause waits on _resume_cond until resume() or stop() sets
+        # _resume_pending
+        self._resume_cond = threading.Condition()
+        self._resume_pending = False
         self._stop_requested = False
         self._is_running = False
         
@@ -74,6 +87,14 @@ class DebugInterpreter(Interpreter):
         
         # Current location tracking
         self._current_location: Optional[SourceLocation] = None
+        
+        # Called before every statement, on the interpreter's own thread, so
+        # an owner can apply changes queued from other threads
+        self._safe_point_hook: Optional[Callable[[], None]] = None
+        
+        # Whether 'call'/'return' events (each with a full snapshot) are
+        # emitted while running to a breakpoint, not just while stepping
+        self._call_events_while_running = True
     
     # =========================================================================
     # Debug Mode Control
@@ -96,19 +117,51 @@ class DebugInterpreter(Interpreter):
         """Get the current debug mode."""
         return self._debug_mode
     
-    def resume(self) -> None:
-        """Resume execution after a pause."""
-        self._pause_event.set()
+    def resume(self, mode: Optional[DebugMode] = None) -> None:
+        """Resume execution after a pause.
+        
+        Args:
+            mode: Optional debug mode to continue in. It is set under the
+                same lock as the wake-up and takes effect at once, so
+                stepping while the program runs pauses it at the next
+                statement.
+        """
+        with self._resume_cond:
+            if mode is not None:
+                self.set_mode(mode)
+            self._resume_pending = True
+            self._resume_cond.notify()
     
     def stop(self) -> None:
         """Request stop of execution."""
         self._stop_requested = True
-        self._pause_event.set()  # Unblock if waiting
+        with self._resume_cond:  # Unblock if waiting
+            self._resume_pending = True
+            self._resume_cond.notify()
     
     def is_running(self) -> bool:
         """Check if debugger is currently executing."""
         return self._is_running
     
+    def set_call_events_while_running(self, enabled: bool) -> None:
+        """Choose whether to report step calls and returns while running.
+        
+        When disabled, running to a breakpoint skips building a snapshot
+        for every call and return; pauses are always reported.
+        
+        Args:
+            enabled: True to emit 'call'/'return' events in every mode
+        """
+        self._call_events_while_running = enabled
+    
+    def set_safe_point_hook(self, hook: Optional[Callable[[], None]]) -> None:
+        """Set a callable to run before each statement executes.
+        
+        Args:
+            hook: Callable taking no arguments, or None to remove it
+        """
+        self._safe_point_hook = hook
+    
     # =========================================================================
     # Breakpoint Management
     # =========================================================================
@@ -120,8 +173,9 @@ class DebugInterpreter(Interpreter):
             file: Source file path
             line: Line number (1-indexed)
         """
-        bp = Breakpoint(file=file, line=line)
-        self._breakpoints.add(bp)
+        key = (file, line)
+        if key not in self._breakpoints:
+            self._breakpoints[key] = Breakpoint(file=file, line=line)
     
     def remove_breakpoint(self, file: Path, line: int) -> None:
         """Remove a breakpoint.
@@ -130,8 +184,7 @@ class DebugInterpreter(Interpreter):
             file: Source file path  
             line: Line number
         """
-        bp = Breakpoint(file=file, line=line)
-        self._breakpoints.discard(bp)
+        self._breakpoints.pop((file, line), None)
     
     def clear_breakpoints(self) -> None:
         """Remove all breakpoints."""
@@ -139,14 +192,12 @@ class DebugInterpreter(Interpreter):
     
     def get_breakpoints(self) -> List[Breakpoint]:
         """Get all breakpoints."""
-        return list(self._breakpoints)
+        return list(self._breakpoints.values())
     
     def has_breakpoint(self, file: Path, line: int) -> bool:
         """Check if there's a breakpoint at the given location."""
-        for bp in self._breakpoints:
-            if bp.file == file and bp.line == line and bp.enabled:
-                return True
-        return False
+        bp = self._breakpoints.get((file, line))
+        return bp is not None and bp.enabled
     
     # =========================================================================
     # Execution Override
@@ -174,18 +225,26 @@ class DebugInterpreter(Interpreter):
         Overrides parent to add pause/breakpoint checking.
         """
         if self._stop_requested:
-            return
+            raise DebuggerStopped()
+        
+        hook = self._safe_point_hook
+        if hook is not None:
+            hook()
         
         # Update current location
         self._current_location = stmt.location
         
         # Check if we should pause
         if self._should_pause(stmt):
+            # Cleared before the UI hears about the pause, so a resume sent
+            # in reply to the event can't be wiped out by the wait
+            with self._resume_cond:
+                self._resume_pending = False
             self._emit_event('paused')
             self._wait_for_resume()
             
             if self._stop_requested:
-                return
+                raise DebuggerStopped()
         
         # Execute the statement
         super().execute_statement(stmt)
@@ -201,17 +260,23 @@ class DebugInterpreter(Interpreter):
         Overrides parent to track call depth.
         """
         if self._stop_requested:
-            return StepsNothing()
+            raise DebuggerStopped()
         
+        report = (
+            self._call_events_while_running
+            or self._debug_mode != DebugMode.RUN_TO_BREAKPOINT
+        )
         self._call_depth += 1
-        self._emit_event('call')
+        if report:
+            self._emit_event('call')
         
         try:
             result = super().call_step(step_name, arguments, location)
             return result
         finally:
             self._call_depth -= 1
-            self._emit_event('return')
+            if report:
+                self._emit_event('return')
     
     # =========================================================================
     # Internal Debug Logic
@@ -255,9 +320,15 @@ class DebugInterpreter(Interpreter):
         return False
     
     def _wait_for_resume(self) -> None:
-        """Block until resume() or stop() is called."""
-        self._pause_event.clear()
-        self._pause_event.wait()
+        """Block until resume() or stop() is called.
+        
+        Returns at once if either already happened since the pause began.
+        """
+        with self._resume_cond:
+            # A stop() that landed after the caller's own check still counts
+            self._resume_cond.wait_for(
+                lambda: self._resume_pending or self._stop_requested
+            )
     
     def _emit_event(self, event_type: str, message: Optional[str] = None) -> None:
         """Emit a debug event to the callback.
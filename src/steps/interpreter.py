@@ -21,7 +21,7 @@ from .ast_nodes import (
     # Expression nodes
     ExpressionNode, NumberLiteral, TextLiteral, BooleanLiteral, NothingLiteral,
     ListLiteral, TableLiteral, IdentifierNode, InputNode,
-    BinaryOpNode, UnaryOpNode, TypeConversionNode, TypeOfNode, TypeCheckNode, TableAccessNode,
+    BinaryOpNode, NAryOpNode, UnaryOpNode, TypeConversionNode, TypeOfNode, TypeCheckNode, TableAccessNode,
     AddedToNode, SplitByNode, CharacterAtNode, LengthOfNode,
     ContainsNode, StartsWithNode, EndsWithNode, IsInNode,
     FormatNumberNode,
@@ -477,10 +477,10 @@ class Interpreter:
             items = list(collection)
         elif isinstance(collection, StepsText):
             # Iterate over characters
-            items = [StepsText(c) for c in collection.value]
+            items = StepsText.list_of(collection.value).elements
         elif isinstance(collection, StepsTable):
             # Iterate over keys
-            items = [StepsText(k) for k in collection.pairs.keys()]
+            items = collection.keys().elements
         else:
             raise StepsTypeError(
                 code=ErrorCode.E302,
@@ -576,7 +576,7 @@ class Interpreter:
         """Evaluate an expression and return its value."""
         # Literals
         if isinstance(expr, NumberLiteral):
-            return StepsNumber(expr.value)
+            return StepsNumber.of(expr.value)
         
         if isinstance(expr, TextLiteral):
             return StepsText(expr.value)
@@ -611,6 +611,10 @@ class Interpreter:
         if isinstance(expr, BinaryOpNode):
             return self._eval_binary_op(expr)
         
+        # Chained binary operations (a + b + c, x and y and z)
+        if isinstance(expr, NAryOpNode):
+            return self._eval_nary_op(expr)
+        
         # Unary operations
         if isinstance(expr, UnaryOpNode):
             return self._eval_unary_op(expr)
@@ -640,9 +644,7 @@ class Interpreter:
         
         # Text operations
         if isinstance(expr, AddedToNode):
-            left = self.evaluate_expression(expr.left)
-            right = self.evaluate_expression(expr.right)
-            return builtins.text_concatenate(left, right, expr.location)
+            return self._eval_added_to(expr)
         
         if isinstance(expr, SplitByNode):
             split_text = self.evaluate_expression(expr.text)
@@ -691,10 +693,42 @@ class Interpreter:
         """Evaluate a binary operation."""
         left = self.evaluate_expression(expr.left)
         right = self.evaluate_expression(expr.right)
+        return self._apply_binary_op(expr.operator, left, right, expr.location)
+    
+    def _eval_nary_op(self, expr: NAryOpNode) -> StepsValue:
+        """Evaluate an operator chain, folding left to right."""
+        operands = expr.operands
+        result = self.evaluate_expression(operands[0])
+        for op, operand, loc in zip(expr.operators, operands[1:], expr.operator_locations):
+            right = self.evaluate_expression(operand)
+            result = self._apply_binary_op(op, result, right, loc)
+        return result
+    
+    def _eval_added_to(self, expr: AddedToNode) -> StepsValue:
+        """Evaluate text concatenation, joining a whole chain at once.
+        
+        "a" added to b added to c parses as nested AddedToNodes; joining the
+        chain in one go avoids copying the growing text at every step.
+        """
+        if not isinstance(expr.left, AddedToNode):
+            left = self.evaluate_expression(expr.left)
+            right = self.evaluate_expression(expr.right)
+            return builtins.text_concatenate(left, right, expr.location)
         
-        op = expr.operator
-        loc = expr.location
-        
+        right_exprs = []
+        node: ExpressionNode = expr
+        while isinstance(node, AddedToNode):
+            right_exprs.append(node.right)
+            node = node.left
+        values = [self.evaluate_expression(node)]
+        for right_expr in reversed(right_exprs):
+            values.append(self.evaluate_expression(right_expr))
+        return builtins.text_concatenate_many(values, expr.location)
+    
+    def _apply_binary_op(
+        self, op: str, left: StepsValue, right: StepsValue, loc: SourceLocation
+    ) -> StepsValue:
+        """Apply a binary operator to two evaluated operands."""
         # Arithmetic
         if op == "+":
             return builtins.add_numbers(left, right, loc)
@@ -10,15 +10,19 @@ The lexer converts Steps source code into a stream of tokens. It handles:
 """
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from .errors import LexerError, SourceLocation, ErrorCode, make_error
 
 
-class TokenType(Enum):
-    """All token types in the Steps language."""
+class TokenType(IntEnum):
+    """All token types in the Steps language.
+    
+    An IntEnum so token-type comparisons in the parser are plain integer
+    comparisons.
+    """
     
     # Structure
     BUILDING = auto()          # "building:"
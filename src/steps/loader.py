@@ -7,17 +7,28 @@ The loader is responsible for:
 - Registering all components with the environment
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, cast
 
-from .ast_nodes import BuildingNode, FloorNode, StepNode, RiserNode
+from .ast_nodes import ASTNode, BuildingNode, FloorNode, StepNode, RiserNode
 from .environment import Environment, StepDefinition, RiserDefinition, FloorDefinition
 from .errors import StepsError, StructureError, ErrorCode, SourceLocation
 from .lexer import Lexer
 from .parser import Parser, ParseResult
 
 
+# Parsed files by (path, kind), each with the (mtime_ns, size) it was parsed
+# at, least recently used first. The IDE loads projects in-process, so the
+# cache is bounded to keep old projects' ASTs from living all session.
+_PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: "OrderedDict[Tuple[Path, str], Tuple[Tuple[int, int], ASTNode]]" = OrderedDict()
+# The IDE loads from its debug thread and the GUI thread at once
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
 @dataclass
 class LoadResult:
     """Result of loading a Steps project."""
@@ -162,6 +173,27 @@ class Loader:
     
     def _load_building(self, path: Path) -> ParseResult:
         """Load and parse a building file."""
+        return self._parse_file(path, "building")
+    
+    def _parse_file(self, path: Path, kind: str) -> ParseResult:
+        """Read, lex and parse a building, floor or step file.
+        
+        Successful parses are cached by path, modification time and size,
+        so loading a project again only re-parses the files that changed.
+        """
+        try:
+            stat = path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        cache_key = (path, kind)
+        if stamp is not None:
+            with _PARSE_CACHE_LOCK:
+                cached = _PARSE_CACHE.get(cache_key)
+                if cached is not None and cached[0] == stamp:
+                    _PARSE_CACHE.move_to_end(cache_key)
+                    return ParseResult(ast=cached[1])
+        
         try:
             source = path.read_text(encoding='utf-8')
         except IOError as e:
@@ -169,7 +201,7 @@ class Loader:
                 ast=None,
                 errors=[StructureError(
                     code=ErrorCode.E001,
-                    message=f"Could not read building file: {e}",
+                    message=f"Could not read {kind} file: {e}",
                     file=path,
                     line=0,
                     column=0,
@@ -193,7 +225,22 @@ class Loader:
             )])
         
         parser = Parser(tokens, path)
-        return parser.parse_building()
+        if kind == "building":
+            parse_result = parser.parse_building()
+        elif kind == "floor":
+            parse_result = parser.parse_floor()
+        else:
+            parse_result = parser.parse_step()
+        
+        # The AST is never modified after parsing, so it is safe to share
+        ast = parse_result.ast
+        if parse_result.success and ast is not None and stamp is not None:
+            with _PARSE_CACHE_LOCK:
+                _PARSE_CACHE[cache_key] = (stamp, ast)
+                _PARSE_CACHE.move_to_end(cache_key)
+                if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                    _PARSE_CACHE.popitem(last=False)
+        return parse_result
     
     def _load_floor(
         self, 
@@ -205,38 +252,7 @@ class Loader:
         result = LoadResult(success=True)
         
         # Parse the floor file
-        try:
-            source = floor_file.read_text(encoding='utf-8')
-        except IOError as e:
-            result.add_error(StructureError(
-                code=ErrorCode.E001,
-                message=f"Could not read floor file: {e}",
-                file=floor_file,
-                line=0,
-                column=0,
-                hint="Check file permissions and encoding."
-            ))
-            return result
-        
-        lexer = Lexer(source, floor_file)
-        try:
-            tokens = lexer.tokenize()
-        except StepsError as e:
-            result.add_error(e)
-            return result
-        except Exception as e:
-            result.add_error(StructureError(
-                code=ErrorCode.E001,
-                message=f"Lexer error: {e}",
-                file=floor_file,
-                line=0,
-                column=0,
-                hint="Check the file syntax."
-            ))
-            return result
-        
-        parser = Parser(tokens, floor_file)
-        parse_result = parser.parse_floor()
+        parse_result = self._parse_file(floor_file, "floor")
         
         if not parse_result.success:
             for error in parse_result.errors:
@@ -279,38 +295,7 @@ class Loader:
         """Load and register a step."""
         result = LoadResult(success=True)
         
-        try:
-            source = step_file.read_text(encoding='utf-8')
-        except IOError as e:
-            result.add_error(StructureError(
-                code=ErrorCode.E001,
-                message=f"Could not read step file: {e}",
-                file=step_file,
-                line=0,
-                column=0,
-                hint="Check file permissions and encoding."
-            ))
-            return result
-        
-        lexer = Lexer(source, step_file)
-        try:
-            tokens = lexer.tokenize()
-        except StepsError as e:
-            result.add_error(e)
-            return result
-        except Exception as e:
-            result.add_error(StructureError(
-                code=ErrorCode.E001,
-                message=f"Lexer error: {e}",
-                file=step_file,
-                line=0,
-                column=0,
-                hint="Check the file syntax."
-            ))
-            return result
-        
-        parser = Parser(tokens, step_file)
-        parse_result = parser.parse_step()
+        parse_result = self._parse_file(step_file, "step")
         
         if not parse_result.success:
             for error in parse_result.errors:
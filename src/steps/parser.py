@@ -27,7 +27,7 @@ from .ast_nodes import (
     # Expression nodes
     ExpressionNode, NumberLiteral, TextLiteral, BooleanLiteral, NothingLiteral,
     ListLiteral, TableLiteral, IdentifierNode, InputNode,
-    BinaryOpNode, UnaryOpNode, TypeConversionNode, TypeOfNode, TypeCheckNode, TableAccessNode,
+    BinaryOpNode, NAryOpNode, UnaryOpNode, TypeConversionNode, TypeOfNode, TypeCheckNode, TableAccessNode,
     AddedToNode, SplitByNode, CharacterAtNode, LengthOfNode,
     ContainsNode, StartsWithNode, EndsWithNode, IsInNode,
     FormatNumberNode,
@@ -36,6 +36,120 @@ from .errors import ParseError, StepsError, SourceLocation, ErrorCode
 from .lexer import Token, TokenType, Lexer
 
 
+# Token types bound once at module level so the parser's hot paths read a
+# global instead of looking the member up on TokenType at every use.
+_TT_BUILDING = TokenType.BUILDING
+_TT_FLOOR = TokenType.FLOOR
+_TT_STEP = TokenType.STEP
+_TT_RISER = TokenType.RISER
+_TT_BELONGS_TO = TokenType.BELONGS_TO
+_TT_EXPECTS = TokenType.EXPECTS
+_TT_RETURNS = TokenType.RETURNS
+_TT_DECLARE = TokenType.DECLARE
+_TT_DO = TokenType.DO
+_TT_EXIT = TokenType.EXIT
+_TT_AS = TokenType.AS
+_TT_FIXED = TokenType.FIXED
+_TT_SET = TokenType.SET
+_TT_TO = TokenType.TO
+_TT_CALL = TokenType.CALL
+_TT_WITH = TokenType.WITH
+_TT_STORING_RESULT_IN = TokenType.STORING_RESULT_IN
+_TT_RETURN = TokenType.RETURN
+_TT_DISPLAY = TokenType.DISPLAY
+_TT_INDICATE = TokenType.INDICATE
+_TT_INPUT = TokenType.INPUT
+_TT_CLEAR = TokenType.CLEAR
+_TT_CONSOLE = TokenType.CONSOLE
+_TT_ITERATION = TokenType.ITERATION
+_TT_LIMIT = TokenType.LIMIT
+_TT_IF = TokenType.IF
+_TT_OTHERWISE_IF = TokenType.OTHERWISE_IF
+_TT_OTHERWISE = TokenType.OTHERWISE
+_TT_REPEAT = TokenType.REPEAT
+_TT_TIMES = TokenType.TIMES
+_TT_FOR_EACH = TokenType.FOR_EACH
+_TT_IN = TokenType.IN
+_TT_WHILE = TokenType.WHILE
+_TT_ATTEMPT = TokenType.ATTEMPT
+_TT_IF_UNSUCCESSFUL = TokenType.IF_UNSUCCESSFUL
+_TT_THEN_CONTINUE = TokenType.THEN_CONTINUE
+_TT_NOTE = TokenType.NOTE
+_TT_IS_EQUAL_TO = TokenType.IS_EQUAL_TO
+_TT_EQUALS = TokenType.EQUALS
+_TT_IS_NOT_EQUAL_TO = TokenType.IS_NOT_EQUAL_TO
+_TT_IS_LESS_THAN = TokenType.IS_LESS_THAN
+_TT_IS_GREATER_THAN = TokenType.IS_GREATER_THAN
+_TT_IS_LESS_THAN_OR_EQUAL_TO = TokenType.IS_LESS_THAN_OR_EQUAL_TO
+_TT_IS_GREATER_THAN_OR_EQUAL_TO = TokenType.IS_GREATER_THAN_OR_EQUAL_TO
+_TT_AND = TokenType.AND
+_TT_OR = TokenType.OR
+_TT_NOT = TokenType.NOT
+_TT_ADDED_TO = TokenType.ADDED_TO
+_TT_SPLIT_BY = TokenType.SPLIT_BY
+_TT_CHARACTER_AT = TokenType.CHARACTER_AT
+_TT_LENGTH_OF = TokenType.LENGTH_OF
+_TT_CONTAINS = TokenType.CONTAINS
+_TT_STARTS_WITH = TokenType.STARTS_WITH
+_TT_ENDS_WITH = TokenType.ENDS_WITH
+_TT_OF = TokenType.OF
+_TT_ADD = TokenType.ADD
+_TT_REMOVE = TokenType.REMOVE
+_TT_FROM = TokenType.FROM
+_TT_IS_IN = TokenType.IS_IN
+_TT_TYPE_OF = TokenType.TYPE_OF
+_TT_IS_A_NUMBER = TokenType.IS_A_NUMBER
+_TT_IS_A_TEXT = TokenType.IS_A_TEXT
+_TT_IS_A_BOOLEAN = TokenType.IS_A_BOOLEAN
+_TT_IS_A_LIST = TokenType.IS_A_LIST
+_TT_IS_A_TABLE = TokenType.IS_A_TABLE
+_TT_PLUS = TokenType.PLUS
+_TT_MINUS = TokenType.MINUS
+_TT_MULTIPLY = TokenType.MULTIPLY
+_TT_DIVIDE = TokenType.DIVIDE
+_TT_MODULO = TokenType.MODULO
+_TT_COLON = TokenType.COLON
+_TT_COMMA = TokenType.COMMA
+_TT_LBRACKET = TokenType.LBRACKET
+_TT_RBRACKET = TokenType.RBRACKET
+_TT_LPAREN = TokenType.LPAREN
+_TT_RPAREN = TokenType.RPAREN
+_TT_NUMBER = TokenType.NUMBER
+_TT_TEXT = TokenType.TEXT
+_TT_TRUE = TokenType.TRUE
+_TT_FALSE = TokenType.FALSE
+_TT_NOTHING = TokenType.NOTHING
+_TT_IDENTIFIER = TokenType.IDENTIFIER
+_TT_NEWLINE = TokenType.NEWLINE
+_TT_INDENT = TokenType.INDENT
+_TT_DEDENT = TokenType.DEDENT
+_TT_EOF = TokenType.EOF
+
+# Comparison operators and the operator string each one produces
+_COMPARISON_OPS = {
+    _TT_IS_EQUAL_TO: "is equal to",
+    _TT_IS_NOT_EQUAL_TO: "is not equal to",
+    _TT_EQUALS: "equals",
+    _TT_IS_LESS_THAN: "is less than",
+    _TT_IS_GREATER_THAN: "is greater than",
+    _TT_IS_LESS_THAN_OR_EQUAL_TO: "is less than or equal to",
+    _TT_IS_GREATER_THAN_OR_EQUAL_TO: "is greater than or equal to",
+    _TT_IS_IN: "is in",
+    _TT_CONTAINS: "contains",
+    _TT_STARTS_WITH: "starts with",
+    _TT_ENDS_WITH: "ends with",
+}
+
+# Type check operators (postfix): expr is a number, expr is a text, etc.
+_TYPE_CHECK_OPS = {
+    _TT_IS_A_NUMBER: "number",
+    _TT_IS_A_TEXT: "text",
+    _TT_IS_A_BOOLEAN: "boolean",
+    _TT_IS_A_LIST: "list",
+    _TT_IS_A_TABLE: "table",
+}
+
+
 @dataclass
 class ParseResult:
     """Result of parsing, containing AST and any errors."""
@@ -100,16 +214,18 @@ class Parser:
     
     def is_at_end(self) -> bool:
         """Check if we've reached the end of tokens."""
-        return self.current.type == TokenType.EOF
+        return self.current.type == _TT_EOF
     
     def check(self, *types: TokenType) -> bool:
         """Check if current token matches any of the given types."""
-        return self.current.type in types
+        return self.tokens[self.pos].type in types
     
     def match(self, *types: TokenType) -> bool:
         """If current token matches, consume it and return True."""
-        if self.check(*types):
-            self.advance()
+        token_type = self.tokens[self.pos].type
+        if token_type in types:
+            if token_type != _TT_EOF:
+                self.pos += 1
             return True
         return False
     
@@ -122,10 +238,42 @@ class Parser:
         # Return a dummy token to continue parsing
         return Token(token_type, "", self.current.line, self.current.column, self.file)
     
+    def _skip_newline(self) -> None:
+        """Consume a single optional newline token."""
+        if self.tokens[self.pos].type == _TT_NEWLINE:
+            self.pos += 1
+    
     def skip_newlines(self) -> None:
         """Skip any newline tokens."""
-        while self.match(TokenType.NEWLINE):
-            pass
+        tokens = self.tokens
+        while tokens[self.pos].type == _TT_NEWLINE:
+            self.pos += 1
+    
+    def _count_literal_items(self) -> int:
+        """Count the top-level items left in the bracketed literal being parsed.
+
+        Walks forward from the current token to the matching ']' (or the end
+        of the line) counting commas at nesting depth zero, so list and table
+        literals can size their element lists once instead of growing them
+        one append at a time.
+        """
+        tokens = self.tokens
+        depth = 0
+        count = 1
+        for i in range(self.pos, len(tokens)):
+            token_type = tokens[i].type
+            if token_type == _TT_LBRACKET or token_type == _TT_LPAREN:
+                depth += 1
+            elif token_type == _TT_RBRACKET or token_type == _TT_RPAREN:
+                if depth == 0:
+                    break
+                depth -= 1
+            elif token_type == _TT_COMMA:
+                if depth == 0:
+                    count += 1
+            elif token_type == _TT_NEWLINE or token_type == _TT_EOF:
+                break
+        return count
     
     def location(self) -> SourceLocation:
         """Get source location from current token."""
@@ -166,20 +314,20 @@ class Parser:
         
         while not self.is_at_end():
             # Stop at statement boundaries
-            if self.previous.type == TokenType.NEWLINE:
+            if self.previous.type == _TT_NEWLINE:
                 # Check if next token starts a statement
                 if self.check(
-                    TokenType.DISPLAY, TokenType.SET, TokenType.CALL,
-                    TokenType.RETURN, TokenType.EXIT, TokenType.IF,
-                    TokenType.REPEAT, TokenType.ATTEMPT, TokenType.ADD,
-                    TokenType.REMOVE, TokenType.NOTE, TokenType.DEDENT
+                    _TT_DISPLAY, _TT_SET, _TT_CALL,
+                    _TT_RETURN, _TT_EXIT, _TT_IF,
+                    _TT_REPEAT, _TT_ATTEMPT, _TT_ADD,
+                    _TT_REMOVE, _TT_NOTE, _TT_DEDENT
                 ):
                     return
             
             # Skip to structure boundaries
             if self.check(
-                TokenType.BUILDING, TokenType.FLOOR, TokenType.STEP,
-                TokenType.RISER, TokenType.DO, TokenType.DECLARE
+                _TT_BUILDING, _TT_FLOOR, _TT_STEP,
+                _TT_RISER, _TT_DO, _TT_DECLARE
             ):
                 return
             
@@ -195,18 +343,18 @@ class Parser:
         
         # building: name
         start = self.current
-        if not self.match(TokenType.BUILDING):
+        if not self.match(_TT_BUILDING):
             self.error("Expected 'building:' at the start of a building file.")
             return ParseResult(None, self.errors)
         
-        name_token = self.expect(TokenType.IDENTIFIER, "Expected building name after 'building:'")
+        name_token = self.expect(_TT_IDENTIFIER, "Expected building name after 'building:'")
         name = name_token.value
         
-        self.expect(TokenType.NEWLINE, "Expected newline after building name")
+        self.expect(_TT_NEWLINE, "Expected newline after building name")
         self.skip_newlines()
         
         # Expect indented body
-        if not self.match(TokenType.INDENT):
+        if not self.match(_TT_INDENT):
             self.error("Expected indented code block after 'building:'")
             return ParseResult(None, self.errors)
         
@@ -227,38 +375,38 @@ class Parser:
         
         # floor: name
         start = self.current
-        if not self.match(TokenType.FLOOR):
+        if not self.match(_TT_FLOOR):
             self.error("Expected 'floor:' at the start of a floor file.")
             return ParseResult(None, self.errors)
         
-        name_token = self.expect(TokenType.IDENTIFIER, "Expected floor name after 'floor:'")
+        name_token = self.expect(_TT_IDENTIFIER, "Expected floor name after 'floor:'")
         name = name_token.value
         
-        self.expect(TokenType.NEWLINE, "Expected newline after floor name")
+        self.expect(_TT_NEWLINE, "Expected newline after floor name")
         self.skip_newlines()
         
         # Expect indented list of steps
-        if not self.match(TokenType.INDENT):
+        if not self.match(_TT_INDENT):
             self.error("Expected indented step list after 'floor:'")
             return ParseResult(None, self.errors)
         
         # Parse step declarations
         steps: List[str] = []
-        while not self.check(TokenType.DEDENT, TokenType.EOF):
+        while not self.check(_TT_DEDENT, _TT_EOF):
             self.skip_newlines()
-            if self.check(TokenType.DEDENT, TokenType.EOF):
+            if self.check(_TT_DEDENT, _TT_EOF):
                 break
             
             # step: step_name
-            if self.match(TokenType.STEP):
-                step_name = self.expect(TokenType.IDENTIFIER, "Expected step name after 'step:'")
+            if self.match(_TT_STEP):
+                step_name = self.expect(_TT_IDENTIFIER, "Expected step name after 'step:'")
                 steps.append(step_name.value)
-                self.match(TokenType.NEWLINE)
+                self._skip_newline()
             else:
                 self.error(f"Expected 'step:' declaration, found '{self.current.value}'")
                 self.advance()
         
-        self.match(TokenType.DEDENT)
+        self.match(_TT_DEDENT)
         
         node = FloorNode(
             location=self.location_from(start),
@@ -274,18 +422,18 @@ class Parser:
         
         # step: name
         start = self.current
-        if not self.match(TokenType.STEP):
+        if not self.match(_TT_STEP):
             self.error("Expected 'step:' at the start of a step file.")
             return ParseResult(None, self.errors)
         
-        name_token = self.expect(TokenType.IDENTIFIER, "Expected step name after 'step:'")
+        name_token = self.expect(_TT_IDENTIFIER, "Expected step name after 'step:'")
         name = name_token.value
         
-        self.expect(TokenType.NEWLINE, "Expected newline after step name")
+        self.expect(_TT_NEWLINE, "Expected newline after step name")
         self.skip_newlines()
         
         # Expect indented body
-        if not self.match(TokenType.INDENT):
+        if not self.match(_TT_INDENT):
             self.error("Expected indented block after 'step:'")
             return ParseResult(None, self.errors)
         
@@ -297,51 +445,51 @@ class Parser:
         declarations: List[DeclarationNode] = []
         body: List[StatementNode] = []
         
-        while not self.check(TokenType.DEDENT, TokenType.EOF):
+        while not self.check(_TT_DEDENT, _TT_EOF):
             self.skip_newlines()
-            if self.check(TokenType.DEDENT, TokenType.EOF):
+            if self.check(_TT_DEDENT, _TT_EOF):
                 break
             
             # belongs to: floor_name
-            if self.match(TokenType.BELONGS_TO):
-                belongs_token = self.expect(TokenType.IDENTIFIER, "Expected floor name after 'belongs to:'")
+            if self.match(_TT_BELONGS_TO):
+                belongs_token = self.expect(_TT_IDENTIFIER, "Expected floor name after 'belongs to:'")
                 belongs_to = belongs_token.value
-                self.match(TokenType.NEWLINE)
+                self._skip_newline()
             
             # expects: parameters
-            elif self.match(TokenType.EXPECTS):
+            elif self.match(_TT_EXPECTS):
                 expects = self.parse_parameters()
-                self.match(TokenType.NEWLINE)
+                self._skip_newline()
             
             # returns: name [as type]
-            elif self.match(TokenType.RETURNS):
+            elif self.match(_TT_RETURNS):
                 returns = self.parse_return_declaration()
-                self.match(TokenType.NEWLINE)
+                self._skip_newline()
             
             # declare: block
-            elif self.match(TokenType.DECLARE):
-                self.match(TokenType.NEWLINE)
+            elif self.match(_TT_DECLARE):
+                self._skip_newline()
                 declarations = self.parse_declarations()
             
             # riser: name
-            elif self.match(TokenType.RISER):
+            elif self.match(_TT_RISER):
                 riser = self.parse_riser()
                 risers.append(riser)
             
             # do: block
-            elif self.match(TokenType.DO):
-                self.match(TokenType.NEWLINE)
+            elif self.match(_TT_DO):
+                self._skip_newline()
                 body = self.parse_do_block()
 
             # note: comment (skip notes in step header)
-            elif self.match(TokenType.NOTE):
-                self.match(TokenType.NEWLINE)
+            elif self.match(_TT_NOTE):
+                self._skip_newline()
 
             else:
                 self.error(f"Unexpected '{self.current.value}' in step definition")
                 self.advance()
         
-        self.match(TokenType.DEDENT)
+        self.match(_TT_DEDENT)
         
         node = StepNode(
             location=self.location_from(start),
@@ -365,19 +513,19 @@ class Parser:
         params: List[ParameterNode] = []
         
         # Check for 'nothing'
-        if self.match(TokenType.NOTHING):
+        if self.match(_TT_NOTHING):
             return params
         
         while True:
-            if self.check(TokenType.NEWLINE, TokenType.EOF):
+            if self.check(_TT_NEWLINE, _TT_EOF):
                 break
             
-            name_token = self.expect(TokenType.IDENTIFIER, "Expected parameter name")
+            name_token = self.expect(_TT_IDENTIFIER, "Expected parameter name")
             name = name_token.value
             type_annotation: Optional[str] = None
             
             # Optional type annotation: as type
-            if self.match(TokenType.AS):
+            if self.match(_TT_AS):
                 type_token = self.advance()
                 type_annotation = type_token.value
             
@@ -387,7 +535,7 @@ class Parser:
                 type_annotation=type_annotation
             ))
             
-            if not self.match(TokenType.COMMA):
+            if not self.match(_TT_COMMA):
                 break
         
         return params
@@ -395,13 +543,13 @@ class Parser:
     def parse_return_declaration(self) -> Optional[ReturnDeclaration]:
         """Parse return declaration (returns: name as type)."""
         # Check for 'nothing'
-        if self.match(TokenType.NOTHING):
+        if self.match(_TT_NOTHING):
             return None
         
-        name_token = self.expect(TokenType.IDENTIFIER, "Expected return value name")
+        name_token = self.expect(_TT_IDENTIFIER, "Expected return value name")
         type_annotation: Optional[str] = None
         
-        if self.match(TokenType.AS):
+        if self.match(_TT_AS):
             type_token = self.advance()
             type_annotation = type_token.value
         
@@ -415,27 +563,27 @@ class Parser:
         """Parse declaration block."""
         declarations: List[DeclarationNode] = []
         
-        if not self.match(TokenType.INDENT):
+        if not self.match(_TT_INDENT):
             return declarations
         
-        while not self.check(TokenType.DEDENT, TokenType.EOF):
+        while not self.check(_TT_DEDENT, _TT_EOF):
             self.skip_newlines()
-            if self.check(TokenType.DEDENT, TokenType.EOF):
+            if self.check(_TT_DEDENT, _TT_EOF):
                 break
             
             # Skip notes (comments) in declaration block
-            if self.match(TokenType.NOTE):
-                self.match(TokenType.NEWLINE)
+            if self.match(_TT_NOTE):
+                self._skip_newline()
                 continue
             
             # name as type [fixed]
-            name_token = self.expect(TokenType.IDENTIFIER, "Expected variable name in declaration")
-            self.expect(TokenType.AS, "Expected 'as' after variable name")
+            name_token = self.expect(_TT_IDENTIFIER, "Expected variable name in declaration")
+            self.expect(_TT_AS, "Expected 'as' after variable name")
             
             type_token = self.advance()
             type_name = type_token.value
             
-            is_fixed = self.match(TokenType.FIXED)
+            is_fixed = self.match(_TT_FIXED)
             
             declarations.append(DeclarationNode(
                 location=self.location_from(name_token),
@@ -444,9 +592,9 @@ class Parser:
                 is_fixed=is_fixed
             ))
             
-            self.match(TokenType.NEWLINE)
+            self._skip_newline()
         
-        self.match(TokenType.DEDENT)
+        self.match(_TT_DEDENT)
         return declarations
     
     def parse_do_block(self) -> List[StatementNode]:
@@ -457,13 +605,13 @@ class Parser:
         """Parse a riser definition."""
         start = self.previous  # Already consumed RISER
         
-        name_token = self.expect(TokenType.IDENTIFIER, "Expected riser name")
+        name_token = self.expect(_TT_IDENTIFIER, "Expected riser name")
         name = name_token.value
         
-        self.expect(TokenType.NEWLINE, "Expected newline after riser name")
+        self.expect(_TT_NEWLINE, "Expected newline after riser name")
         self.skip_newlines()
         
-        if not self.match(TokenType.INDENT):
+        if not self.match(_TT_INDENT):
             self.error("Expected indented block after riser declaration")
             return RiserNode(location=self.location_from(start), name=name)
         
@@ -472,31 +620,31 @@ class Parser:
         declarations: List[DeclarationNode] = []
         body: List[StatementNode] = []
         
-        while not self.check(TokenType.DEDENT, TokenType.EOF):
+        while not self.check(_TT_DEDENT, _TT_EOF):
             self.skip_newlines()
-            if self.check(TokenType.DEDENT, TokenType.EOF):
+            if self.check(_TT_DEDENT, _TT_EOF):
                 break
             
-            if self.match(TokenType.EXPECTS):
+            if self.match(_TT_EXPECTS):
                 expects = self.parse_parameters()
-                self.match(TokenType.NEWLINE)
-            elif self.match(TokenType.RETURNS):
+                self._skip_newline()
+            elif self.match(_TT_RETURNS):
                 returns = self.parse_return_declaration()
-                self.match(TokenType.NEWLINE)
-            elif self.match(TokenType.DECLARE):
-                self.match(TokenType.NEWLINE)
+                self._skip_newline()
+            elif self.match(_TT_DECLARE):
+                self._skip_newline()
                 declarations = self.parse_declarations()
-            elif self.match(TokenType.DO):
-                self.match(TokenType.NEWLINE)
+            elif self.match(_TT_DO):
+                self._skip_newline()
                 body = self.parse_statement_block()
-            elif self.match(TokenType.NOTE):
+            elif self.match(_TT_NOTE):
                 # Skip notes in riser header
-                self.match(TokenType.NEWLINE)
+                self._skip_newline()
             else:
                 self.error(f"Unexpected '{self.current.value}' in riser definition")
                 self.advance()
         
-        self.match(TokenType.DEDENT)
+        self.match(_TT_DEDENT)
         
         return RiserNode(
             location=self.location_from(start),
@@ -521,9 +669,9 @@ class Parser:
         """
         statements: List[StatementNode] = []
 
-        while not self.match(TokenType.EOF):
+        while not self.match(_TT_EOF):
             self.skip_newlines()
-            if self.check(TokenType.EOF):
+            if self.check(_TT_EOF):
                 break
 
             stmt = self.parse_statement()
@@ -536,7 +684,7 @@ class Parser:
         """Parse an indented block of statements (expects INDENT token)."""
         statements: List[StatementNode] = []
 
-        if not self.match(TokenType.INDENT):
+        if not self.match(_TT_INDENT):
             # Block may not be indented if it's empty
             return statements
 
@@ -546,16 +694,16 @@ class Parser:
         """Parse statements until we hit DEDENT (already inside indented block)."""
         statements: List[StatementNode] = []
         
-        while not self.check(TokenType.DEDENT, TokenType.EOF):
+        while not self.check(_TT_DEDENT, _TT_EOF):
             self.skip_newlines()
-            if self.check(TokenType.DEDENT, TokenType.EOF):
+            if self.check(_TT_DEDENT, _TT_EOF):
                 break
             
             stmt = self.parse_statement()
             if stmt:
                 statements.append(stmt)
         
-        self.match(TokenType.DEDENT)
+        self.match(_TT_DEDENT)
         return statements
     
     def parse_statement(self) -> Optional[StatementNode]:
@@ -563,59 +711,59 @@ class Parser:
         # Skip blank lines
         self.skip_newlines()
         
-        if self.check(TokenType.DEDENT, TokenType.EOF):
+        if self.check(_TT_DEDENT, _TT_EOF):
             return None
         
         # display expression
-        if self.match(TokenType.DISPLAY):
+        if self.match(_TT_DISPLAY):
             return self.parse_display()
 
         # indicate expression (display without newline)
-        if self.match(TokenType.INDICATE):
+        if self.match(_TT_INDICATE):
             return self.parse_indicate()
 
         # clear console
-        if self.match(TokenType.CLEAR):
+        if self.match(_TT_CLEAR):
             return self.parse_clear()
 
         # set target to value OR set iteration limit to value
-        if self.match(TokenType.SET):
+        if self.match(_TT_SET):
             return self.parse_set()
         
         # call step_name [with args] [storing result in var]
-        if self.match(TokenType.CALL):
+        if self.match(_TT_CALL):
             return self.parse_call()
         
         # return [value]
-        if self.match(TokenType.RETURN):
+        if self.match(_TT_RETURN):
             return self.parse_return()
         
         # exit
-        if self.match(TokenType.EXIT):
+        if self.match(_TT_EXIT):
             return self.parse_exit()
         
         # if condition
-        if self.match(TokenType.IF):
+        if self.match(_TT_IF):
             return self.parse_if()
         
         # repeat ...
-        if self.match(TokenType.REPEAT):
+        if self.match(_TT_REPEAT):
             return self.parse_repeat()
         
         # attempt:
-        if self.match(TokenType.ATTEMPT):
+        if self.match(_TT_ATTEMPT):
             return self.parse_attempt()
         
         # add item to list
-        if self.match(TokenType.ADD):
+        if self.match(_TT_ADD):
             return self.parse_add_to_list()
         
         # remove item from list
-        if self.match(TokenType.REMOVE):
+        if self.match(_TT_REMOVE):
             return self.parse_remove_from_list()
         
         # note: comment
-        if self.match(TokenType.NOTE):
+        if self.match(_TT_NOTE):
             return self.parse_note()
         
         # Unknown statement
@@ -627,7 +775,7 @@ class Parser:
         """Parse: display expression"""
         start = self.previous
         expr = self.parse_expression()
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
 
         return DisplayStatement(
             location=self.location_from(start),
@@ -639,7 +787,7 @@ class Parser:
         from .ast_nodes import IndicateStatement
         start = self.previous
         expr = self.parse_expression()
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
 
         return IndicateStatement(
             location=self.location_from(start),
@@ -650,8 +798,8 @@ class Parser:
         """Parse: clear console"""
         from .ast_nodes import ClearConsoleStatement
         start = self.previous
-        self.expect(TokenType.CONSOLE, "Expected 'console' after 'clear'")
-        self.match(TokenType.NEWLINE)
+        self.expect(_TT_CONSOLE, "Expected 'console' after 'clear'")
+        self._skip_newline()
 
         return ClearConsoleStatement(
             location=self.location_from(start)
@@ -663,28 +811,28 @@ class Parser:
         start = self.previous
 
         # Check for "set iteration limit to value"
-        if self.check(TokenType.ITERATION):
+        if self.check(_TT_ITERATION):
             self.advance()  # consume 'iteration'
-            self.expect(TokenType.LIMIT, "Expected 'limit' after 'iteration'")
-            self.expect(TokenType.TO, "Expected 'to' after 'limit'")
+            self.expect(_TT_LIMIT, "Expected 'limit' after 'iteration'")
+            self.expect(_TT_TO, "Expected 'to' after 'limit'")
             limit_expr = self.parse_expression()
-            self.match(TokenType.NEWLINE)
+            self._skip_newline()
 
             return SetIterationLimitStatement(
                 location=self.location_from(start),
                 limit=limit_expr
             )
 
-        target_token = self.expect(TokenType.IDENTIFIER, "Expected variable name after 'set'")
+        target_token = self.expect(_TT_IDENTIFIER, "Expected variable name after 'set'")
 
         # Check for bracket notation: set target[index] to value
-        if self.match(TokenType.LBRACKET):
+        if self.match(_TT_LBRACKET):
             index_expr = self.parse_expression()
-            self.expect(TokenType.RBRACKET, "Expected ']' after index")
+            self.expect(_TT_RBRACKET, "Expected ']' after index")
 
-            self.expect(TokenType.TO, "Expected 'to' after ']'")
+            self.expect(_TT_TO, "Expected 'to' after ']'")
             value = self.parse_expression()
-            self.match(TokenType.NEWLINE)
+            self._skip_newline()
 
             return SetIndexStatement(
                 location=self.location_from(start),
@@ -694,9 +842,9 @@ class Parser:
             )
 
         # Normal assignment: set target to value
-        self.expect(TokenType.TO, "Expected 'to' after variable name")
+        self.expect(_TT_TO, "Expected 'to' after variable name")
         value = self.parse_expression()
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
 
         return SetStatement(
             location=self.location_from(start),
@@ -708,22 +856,22 @@ class Parser:
         """Parse: call step_name [with args] [storing result in var]"""
         start = self.previous
         
-        step_token = self.expect(TokenType.IDENTIFIER, "Expected step name after 'call'")
+        step_token = self.expect(_TT_IDENTIFIER, "Expected step name after 'call'")
         step_name = step_token.value
         
         arguments: List[ExpressionNode] = []
         result_target: Optional[str] = None
         
         # with arg1, arg2, ...
-        if self.match(TokenType.WITH):
+        if self.match(_TT_WITH):
             arguments = self.parse_argument_list()
         
         # storing result in var
-        if self.match(TokenType.STORING_RESULT_IN):
-            result_token = self.expect(TokenType.IDENTIFIER, "Expected variable name after 'storing result in'")
+        if self.match(_TT_STORING_RESULT_IN):
+            result_token = self.expect(_TT_IDENTIFIER, "Expected variable name after 'storing result in'")
             result_target = result_token.value
         
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
         
         return CallStatement(
             location=self.location_from(start),
@@ -738,13 +886,13 @@ class Parser:
         
         while True:
             # Stop at keywords that end the argument list
-            if self.check(TokenType.STORING_RESULT_IN, TokenType.NEWLINE, TokenType.EOF):
+            if self.check(_TT_STORING_RESULT_IN, _TT_NEWLINE, _TT_EOF):
                 break
             
             arg = self.parse_expression()
             args.append(arg)
             
-            if not self.match(TokenType.COMMA):
+            if not self.match(_TT_COMMA):
                 break
         
         return args
@@ -754,10 +902,10 @@ class Parser:
         start = self.previous
         
         value: Optional[ExpressionNode] = None
-        if not self.check(TokenType.NEWLINE, TokenType.EOF, TokenType.DEDENT):
+        if not self.check(_TT_NEWLINE, _TT_EOF, _TT_DEDENT):
             value = self.parse_expression()
         
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
         
         return ReturnStatement(
             location=self.location_from(start),
@@ -767,7 +915,7 @@ class Parser:
     def parse_exit(self) -> ExitStatement:
         """Parse: exit"""
         start = self.previous
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
         
         return ExitStatement(location=self.location_from(start))
     
@@ -777,7 +925,7 @@ class Parser:
         
         # Main if branch
         condition = self.parse_expression()
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
         body = self.parse_statement_block()
         
         if_branch = IfBranch(
@@ -788,10 +936,10 @@ class Parser:
         
         # Otherwise if branches
         otherwise_if_branches: List[IfBranch] = []
-        while self.match(TokenType.OTHERWISE_IF):
+        while self.match(_TT_OTHERWISE_IF):
             branch_start = self.previous
             branch_condition = self.parse_expression()
-            self.match(TokenType.NEWLINE)
+            self._skip_newline()
             branch_body = self.parse_statement_block()
             
             otherwise_if_branches.append(IfBranch(
@@ -802,8 +950,8 @@ class Parser:
         
         # Otherwise branch
         otherwise_branch: Optional[List[StatementNode]] = None
-        if self.match(TokenType.OTHERWISE):
-            self.match(TokenType.NEWLINE)
+        if self.match(_TT_OTHERWISE):
+            self._skip_newline()
             otherwise_branch = self.parse_statement_block()
         
         return IfStatement(
@@ -818,11 +966,11 @@ class Parser:
         start = self.previous
         
         # repeat for each item in collection
-        if self.match(TokenType.FOR_EACH):
-            item_token = self.expect(TokenType.IDENTIFIER, "Expected variable name after 'for each'")
-            self.expect(TokenType.IN, "Expected 'in' after loop variable")
+        if self.match(_TT_FOR_EACH):
+            item_token = self.expect(_TT_IDENTIFIER, "Expected variable name after 'for each'")
+            self.expect(_TT_IN, "Expected 'in' after loop variable")
             collection = self.parse_expression()
-            self.match(TokenType.NEWLINE)
+            self._skip_newline()
             body = self.parse_statement_block()
             
             return RepeatForEachStatement(
@@ -833,9 +981,9 @@ class Parser:
             )
         
         # repeat while condition
-        if self.match(TokenType.WHILE):
+        if self.match(_TT_WHILE):
             condition = self.parse_expression()
-            self.match(TokenType.NEWLINE)
+            self._skip_newline()
             body = self.parse_statement_block()
             
             return RepeatWhileStatement(
@@ -846,8 +994,8 @@ class Parser:
         
         # repeat N times
         count = self.parse_expression()
-        self.expect(TokenType.TIMES, "Expected 'times' after count expression")
-        self.match(TokenType.NEWLINE)
+        self.expect(_TT_TIMES, "Expected 'times' after count expression")
+        self._skip_newline()
         body = self.parse_statement_block()
         
         return RepeatTimesStatement(
@@ -859,20 +1007,20 @@ class Parser:
     def parse_attempt(self) -> AttemptStatement:
         """Parse: attempt: ... if unsuccessful: ... then continue: ..."""
         start = self.previous
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
         
         attempt_body = self.parse_statement_block()
         unsuccessful_body: Optional[List[StatementNode]] = None
         continue_body: Optional[List[StatementNode]] = None
         
         # if unsuccessful:
-        if self.match(TokenType.IF_UNSUCCESSFUL):
-            self.match(TokenType.NEWLINE)
+        if self.match(_TT_IF_UNSUCCESSFUL):
+            self._skip_newline()
             unsuccessful_body = self.parse_statement_block()
         
         # then continue:
-        if self.match(TokenType.THEN_CONTINUE):
-            self.match(TokenType.NEWLINE)
+        if self.match(_TT_THEN_CONTINUE):
+            self._skip_newline()
             continue_body = self.parse_statement_block()
         
         return AttemptStatement(
@@ -887,9 +1035,9 @@ class Parser:
         start = self.previous
         
         item = self.parse_expression()
-        self.expect(TokenType.TO, "Expected 'to' after item in 'add' statement")
-        list_token = self.expect(TokenType.IDENTIFIER, "Expected list name after 'to'")
-        self.match(TokenType.NEWLINE)
+        self.expect(_TT_TO, "Expected 'to' after item in 'add' statement")
+        list_token = self.expect(_TT_IDENTIFIER, "Expected list name after 'to'")
+        self._skip_newline()
         
         return AddToListStatement(
             location=self.location_from(start),
@@ -902,9 +1050,9 @@ class Parser:
         start = self.previous
         
         item = self.parse_expression()
-        self.expect(TokenType.FROM, "Expected 'from' after item in 'remove' statement")
-        list_token = self.expect(TokenType.IDENTIFIER, "Expected list name after 'from'")
-        self.match(TokenType.NEWLINE)
+        self.expect(_TT_FROM, "Expected 'from' after item in 'remove' statement")
+        list_token = self.expect(_TT_IDENTIFIER, "Expected list name after 'from'")
+        self._skip_newline()
         
         return RemoveFromListStatement(
             location=self.location_from(start),
@@ -917,7 +1065,7 @@ class Parser:
         start = self.previous
         # The lexer already captured the comment text
         text = start.value
-        self.match(TokenType.NEWLINE)
+        self._skip_newline()
         
         return NoteStatement(
             location=self.location_from(start),
@@ -933,41 +1081,71 @@ class Parser:
         """Parse an expression (entry point)."""
         return self.parse_or_expr()
     
+    def _fold_operands(
+        self,
+        operands: List[ExpressionNode],
+        operators: List[str],
+        op_tokens: List[Token]
+    ) -> ExpressionNode:
+        """Build the node for a left-associative operator chain.
+        
+        A single operand is returned as-is and a single operator becomes a
+        BinaryOpNode; longer chains become one NAryOpNode rather than a
+        nested tree of BinaryOpNodes. op_tokens holds the token of each
+        operator, so errors can point at the one that failed.
+        """
+        if not operators:
+            return operands[0]
+        if len(operators) == 1:
+            return BinaryOpNode(
+                location=self.location_from(op_tokens[0]),
+                left=operands[0],
+                operator=operators[0],
+                right=operands[1]
+            )
+        operator_locations = [self.location_from(tok) for tok in op_tokens]
+        return NAryOpNode(
+            location=operator_locations[0],
+            operands=operands,
+            operators=operators,
+            operator_locations=operator_locations
+        )
+    
     def parse_or_expr(self) -> ExpressionNode:
         """Parse: expr or expr"""
         left = self.parse_and_expr()
-        
-        while self.match(TokenType.OR):
-            op = self.previous
-            right = self.parse_and_expr()
-            left = BinaryOpNode(
-                location=self.location_from(op),
-                left=left,
-                operator="or",
-                right=right
-            )
-        
-        return left
+        if not self.check(_TT_OR):
+            return left
+        
+        operands = [left]
+        operators: List[str] = []
+        op_tokens: List[Token] = []
+        while self.match(_TT_OR):
+            operators.append("or")
+            op_tokens.append(self.previous)
+            operands.append(self.parse_and_expr())
+        
+        return self._fold_operands(operands, operators, op_tokens)
     
     def parse_and_expr(self) -> ExpressionNode:
         """Parse: expr and expr"""
         left = self.parse_not_expr()
-        
-        while self.match(TokenType.AND):
-            op = self.previous
-            right = self.parse_not_expr()
-            left = BinaryOpNode(
-                location=self.location_from(op),
-                left=left,
-                operator="and",
-                right=right
-            )
-        
-        return left
+        if not self.check(_TT_AND):
+            return left
+        
+        operands = [left]
+        operators: List[str] = []
+        op_tokens: List[Token] = []
+        while self.match(_TT_AND):
+            operators.append("and")
+            op_tokens.append(self.previous)
+            operands.append(self.parse_not_expr())
+        
+        return self._fold_operands(operands, operators, op_tokens)
     
     def parse_not_expr(self) -> ExpressionNode:
         """Parse: not expr"""
-        if self.match(TokenType.NOT):
+        if self.match(_TT_NOT):
             op = self.previous
             operand = self.parse_not_expr()
             return UnaryOpNode(
@@ -982,75 +1160,54 @@ class Parser:
         """Parse comparison operators."""
         left = self.parse_addition()
         
-        # Comparison operators
-        comparison_ops = {
-            TokenType.IS_EQUAL_TO: "is equal to",
-            TokenType.IS_NOT_EQUAL_TO: "is not equal to",
-            TokenType.EQUALS: "equals",
-            TokenType.IS_LESS_THAN: "is less than",
-            TokenType.IS_GREATER_THAN: "is greater than",
-            TokenType.IS_LESS_THAN_OR_EQUAL_TO: "is less than or equal to",
-            TokenType.IS_GREATER_THAN_OR_EQUAL_TO: "is greater than or equal to",
-            TokenType.IS_IN: "is in",
-            TokenType.CONTAINS: "contains",
-            TokenType.STARTS_WITH: "starts with",
-            TokenType.ENDS_WITH: "ends with",
-        }
-        
-        for token_type, op_str in comparison_ops.items():
-            if self.match(token_type):
-                op = self.previous
-                right = self.parse_addition()
-                
-                # Special handling for text operations
-                if token_type == TokenType.IS_IN:
-                    return IsInNode(
-                        location=self.location_from(op),
-                        item=left,
-                        collection=right
-                    )
-                elif token_type == TokenType.CONTAINS:
-                    return ContainsNode(
-                        location=self.location_from(op),
-                        text=left,
-                        substring=right
-                    )
-                elif token_type == TokenType.STARTS_WITH:
-                    return StartsWithNode(
-                        location=self.location_from(op),
-                        text=left,
-                        prefix=right
-                    )
-                elif token_type == TokenType.ENDS_WITH:
-                    return EndsWithNode(
-                        location=self.location_from(op),
-                        text=left,
-                        suffix=right
-                    )
-                
-                return BinaryOpNode(
+        token_type = self.tokens[self.pos].type
+        op_str = _COMPARISON_OPS.get(token_type)
+        if op_str is not None:
+            op = self.advance()
+            right = self.parse_addition()
+            
+            # Special handling for text operations
+            if token_type == _TT_IS_IN:
+                return IsInNode(
                     location=self.location_from(op),
-                    left=left,
-                    operator=op_str,
-                    right=right
+                    item=left,
+                    collection=right
                 )
-        # Type check operators (postfix): expr is a number, expr is a text, etc.
-        type_check_ops = {
-            TokenType.IS_A_NUMBER: "number",
-            TokenType.IS_A_TEXT: "text",
-            TokenType.IS_A_BOOLEAN: "boolean",
-            TokenType.IS_A_LIST: "list",
-            TokenType.IS_A_TABLE: "table",
-        }
-        
-        for token_type, type_name in type_check_ops.items():
-            if self.match(token_type):
-                op = self.previous
-                return TypeCheckNode(
+            elif token_type == _TT_CONTAINS:
+                return ContainsNode(
+                    location=self.location_from(op),
+                    text=left,
+                    substring=right
+                )
+            elif token_type == _TT_STARTS_WITH:
+                return StartsWithNode(
+                    location=self.location_from(op),
+                    text=left,
+                    prefix=right
+                )
+            elif token_type == _TT_ENDS_WITH:
+                return EndsWithNode(
                     location=self.location_from(op),
-                    expression=left,
-                    type_name=type_name
+                    text=left,
+                    suffix=right
                 )
+            
+            return BinaryOpNode(
+                location=self.location_from(op),
+                left=left,
+                operator=op_str,
+                right=right
+            )
+        
+        # Type check operators (postfix): expr is a number, expr is a text, etc.
+        type_name = _TYPE_CHECK_OPS.get(token_type)
+        if type_name is not None:
+            op = self.advance()
+            return TypeCheckNode(
+                location=self.location_from(op),
+                expression=left,
+                type_name=type_name
+            )
         
         return left
     
@@ -1058,87 +1215,76 @@ class Parser:
         """Parse: addition and subtraction, text operations."""
         left = self.parse_multiplication()
         
+        # Runs of +/- are collected and folded into a single node; the text
+        # operations close the current run and start a new one.
+        operands = [left]
+        operators: List[str] = []
+        op_tokens: List[Token] = []
+        
         while True:
-            if self.match(TokenType.PLUS):
-                op = self.previous
-                right = self.parse_multiplication()
-                left = BinaryOpNode(
-                    location=self.location_from(op),
-                    left=left,
-                    operator="+",
-                    right=right
-                )
-            elif self.match(TokenType.MINUS):
-                op = self.previous
-                right = self.parse_multiplication()
-                left = BinaryOpNode(
-                    location=self.location_from(op),
-                    left=left,
-                    operator="-",
-                    right=right
-                )
-            elif self.match(TokenType.ADDED_TO):
+            if self.match(_TT_PLUS):
+                operators.append("+")
+                op_tokens.append(self.previous)
+                operands.append(self.parse_multiplication())
+            elif self.match(_TT_MINUS):
+                operators.append("-")
+                op_tokens.append(self.previous)
+                operands.append(self.parse_multiplication())
+            elif self.match(_TT_ADDED_TO):
                 op = self.previous
+                left = self._fold_operands(operands, operators, op_tokens)
                 right = self.parse_multiplication()
                 left = AddedToNode(
                     location=self.location_from(op),
                     left=left,
                     right=right
                 )
-            elif self.match(TokenType.SPLIT_BY):
+                operands = [left]
+                operators = []
+                op_tokens = []
+            elif self.match(_TT_SPLIT_BY):
                 op = self.previous
+                left = self._fold_operands(operands, operators, op_tokens)
                 right = self.parse_multiplication()
                 left = SplitByNode(
                     location=self.location_from(op),
                     text=left,
                     delimiter=right
                 )
+                operands = [left]
+                operators = []
+                op_tokens = []
             else:
                 break
         
-        return left
+        return self._fold_operands(operands, operators, op_tokens)
     
     def parse_multiplication(self) -> ExpressionNode:
         """Parse: multiplication, division, and modulo."""
         left = self.parse_unary()
         
+        operands = [left]
+        operators: List[str] = []
+        op_tokens: List[Token] = []
+        
         while True:
-            if self.match(TokenType.MULTIPLY):
-                op = self.previous
-                right = self.parse_unary()
-                left = BinaryOpNode(
-                    location=self.location_from(op),
-                    left=left,
-                    operator="*",
-                    right=right
-                )
-            elif self.match(TokenType.DIVIDE):
-                op = self.previous
-                right = self.parse_unary()
-                left = BinaryOpNode(
-                    location=self.location_from(op),
-                    left=left,
-                    operator="/",
-                    right=right
-                )
-            elif self.match(TokenType.MODULO):
-                op = self.previous
-                right = self.parse_unary()
-                left = BinaryOpNode(
-                    location=self.location_from(op),
-                    left=left,
-                    operator="modulo",
-                    right=right
-                )
+            if self.match(_TT_MULTIPLY):
+                operators.append("*")
+            elif self.match(_TT_DIVIDE):
+                operators.append("/")
+            elif self.match(_TT_MODULO):
+                operators.append("modulo")
             else:
                 break
+            op_tokens.append(self.previous)
+            operands.append(self.parse_unary())
         
-        return left
+        return self._fold_operands(operands, operators, op_tokens)
     
     def parse_unary(self) -> ExpressionNode:
         """Parse: unary minus, length of, character at."""
         # Unary minus
-        if self.match(TokenType.MINUS):
+        if self.match(_TT_MINUS):
             op = self.previous
             operand = self.parse_unary()
             return UnaryOpNode(
@@ -1148,7 +1294,7 @@ class Parser:
             )
         
         # length of expr
-        if self.match(TokenType.LENGTH_OF):
+        if self.match(_TT_LENGTH_OF):
             op = self.previous
             operand = self.parse_unary()
             return LengthOfNode(
@@ -1157,10 +1303,10 @@ class Parser:
             )
         
         # character at index of text
-        if self.match(TokenType.CHARACTER_AT):
+        if self.match(_TT_CHARACTER_AT):
             op = self.previous
             index = self.parse_primary()
-            self.expect(TokenType.OF, "Expected 'of' after index in 'character at'")
+            self.expect(_TT_OF, "Expected 'of' after index in 'character at'")
             text = self.parse_unary()
             return CharacterAtNode(
                 location=self.location_from(op),
@@ -1169,7 +1315,7 @@ class Parser:
             )
         
         # type of expr
-        if self.match(TokenType.TYPE_OF):
+        if self.match(_TT_TYPE_OF):
             op = self.previous
             operand = self.parse_unary()
             return TypeOfNode(
@@ -1185,29 +1331,29 @@ class Parser:
         
         while True:
             # Table/list access: expr[key]
-            if self.match(TokenType.LBRACKET):
+            if self.match(_TT_LBRACKET):
                 bracket = self.previous
                 key = self.parse_expression()
-                self.expect(TokenType.RBRACKET, "Expected ']' after index")
+                self.expect(_TT_RBRACKET, "Expected ']' after index")
                 expr = TableAccessNode(
                     location=self.location_from(bracket),
                     table=expr,
                     key=key
                 )
             # Type conversion: expr as type or formatting: expr as decimal(N)
-            elif self.match(TokenType.AS):
+            elif self.match(_TT_AS):
                 as_token = self.previous
                 
                 # Check for "decimal" keyword which implies formatting
                 # We need to check if the current token is "decimal" AND the next is "("
-                if (self.check(TokenType.IDENTIFIER) and 
+                if (self.check(_TT_IDENTIFIER) and 
                     self.current.value == "decimal" and 
-                    self.peek().type == TokenType.LPAREN):
+                    self.peek().type == _TT_LPAREN):
                     
                     self.advance() # consume "decimal"
-                    self.expect(TokenType.LPAREN, "Expected '(' after 'decimal'")
+                    self.expect(_TT_LPAREN, "Expected '(' after 'decimal'")
                     places = self.parse_expression()
-                    self.expect(TokenType.RPAREN, "Expected ')' after decimal places")
+                    self.expect(_TT_RPAREN, "Expected ')' after decimal places")
                     
                     expr = FormatNumberNode(
                         location=self.location_from(as_token),
@@ -1231,7 +1377,7 @@ class Parser:
     def parse_primary(self) -> ExpressionNode:
         """Parse: literals, identifiers, parentheses, collections."""
         # Number literal
-        if self.match(TokenType.NUMBER):
+        if self.match(_TT_NUMBER):
             token = self.previous
             return NumberLiteral(
                 location=self.location_from(token),
@@ -1239,7 +1385,7 @@ class Parser:
             )
         
         # Text literal
-        if self.match(TokenType.TEXT):
+        if self.match(_TT_TEXT):
             token = self.previous
             return TextLiteral(
                 location=self.location_from(token),
@@ -1247,42 +1393,42 @@ class Parser:
             )
         
         # Boolean literals
-        if self.match(TokenType.TRUE):
+        if self.match(_TT_TRUE):
             return BooleanLiteral(
                 location=self.location_from(self.previous),
                 value=True
             )
         
-        if self.match(TokenType.FALSE):
+        if self.match(_TT_FALSE):
             return BooleanLiteral(
                 location=self.location_from(self.previous),
                 value=False
             )
         
         # Nothing literal
-        if self.match(TokenType.NOTHING):
+        if self.match(_TT_NOTHING):
             return NothingLiteral(
                 location=self.location_from(self.previous)
             )
         
         # Input expression
-        if self.match(TokenType.INPUT):
+        if self.match(_TT_INPUT):
             return InputNode(
                 location=self.location_from(self.previous)
             )
         
         # List or table literal: [...]
-        if self.match(TokenType.LBRACKET):
+        if self.match(_TT_LBRACKET):
             return self.parse_list_or_table()
         
         # Parenthesized expression
-        if self.match(TokenType.LPAREN):
+        if self.match(_TT_LPAREN):
             expr = self.parse_expression()
-            self.expect(TokenType.RPAREN, "Expected ')' after expression")
+            self.expect(_TT_RPAREN, "Expected ')' after expression")
             return expr
         
         # Identifier
-        if self.match(TokenType.IDENTIFIER):
+        if self.match(_TT_IDENTIFIER):
             token = self.previous
             return IdentifierNode(
                 location=self.location_from(token),
@@ -1299,15 +1445,15 @@ class Parser:
         start = self.previous  # Already consumed [
         
         # Empty list
-        if self.match(TokenType.RBRACKET):
+        if self.match(_TT_RBRACKET):
             return ListLiteral(
                 location=self.location_from(start),
                 elements=[]
             )
         
         # Empty table: [ : ]
-        if self.match(TokenType.COLON):
-            self.expect(TokenType.RBRACKET, "Expected ']' after empty table")
+        if self.match(_TT_COLON):
+            self.expect(_TT_RBRACKET, "Expected ']' after empty table")
             return TableLiteral(
                 location=self.location_from(start),
                 pairs=[]
@@ -1315,36 +1461,50 @@ class Parser:
         
         # Parse first element
         first_expr = self.parse_expression()
+        count = self._count_literal_items()
         
         # Check if it's a table (key: value)
-        if self.match(TokenType.COLON):
+        if self.match(_TT_COLON):
             # It's a table
             first_value = self.parse_expression()
-            pairs: List[Tuple[ExpressionNode, ExpressionNode]] = [(first_expr, first_value)]
+            pairs: List[Tuple[ExpressionNode, ExpressionNode]] = [(first_expr, first_value)] * count
+            filled = 1
             
-            while self.match(TokenType.COMMA):
-                if self.check(TokenType.RBRACKET):
+            while self.match(_TT_COMMA):
+                if self.check(_TT_RBRACKET):
                     break
                 key = self.parse_expression()
-                self.expect(TokenType.COLON, "Expected ':' after table key")
+                self.expect(_TT_COLON, "Expected ':' after table key")
                 value = self.parse_expression()
-                pairs.append((key, value))
+                if filled < count:
+                    pairs[filled] = (key, value)
+                else:
+                    pairs.append((key, value))
+                filled += 1
+            del pairs[filled:]
             
-            self.expect(TokenType.RBRACKET, "Expected ']' after table")
+            self.expect(_TT_RBRACKET, "Expected ']' after table")
             return TableLiteral(
                 location=self.location_from(start),
                 pairs=pairs
             )
         
         # It's a list
-        elements: List[ExpressionNode] = [first_expr]
+        elements: List[ExpressionNode] = [first_expr] * count
+        filled = 1
         
-        while self.match(TokenType.COMMA):
-            if self.check(TokenType.RBRACKET):
+        while self.match(_TT_COMMA):
+            if self.check(_TT_RBRACKET):
                 break
-            elements.append(self.parse_expression())
+            element = self.parse_expression()
+            if filled < count:
+                elements[filled] = element
+            else:
+                elements.append(element)
+            filled += 1
+        del elements[filled:]
         
-        self.expect(TokenType.RBRACKET, "Expected ']' after list")
+        self.expect(_TT_RBRACKET, "Expected ']' after list")
         return ListLiteral(
             location=self.location_from(start),
             elements=elements
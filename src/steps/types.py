@@ -9,37 +9,53 @@ This module implements the runtime value types for the Steps language:
 - StepsNothing: Represents the absence of a value
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Optional, Union
-from abc import ABC, abstractmethod
+from io import StringIO
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Set, Union
 
 
-class StepsValue(ABC):
+class StepsValue:
     """Base class for all Steps runtime values.
     
     All Steps values must implement methods for type conversion,
     truthiness, and string representation.
+    
+    The concrete value classes are plain ``__slots__`` classes rather than
+    dataclasses: they are created for nearly every expression evaluated, so
+    they skip the per-instance ``__dict__``. Each defines its own ``__eq__``
+    that compares its fields directly and only matches values of the same
+    type. Lists and tables are mutable and so are not hashable.
+    
+    This is a plain class rather than an ABC, so isinstance() checks against
+    the value types stay on the fast built-in path.
     """
+    __slots__ = ()
     
-    @abstractmethod
     def python_value(self) -> Any:
         """Return the underlying Python value."""
-        pass
+        raise NotImplementedError
+    
+    # The Steps type name, set by each concrete class
+    TYPE_NAME: ClassVar[str]
     
-    @abstractmethod
     def type_name(self) -> str:
         """Return the Steps type name."""
-        pass
+        return self.TYPE_NAME
     
-    @abstractmethod
     def is_truthy(self) -> bool:
         """Return whether this value is truthy in boolean context."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def display_string(self) -> str:
         """Return string representation for display."""
-        pass
+        raise NotImplementedError
+    
+    def _write_display(self, buf: StringIO) -> None:
+        """Write display_string() to buf.
+        
+        Containers override this so nested values are written straight into
+        one buffer instead of building a string per level.
+        """
+        buf.write(self.display_string())
     
     def as_number(self) -> "StepsNumber":
         """Convert this value to a StepsNumber.
@@ -55,39 +71,71 @@ class StepsValue(ABC):
     
     def as_boolean(self) -> "StepsBoolean":
         """Convert this value to a StepsBoolean."""
-        return StepsBoolean(self.is_truthy())
+        return _TRUE if self.is_truthy() else _FALSE
+    
+
+class StepsNumber(StepsValue):
+    """Numeric value (integer or decimal)."""
+    __slots__ = ("value", "_hash")
+    TYPE_NAME = "number"
+    
+    def __init__(self, value: float) -> None:
+        self.value = value
+        self._hash = -1  # hash(value), filled in on first use
+    
+    def __repr__(self) -> str:
+        return f"StepsNumber(value={self.value!r})"
     
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, StepsValue):
+        if self is other:
+            return True
+        if type(self) is not type(other):
             return False
-        return bool(self.python_value() == other.python_value())
+        # Differing cached hashes settle it without comparing the values
+        h, other_h = self._hash, other._hash
+        if h != -1 and other_h != -1 and h != other_h:
+            return False
+        return self.value == other.value
     
     def __hash__(self) -> int:
-        val = self.python_value()
-        if isinstance(val, (list, dict)):
-            return id(self)  # Mutable types use identity
-        return hash(val)
-
-
-@dataclass
-class StepsNumber(StepsValue):
-    """Numeric value (integer or decimal)."""
-    value: float
+        h = self._hash
+        if h == -1:
+            h = self._hash = hash(self.value)
+        return h
+    
+    @staticmethod
+    def of(value: float) -> "StepsNumber":
+        """Return a StepsNumber for value, sharing one instance per small whole number.
+        
+        Whole numbers from -5 to 256 come from a prebuilt cache, so loop
+        counters and the results of everyday arithmetic don't allocate.
+        """
+        if -5 <= value <= 256:
+            whole = int(value)
+            if whole == value:
+                return _INT_CACHE[whole + 5]
+        return StepsNumber._from_float_unchecked(value)
+    
+    @staticmethod
+    def _from_float_unchecked(value: float) -> "StepsNumber":
+        """Build a StepsNumber by filling in the slots, skipping __init__."""
+        obj = object.__new__(StepsNumber)
+        obj.value = value
+        obj._hash = -1
+        return obj
     
     def python_value(self) -> float:
         return self.value
     
-    def type_name(self) -> str:
-        return "number"
-    
     def is_truthy(self) -> bool:
         return self.value != 0
     
     def display_string(self) -> str:
         # Display integers without decimal point
-        if self.value == int(self.value):
-            return str(int(self.value))
-        return str(self.value)
+        v = self.value
+        if type(v) is float:
+            return str(int(v)) if v.is_integer() else str(v)
+        return str(int(v))
     
     def as_number(self) -> "StepsNumber":
         return self
@@ -95,33 +143,33 @@ class StepsNumber(StepsValue):
     # Arithmetic operations
     def __add__(self, other: "StepsNumber") -> "StepsNumber":
         if isinstance(other, StepsNumber):
-            return StepsNumber(self.value + other.value)
+            return StepsNumber.of(self.value + other.value)
         return NotImplemented
     
     def __sub__(self, other: "StepsNumber") -> "StepsNumber":
         if isinstance(other, StepsNumber):
-            return StepsNumber(self.value - other.value)
+            return StepsNumber.of(self.value - other.value)
         return NotImplemented
     
     def __mul__(self, other: "StepsNumber") -> "StepsNumber":
         if isinstance(other, StepsNumber):
-            return StepsNumber(self.value * other.value)
+            return StepsNumber.of(self.value * other.value)
         return NotImplemented
     
     def __truediv__(self, other: "StepsNumber") -> "StepsNumber":
         if isinstance(other, StepsNumber):
             if other.value == 0:
                 raise ZeroDivisionError("Cannot divide by zero")
-            return StepsNumber(self.value / other.value)
+            return StepsNumber.of(self.value / other.value)
         return NotImplemented
     
     def __mod__(self, other: "StepsNumber") -> "StepsNumber":
         if isinstance(other, StepsNumber):
-            return StepsNumber(self.value % other.value)
+            return StepsNumber.of(self.value % other.value)
         return NotImplemented
 
     def __neg__(self) -> "StepsNumber":
-        return StepsNumber(-self.value)
+        return StepsNumber.of(-self.value)
 
     # Comparison operations
     def __lt__(self, other: "StepsNumber") -> bool:
@@ -145,17 +193,54 @@ class StepsNumber(StepsValue):
         return NotImplemented
 
 
-@dataclass
 class StepsText(StepsValue):
     """String value."""
-    value: str
+    __slots__ = ("value", "_hash")
+    TYPE_NAME = "text"
+    
+    def __init__(self, value: str) -> None:
+        self.value = value
+        self._hash = -1  # hash(value), filled in on first use
+    
+    def __repr__(self) -> str:
+        return f"StepsText(value={self.value!r})"
+    
+    @staticmethod
+    def _from_str_unchecked(value: str) -> "StepsText":
+        """Build a StepsText by filling in the slots, skipping __init__."""
+        obj = object.__new__(StepsText)
+        obj.value = value
+        obj._hash = -1
+        return obj
+    
+    @staticmethod
+    def list_of(strings: Iterable[str]) -> "StepsList":
+        """Build a StepsList holding each string as text."""
+        make = StepsText._from_str_unchecked
+        result = StepsList([make(string) for string in strings])
+        result._scalars_only = True
+        return result
+    
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return False
+        # Differing cached hashes settle it without comparing the values
+        h, other_h = self._hash, other._hash
+        if h != -1 and other_h != -1 and h != other_h:
+            return False
+        return self.value == other.value
+    
+    def __hash__(self) -> int:
+        h = self._hash
+        if h == -1:
+            h = self._hash = hash(self.value)
+        return h
     
     def python_value(self) -> str:
         return self.value
     
-    def type_name(self) -> str:
-        return "text"
-    
     def is_truthy(self) -> bool:
         return len(self.value) > 0
     
@@ -176,10 +261,14 @@ class StepsText(StepsValue):
         """Concatenate with another text value."""
         return StepsText(self.value + other.value)
     
+    @staticmethod
+    def concat_many(parts: List["StepsText"]) -> "StepsText":
+        """Concatenate several text values with a single join."""
+        return StepsText("".join([part.value for part in parts]))
+    
     def split_by(self, delimiter: str) -> "StepsList":
         """Split text by delimiter."""
-        parts = self.value.split(delimiter)
-        return StepsList([StepsText(part) for part in parts])
+        return StepsText.list_of(self.value.split(delimiter))
     
     def character_at(self, index: int) -> "StepsText":
         """Get character at index."""
@@ -193,28 +282,58 @@ class StepsText(StepsValue):
     
     def contains(self, substring: str) -> "StepsBoolean":
         """Check if text contains substring."""
-        return StepsBoolean(substring in self.value)
+        return _TRUE if substring in self.value else _FALSE
     
     def starts_with(self, prefix: str) -> "StepsBoolean":
         """Check if text starts with prefix."""
-        return StepsBoolean(self.value.startswith(prefix))
+        return _TRUE if self.value.startswith(prefix) else _FALSE
     
     def ends_with(self, suffix: str) -> "StepsBoolean":
         """Check if text ends with suffix."""
-        return StepsBoolean(self.value.endswith(suffix))
+        return _TRUE if self.value.endswith(suffix) else _FALSE
 
 
-@dataclass
 class StepsBoolean(StepsValue):
-    """Boolean value (true or false)."""
+    """Boolean value (true or false).
+    
+    There are exactly two instances: StepsBoolean(x) returns the shared
+    true or false value instead of allocating a new one.
+    """
+    __slots__ = ("value", "_hash")
+    TYPE_NAME = "boolean"
+    
     value: bool
+    _hash: int
+    
+    def __new__(cls, value: bool) -> "StepsBoolean":
+        return _TRUE if value else _FALSE
+    
+    def __reduce__(self) -> Any:
+        return (StepsBoolean, (self.value,))
+    
+    def __repr__(self) -> str:
+        return f"StepsBoolean(value={self.value!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return False
+        # Differing cached hashes settle it without comparing the values
+        h, other_h = self._hash, other._hash
+        if h != -1 and other_h != -1 and h != other_h:
+            return False
+        return self.value == other.value
+    
+    def __hash__(self) -> int:
+        h = self._hash
+        if h == -1:
+            h = self._hash = hash(self.value)
+        return h
     
     def python_value(self) -> bool:
         return self.value
     
-    def type_name(self) -> str:
-        return "boolean"
-    
     def is_truthy(self) -> bool:
         return self.value
     
@@ -222,7 +341,7 @@ class StepsBoolean(StepsValue):
         return "true" if self.value else "false"
     
     def as_number(self) -> StepsNumber:
-        return StepsNumber(1.0 if self.value else 0.0)
+        return _INT_CACHE[6] if self.value else _INT_CACHE[5]
     
     def as_boolean(self) -> "StepsBoolean":
         return self
@@ -230,35 +349,73 @@ class StepsBoolean(StepsValue):
     # Boolean operations
     def __and__(self, other: "StepsBoolean") -> "StepsBoolean":
         if isinstance(other, StepsBoolean):
-            return StepsBoolean(self.value and other.value)
+            return _TRUE if self.value and other.value else _FALSE
         return NotImplemented
     
     def __or__(self, other: "StepsBoolean") -> "StepsBoolean":
         if isinstance(other, StepsBoolean):
-            return StepsBoolean(self.value or other.value)
+            return _TRUE if self.value or other.value else _FALSE
         return NotImplemented
     
     def __invert__(self) -> "StepsBoolean":
-        return StepsBoolean(not self.value)
+        return _FALSE if self.value else _TRUE
 
 
-@dataclass
 class StepsList(StepsValue):
     """Ordered collection of values."""
-    elements: List[StepsValue] = field(default_factory=list)
+    __slots__ = ("elements", "_scalars_only", "_contains_index", "_contains_calls")
+    TYPE_NAME = "list"
+    
+    def __init__(self, elements: Optional[List[StepsValue]] = None) -> None:
+        self.elements = [] if elements is None else elements
+        # Whether every element is a number, text or boolean (whose .value is
+        # already its Python value). Worked out on first use, then kept up to
+        # date by add() and set().
+        self._scalars_only: Optional[bool] = None
+        # Hash set of the elements for repeated contains() calls on lists of
+        # scalars; built lazily and dropped whenever the list changes.
+        self._contains_index: Optional[Set[StepsValue]] = None
+        self._contains_calls = 0
+    
+    def __repr__(self) -> str:
+        return f"StepsList(elements={self.elements!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        return type(self) is type(other) and self.elements == other.elements
+    
+    def _is_scalars_only(self) -> bool:
+        scalars_only = self._scalars_only
+        if scalars_only is None:
+            scalars_only = self._scalars_only = all(
+                type(elem) in _SCALAR_TYPES for elem in self.elements
+            )
+        return scalars_only
     
     def python_value(self) -> List[Any]:
+        if self._is_scalars_only():
+            return [elem.value for elem in self.elements]  # type: ignore[attr-defined]
         return [elem.python_value() for elem in self.elements]
     
-    def type_name(self) -> str:
-        return "list"
-    
     def is_truthy(self) -> bool:
         return len(self.elements) > 0
     
     def display_string(self) -> str:
-        items = ", ".join(elem.display_string() for elem in self.elements)
-        return f"[{items}]"
+        buf = StringIO()
+        self._write_display(buf)
+        return buf.getvalue()
+    
+    def _write_display(self, buf: StringIO) -> None:
+        write = buf.write
+        write("[")
+        first = True
+        for elem in self.elements:
+            if not first:
+                write(", ")
+            first = False
+            elem._write_display(buf)
+        write("]")
     
     def length(self) -> int:
         """Get list length."""
@@ -272,45 +429,90 @@ class StepsList(StepsValue):
             )
         return self.elements[index]
     
+    def set(self, index: int, item: StepsValue) -> None:
+        """Replace the element at index."""
+        if index < 0 or index >= len(self.elements):
+            raise IndexError(
+                f"Index {index} out of bounds for list of length {len(self.elements)}"
+            )
+        self.elements[index] = item
+        self._contains_index = None
+        if self._scalars_only:
+            self._scalars_only = type(item) in _SCALAR_TYPES
+    
     def add(self, item: StepsValue) -> None:
         """Add item to end of list."""
         self.elements.append(item)
+        self._contains_index = None
+        if self._scalars_only:
+            self._scalars_only = type(item) in _SCALAR_TYPES
     
     def remove(self, item: StepsValue) -> bool:
         """Remove first occurrence of item. Returns True if found."""
         for i, elem in enumerate(self.elements):
             if elem == item:
                 del self.elements[i]
+                self._contains_index = None
                 return True
         return False
     
     def contains(self, item: StepsValue) -> StepsBoolean:
         """Check if item is in list."""
-        return StepsBoolean(item in self.elements)
+        index = self._contains_index
+        if index is None:
+            self._contains_calls += 1
+            if self._contains_calls <= _CONTAINS_INDEX_AFTER or not self._is_scalars_only():
+                return _TRUE if item in self.elements else _FALSE
+            index = self._contains_index = set(self.elements)
+        if type(item) not in _SCALAR_TYPES:
+            # Only scalars are indexed, and a scalar never equals anything else
+            return _FALSE
+        return _TRUE if item in index else _FALSE
     
     def __iter__(self) -> Iterator[StepsValue]:
         return iter(self.elements)
 
 
-@dataclass
 class StepsTable(StepsValue):
     """Key-value mapping."""
-    pairs: Dict[str, StepsValue] = field(default_factory=dict)
+    __slots__ = ("pairs", "_key_texts")
+    TYPE_NAME = "table"
+    
+    def __init__(self, pairs: Optional[Dict[str, StepsValue]] = None) -> None:
+        self.pairs = {} if pairs is None else pairs
+        # The keys as StepsText, built by keys() and dropped when a key is added
+        self._key_texts: Optional[List[StepsValue]] = None
+    
+    def __repr__(self) -> str:
+        return f"StepsTable(pairs={self.pairs!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        return type(self) is type(other) and self.pairs == other.pairs
     
     def python_value(self) -> Dict[str, Any]:
         return {k: v.python_value() for k, v in self.pairs.items()}
     
-    def type_name(self) -> str:
-        return "table"
-    
     def is_truthy(self) -> bool:
         return len(self.pairs) > 0
     
     def display_string(self) -> str:
-        items = ", ".join(
-            f'"{k}": {v.display_string()}' for k, v in self.pairs.items()
-        )
-        return f"[{items}]"
+        buf = StringIO()
+        self._write_display(buf)
+        return buf.getvalue()
+    
+    def _write_display(self, buf: StringIO) -> None:
+        write = buf.write
+        write("[")
+        first = True
+        for k, v in self.pairs.items():
+            if not first:
+                write(", ")
+            first = False
+            write(f'"{k}": ')
+            v._write_display(buf)
+        write("]")
     
     def length(self) -> int:
         """Get number of key-value pairs."""
@@ -318,34 +520,58 @@ class StepsTable(StepsValue):
     
     def get(self, key: str) -> StepsValue:
         """Get value for key."""
-        if key not in self.pairs:
+        try:
+            return self.pairs[key]
+        except KeyError:
             available = ", ".join(f'"{k}"' for k in self.pairs.keys())
-            raise KeyError(f'Key "{key}" not found. Available keys: {available}')
-        return self.pairs[key]
+            raise KeyError(f'Key "{key}" not found. Available keys: {available}') from None
     
     def set(self, key: str, value: StepsValue) -> None:
         """Set value for key."""
+        if key not in self.pairs:
+            self._key_texts = None
         self.pairs[key] = value
     
     def has_key(self, key: str) -> StepsBoolean:
         """Check if key exists."""
-        return StepsBoolean(key in self.pairs)
+        return _TRUE if key in self.pairs else _FALSE
     
     def keys(self) -> "StepsList":
         """Get list of keys."""
-        return StepsList([StepsText(k) for k in self.pairs.keys()])
+        key_texts = self._key_texts
+        if key_texts is None:
+            key_texts = self._key_texts = [StepsText(k) for k in self.pairs]
+        # The texts are shared but the list is not, since callers may change it
+        return StepsList(key_texts.copy())
 
 
-@dataclass
 class StepsNothing(StepsValue):
-    """Represents 'nothing' - the absence of a value."""
+    """Represents 'nothing' - the absence of a value.
+    
+    Nothing carries no state, so StepsNothing() always returns the same
+    shared instance.
+    """
+    __slots__ = ()
+    TYPE_NAME = "nothing"
+    
+    def __new__(cls) -> "StepsNothing":
+        return _NOTHING
+    
+    def __reduce__(self) -> Any:
+        return (StepsNothing, ())
+    
+    def __repr__(self) -> str:
+        return "StepsNothing()"
+    
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+    
+    def __hash__(self) -> int:
+        return hash(None)
     
     def python_value(self) -> None:
         return None
     
-    def type_name(self) -> str:
-        return "nothing"
-    
     def is_truthy(self) -> bool:
         return False
     
@@ -356,7 +582,31 @@ class StepsNothing(StepsValue):
         raise ValueError("Cannot convert nothing to number")
     
     def as_boolean(self) -> StepsBoolean:
-        return StepsBoolean(False)
+        return _FALSE
+
+
+# =============================================================================
+# Shared Instances
+# =============================================================================
+
+# Booleans, nothing and small whole numbers are immutable, so a single
+# instance of each is shared by every use instead of allocating new ones.
+_TRUE = object.__new__(StepsBoolean)
+_TRUE.value = True
+_TRUE._hash = -1
+_FALSE = object.__new__(StepsBoolean)
+_FALSE.value = False
+_FALSE._hash = -1
+_NOTHING = object.__new__(StepsNothing)
+
+# StepsNumber.of() serves whole numbers from -5 to 256 from here
+_INT_CACHE = [StepsNumber(float(i)) for i in range(-5, 257)]
+
+# Types whose .value is the same as their python_value()
+_SCALAR_TYPES = (StepsNumber, StepsText, StepsBoolean)
+
+# StepsList.contains() scans linearly this many times before building an index
+_CONTAINS_INDEX_AFTER = 4
 
 
 # Type aliases for convenience
@@ -375,29 +625,65 @@ def make_value(python_value: Any) -> StepsValue:
     Raises:
         TypeError: If the Python value type is not supported
     """
-    if python_value is None:
-        return StepsNothing()
-    elif isinstance(python_value, bool):  # Check before int (bool is subclass of int)
-        return StepsBoolean(python_value)
+    convert = _MAKE_DISPATCH.get(type(python_value))
+    if convert is not None:
+        return convert(python_value)
+    
+    # Subclasses of the built-in types (and StepsValue subclasses) end up here
+    if isinstance(python_value, bool):  # Check before int (bool is subclass of int)
+        return _TRUE if python_value else _FALSE
     elif isinstance(python_value, (int, float)):
-        return StepsNumber(float(python_value))
+        return StepsNumber.of(float(python_value))
     elif isinstance(python_value, str):
-        return StepsText(python_value)
+        return StepsText(str(python_value))
     elif isinstance(python_value, list):
-        return StepsList([make_value(item) for item in python_value])
+        return _make_list(python_value)
     elif isinstance(python_value, dict):
-        return StepsTable({str(k): make_value(v) for k, v in python_value.items()})
+        return _make_table(python_value)
     elif isinstance(python_value, StepsValue):
         return python_value
     else:
         raise TypeError(f"Cannot convert {type(python_value).__name__} to Steps value")
 
 
+def _make_list(items: List[Any]) -> StepsList:
+    # Plain numeric lists skip the per-item trip back through make_value
+    if all(type(item) is float or type(item) is int for item in items):
+        return StepsList([StepsNumber.of(float(item)) for item in items])
+    return StepsList([make_value(item) for item in items])
+
+
+def _make_table(pairs: Dict[Any, Any]) -> StepsTable:
+    return StepsTable({str(k): make_value(v) for k, v in pairs.items()})
+
+
+def _same_value(value: StepsValue) -> StepsValue:
+    return value
+
+
+# make_value() converters keyed by exact Python type
+_MAKE_DISPATCH: Dict[type, Callable[[Any], StepsValue]] = {
+    type(None): lambda v: _NOTHING,
+    bool: lambda v: _TRUE if v else _FALSE,
+    int: lambda v: StepsNumber.of(float(v)),
+    float: StepsNumber.of,
+    str: StepsText,
+    list: _make_list,
+    dict: _make_table,
+    StepsNumber: _same_value,
+    StepsText: _same_value,
+    StepsBoolean: _same_value,
+    StepsList: _same_value,
+    StepsTable: _same_value,
+    StepsNothing: _same_value,
+}
+
+
 def get_type_name(value: StepsValue) -> str:
     """Get the Steps type name for a value."""
-    return value.type_name()
+    return type(value).TYPE_NAME
 
 
 def is_same_type(a: StepsValue, b: StepsValue) -> bool:
     """Check if two values have the same Steps type."""
-    return a.type_name() == b.type_name()
+    return type(a) is type(b)
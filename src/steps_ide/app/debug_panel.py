@@ -29,6 +29,11 @@ class DebugPanel(QWidget):
     # Signal for when user clicks a stack frame
     frame_selected = pyqtSignal(str, int)  # file, line
     
+    # Shared by every debug button. The font is created on first use since a
+    # QFont needs the QApplication to exist.
+    _button_font = None
+    _button_styles = {}  # color -> stylesheet
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
@@ -99,11 +104,16 @@ class DebugPanel(QWidget):
         btn.setText(text)
         btn.setToolTip(tooltip)
         btn.setMinimumSize(32, 32)
-        btn.setFont(QFont("", 14))
+        if DebugPanel._button_font is None:
+            DebugPanel._button_font = QFont("", 14)
+        btn.setFont(DebugPanel._button_font)
         
         # Only set the text color, let the theme handle background
         if color:
-            btn.setStyleSheet(f"QToolButton {{ color: {color}; }}")
+            style = DebugPanel._button_styles.get(color)
+            if style is None:
+                style = DebugPanel._button_styles[color] = f"QToolButton {{ color: {color}; }}"
+            btn.setStyleSheet(style)
         
         return btn
     
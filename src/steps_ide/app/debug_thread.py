@@ -4,26 +4,51 @@ Runs the Steps debugger in a separate thread to keep the UI responsive.
 Handles communication between the UI (Main Window) and the DebugInterpreter.
 """
 
+from collections import deque
+import gc
 from pathlib import Path
 import threading
+import time
 from typing import Optional, Dict, Set
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
 
 from steps.debug_state import DebugEvent, DebugMode
-from steps.debugger import DebugInterpreter
+from steps.debugger import DebugInterpreter, DebuggerStopped
 from steps.environment import Environment
 from steps.loader import load_project
 from steps.ast_nodes import BuildingNode
 from steps.errors import StepsError
+from steps_ide.app.paths import realpath
+
+# Buffered program output is sent to the UI once this many writes have
+# collected or this many seconds have passed since the last send
+_OUTPUT_FLUSH_COUNT = 64
+_OUTPUT_FLUSH_INTERVAL = 0.033
+
+# Debug events of these types are sent in batches of up to this many; any
+# other event (a pause, an error, the end of the run) sends the batch at once
+_BATCHED_EVENT_TYPES = frozenset(("call", "return"))
+_EVENT_BATCH_SIZE = 16
 
 
 class DebugThread(QThread):
-    """Background thread for running the debugger."""
+    """Background thread for running the debugger.
     
-    # Signals
-    debug_event = pyqtSignal(object)  # Emits DebugEvent
+    The public control methods are called from the UI thread. They read
+    self._debugger once into a local, since run() clears it when the program
+    ends, and they never touch breakpoint or output state directly: those
+    go through the command queue and the output buffer, both owned by the
+    debug thread. Nothing here relies on the GIL to serialize the two threads.
+    """
+    
+    # Signals. All four are emitted only from run() on the debug thread;
+    # connect them with Qt.ConnectionType.QueuedConnection. Control from the
+    # UI goes through the plain methods below, not through signals.
+    debug_event = pyqtSignal(list)  # Emits a batch of DebugEvents, oldest first
     finished_signal = pyqtSignal(bool, str)  # success, error_message
-    output_signal = pyqtSignal(str)  # Emits output text
+    # Declared as object so the queued hand-off passes the Python str
+    # through as-is, with no QString conversion on either side
+    output_signal = pyqtSignal(object)  # Emits output text (str)
     input_request_signal = pyqtSignal(str)  # Emits prompt text
     
     def __init__(self, filepath: str, breakpoints: Dict[str, Set[int]], parent=None):
@@ -36,11 +61,39 @@ class DebugThread(QThread):
         """
         super().__init__(parent)
         self.filepath = Path(filepath)
-        self.initial_breakpoints = breakpoints
         self._debugger: Optional[DebugInterpreter] = None
         self._is_running = False
-        self._input_event = threading.Event() # Added for input handling
-        self._input_response = "" # Added for input handling
+        self._stop_requested = False
+        # Whether the UI is showing the debug details, and so wants call and
+        # return events while the program runs to a breakpoint
+        self._ui_wants_details = False
+        # Input handshake: _handle_input waits on the condition until
+        # provide_input (or stop) sets _input_ready
+        self._input_cond = threading.Condition()
+        self._input_ready = False
+        self._input_response = ""
+        # Breakpoint changes from the UI thread, applied by the debug thread
+        # before each statement so the UI never touches the live debugger
+        self._cmd_queue: deque = deque()
+        # Program output is collected here and sent to the UI in batches.
+        # Only the debug thread touches it.
+        self._out_buf: list = []
+        self._out_last_flush = 0.0
+        # Debug events waiting to be sent to the UI as one batch
+        self._evt_buf: list = []
+        # Resolved Path objects for file path strings seen by the breakpoint
+        # methods, matching the resolved paths the loader gives the program
+        self._path_cache: Dict[str, Path] = {}
+        # Breakpoint lines currently set in the debugger, per file, kept by
+        # the debug thread so updates only touch the lines that changed
+        self._active_bps: Dict[Path, Set[int]] = {}
+        # Copied out of the caller's dict now, flattened to (path, line)
+        # pairs, so later edits on the UI side can't race with run()
+        self._initial_bps = tuple(
+            (self._path(path_str), line)
+            for path_str, lines in breakpoints.items()
+            for line in lines
+        )
         
     def run(self):
         """Execute the program with debugging."""
@@ -53,115 +106,213 @@ class DebugThread(QThread):
             building, env, errors = load_project(project_dir)
             
             if errors:
-                error_msg = "\n".join(str(e) for e in errors)
-                raise StepsError(f"Project load failed:\n{error_msg}")
+                error_msg = "\n".join([str(e) for e in errors])
+                raise StepsError("Project load failed:\n" + error_msg)
             
             if not building:
                 raise StepsError("No building definition found in project.")
 
             # 2. Environment is already setup by load_project
             # Redirect output and input
-            env.output_handler = self.output_signal.emit
+            env.output_handler = self._buffered_output
             env.input_handler = self._handle_input # Added for input handling
             
             # 3. Setup Debugger
+            # Bound once here so the callback, which can run for every
+            # statement, doesn't look them up through self each time
+            events = self._evt_buf
+            emit_events = self.debug_event.emit
+            flush_output = self._flush_output
+            
             def on_event(event: DebugEvent):
-                # This callback runs in the debug thread
-                self.debug_event.emit(event)
+                # This callback runs in the debug thread. Call/return events
+                # are batched; anything that stops the program sends the
+                # batch straight away.
+                events.append(event)
+                if (event.event_type not in _BATCHED_EVENT_TYPES
+                        or len(events) >= _EVENT_BATCH_SIZE):
+                    flush_output()
+                    emit_events(events.copy())
+                    events.clear()
             
-            self._debugger = DebugInterpreter(env, on_event)
+            debugger = DebugInterpreter(env, on_event)
+            debugger.set_safe_point_hook(self._safe_point)
+            debugger.set_call_events_while_running(self._ui_wants_details)
             
             # 4. Set Initial Breakpoints
-            for path_str, lines in self.initial_breakpoints.items():
-                path = Path(path_str)
-                for line in lines:
-                    self._debugger.add_breakpoint(path, line)
+            add_breakpoint = debugger.add_breakpoint
+            active_bps = self._active_bps
+            for path, line in self._initial_bps:
+                add_breakpoint(path, line)
+                active_bps.setdefault(path, set()).add(line)
             
             # 5. Start Execution
             # Start in STEP_INTO mode to pause at start, or RUN to run to first breakpoint
             # Thonny usually pauses at start. Let's start with STEP_INTO so user sees entry.
-            self._debugger.set_mode(DebugMode.STEP_INTO)
+            debugger.set_mode(DebugMode.STEP_INTO)
             
-            result = self._debugger.run_building(building)
+            # Only hand the debugger to the UI-facing methods once it is
+            # fully set up
+            self._debugger = debugger
+            result = debugger.run_building(building)
             
-            self.finished_signal.emit(result.success, str(result.error) if result.error else "")
+            err_text = "" if result.error is None else str(result.error)
+            self._flush_output()
+            self.finished_signal.emit(result.success, err_text)
             
         except Exception as e:
+            self._flush_output()
             self.finished_signal.emit(False, str(e))
         finally:
             self._is_running = False
+            # Breakpoint changes that arrived after the last statement have
+            # nothing left to apply to
+            self._cmd_queue.clear()
+            self._evt_buf.clear()
             self._debugger = None
+            # Drop the program's AST and runtime state now rather than when
+            # this thread object goes away. The interpreter, environment and
+            # callbacks refer to each other, so collect the cycles too; this
+            # is the end of the thread, not a hot path.
+            building = env = debugger = on_event = None
+            emit_events = flush_output = events = None
+            gc.collect()
 
     # Public slots for UI control
     
     def step_into(self):
         """Command debugger to step into."""
-        if self._debugger:
-            self._debugger.set_mode(DebugMode.STEP_INTO)
-            self._debugger.resume()
+        self._resume_in(DebugMode.STEP_INTO)
     
     def step_over(self):
         """Command debugger to step over."""
-        if self._debugger:
-            self._debugger.set_mode(DebugMode.STEP_OVER)
-            self._debugger.resume()
+        self._resume_in(DebugMode.STEP_OVER)
     
     def step_out(self):
         """Command debugger to step out."""
-        if self._debugger:
-            self._debugger.set_mode(DebugMode.STEP_OUT)
-            self._debugger.resume()
+        self._resume_in(DebugMode.STEP_OUT)
     
     def continue_run(self):
         """Command debugger to continue execution."""
-        if self._debugger:
-            self._debugger.set_mode(DebugMode.RUN_TO_BREAKPOINT)
-            self._debugger.resume()
+        self._resume_in(DebugMode.RUN_TO_BREAKPOINT)
+    
+    def set_ui_wants_details(self, wants: bool):
+        """Tell the debugger whether the UI is showing variables and stack."""
+        self._ui_wants_details = wants
+        debugger = self._debugger
+        if debugger is not None:
+            debugger.set_call_events_while_running(wants)
+    
+    def _resume_in(self, mode: DebugMode):
+        """Switch the program to the given mode, resuming it if paused."""
+        debugger = self._debugger
+        if debugger is not None:
+            debugger.resume(mode)
     
     def stop(self):
         """Command debugger to stop."""
-        self._running = False # Flag for loop
-        self._input_event.set() # Unblock input wait if any
-        if self._debugger:
-            self._debugger.stop()
+        # Checked before every statement, so this also covers a stop that
+        # arrives before run() has published the debugger
+        self._stop_requested = True
+        with self._input_cond: # Unblock input wait if any
+            self._input_ready = True
+            self._input_cond.notify()
+        debugger = self._debugger
+        if debugger is not None:
+            debugger.stop()
         # Thread will exit naturally after stop() unblocks run() loop
     
     def update_breakpoints(self, filepath: str, breakpoints: Set[int]):
-        """Update breakpoints for a file during execution."""
-        if not self._debugger:
-            return
-            
-        path = Path(filepath)
-        # Clear existing for this file (inefficient but safe)
-        # Better: calculate diff. For now, simple approach.
-        # Actually DebugInterpreter doesn't have "clear file breakpoints".
-        # Let's iterate and remove unmatched, add new.
-        
-        # This is tricky because accessing specific file breakpoints in DebugInterpreter might need API
-        # Implementation: for now just add all. 
-        # TODO: Add remove_breakpoint logic if needed for runtime toggle.
-        # Ideally DebugInterpreter should expose a way to manage easier.
-        pass
+        """Replace the breakpoints for a file during execution."""
+        self._cmd_queue.append(("update", self._path(filepath), frozenset(breakpoints)))
         
     def add_breakpoint(self, filepath: str, line: int):
         """Add a dynamic breakpoint."""
-        if self._debugger:
-            self._debugger.add_breakpoint(Path(filepath), line)
+        self._cmd_queue.append(("add", self._path(filepath), line))
             
     def remove_breakpoint(self, filepath: str, line: int):
         """Remove a dynamic breakpoint."""
-        if self._debugger:
-            self._debugger.remove_breakpoint(Path(filepath), line)
+        self._cmd_queue.append(("remove", self._path(filepath), line))
+    
+    def _path(self, filepath: str) -> Path:
+        """Return the resolved Path for a file path string, reusing earlier ones."""
+        path = self._path_cache.get(filepath)
+        if path is None:
+            # os.path.realpath gives the same answer as Path.resolve()
+            # without building a Path per component
+            path = self._path_cache[filepath] = Path(realpath(filepath))
+        return path
+    
+    def _safe_point(self):
+        """Run before each statement on the debug thread."""
+        if self._stop_requested:
+            raise DebuggerStopped()
+        if self._cmd_queue:
+            self._drain_commands()
+        # Don't let the tail of a burst of output sit in the buffer while
+        # the program goes on computing
+        if self._out_buf and time.monotonic() - self._out_last_flush > _OUTPUT_FLUSH_INTERVAL:
+            self._flush_output()
+    
+    def _drain_commands(self):
+        """Apply queued breakpoint changes. Runs on the debug thread."""
+        queue = self._cmd_queue
+        debugger = self._debugger
+        active_bps = self._active_bps
+        while queue:
+            op, path, arg = queue.popleft()
+            if op == "add":
+                debugger.add_breakpoint(path, arg)
+                active_bps.setdefault(path, set()).add(arg)
+            elif op == "remove":
+                debugger.remove_breakpoint(path, arg)
+                active_bps.get(path, set()).discard(arg)
+            elif op == "update":
+                old = active_bps.get(path, set())
+                for line in old - arg:
+                    debugger.remove_breakpoint(path, line)
+                for line in arg - old:
+                    debugger.add_breakpoint(path, line)
+                active_bps[path] = set(arg)
+
+    def _buffered_output(self, text: str):
+        """Collect program output, sending it to the UI in batches."""
+        buf = self._out_buf
+        buf.append(text)
+        if (len(buf) >= _OUTPUT_FLUSH_COUNT
+                or time.monotonic() - self._out_last_flush > _OUTPUT_FLUSH_INTERVAL):
+            self._flush_output()
+    
+    def _flush_output(self):
+        """Send any buffered output to the UI."""
+        self._out_last_flush = time.monotonic()
+        if self._out_buf:
+            text = "".join(self._out_buf)
+            self._out_buf.clear()
+            self.output_signal.emit(text)
 
     def _handle_input(self, prompt: str = "") -> str:
         """Handle input request from environment."""
-        self._input_event.clear()
-        self.input_request_signal.emit(prompt)
-        # Block until input is provided
-        self._input_event.wait()
-        return self._input_response
+        self._flush_output()
+        with self._input_cond:
+            self._input_ready = False
+            # stop() may have landed since the last safe point; its wake-up
+            # was just cleared, so don't prompt or wait at all
+            if self._stop_requested:
+                raise DebuggerStopped()
+            self.input_request_signal.emit(prompt)
+            # Block until input is provided or the session is stopped
+            self._input_cond.wait_for(
+                lambda: self._input_ready or self._stop_requested
+            )
+            if self._stop_requested:
+                # Unwind now rather than hand the program an empty answer
+                raise DebuggerStopped()
+            return self._input_response
 
     def provide_input(self, text: str):
         """Provide input to the running program."""
-        self._input_response = text
-        self._input_event.set()
+        with self._input_cond:
+            self._input_response = text
+            self._input_ready = True
+            self._input_cond.notify()
@@ -12,17 +12,73 @@ from PyQt6.QtWidgets import (
     QLabel, QFrame, QMessageBox, QFileDialog, QMenu, QTextEdit, QPushButton
 )
 from PyQt6.QtCore import (
-    Qt, QRect, QSize, pyqtSignal, QTimer, QRegularExpression
+    Qt, QRect, QSize, pyqtSignal, QTimer, QRegularExpression, QPointF, QPoint,
+    QObject, QRunnable, QThreadPool
 )
 from PyQt6.QtGui import (
     QColor, QPainter, QTextFormat, QFont, QFontMetrics, QTextCursor,
     QKeySequence, QAction, QPaintEvent, QTextCharFormat, QTextDocument,
-    QKeyEvent, QWheelEvent, QFontInfo
+    QKeyEvent, QWheelEvent, QFontInfo, QPixmap, QPolygonF
 )
 
 from steps_ide.app.settings import SettingsManager
 from steps_ide.app.themes import Theme, ThemeManager
 from steps_ide.app.syntax import StepsHighlighter, GenericHighlighter
+from steps_ide.app.paths import abspath, realpath, clear_realpath_cache
+
+# Line separator written between blocks when saving
+_NEWLINE = os.linesep.encode('ascii')
+
+# Characters toPlainText() rewrites but QTextBlock.text() leaves alone:
+# soft line breaks become real ones, non-breaking spaces plain spaces
+_PLAIN_TEXT = str.maketrans({
+    '\u2028': os.linesep,
+    '\u2029': os.linesep,
+    '\u00a0': ' ',
+})
+
+
+def _encode_block(text: str) -> bytes:
+    """Encode one block's text the way a plain-text save would write it"""
+    if not text.isascii():
+        text = text.translate(_PLAIN_TEXT)
+    return text.encode('utf-8')
+
+
+def _parent_dirs(filepath: str):
+    """Yield each directory above filepath, nearest first, up to the root"""
+    parent = os.path.dirname(filepath)
+    while parent and parent != filepath:
+        yield parent
+        filepath, parent = parent, os.path.dirname(parent)
+
+
+class _SaveSignals(QObject):
+    """Signals for a background save, delivered on the GUI thread"""
+    
+    finished = pyqtSignal(int)  # save token
+
+
+class _SaveTask(QRunnable):
+    """Writes a file's already-encoded contents on a pool thread"""
+    
+    def __init__(self, token: int, filepath: str, data: bytes):
+        super().__init__()
+        self.setAutoDelete(False)  # EditorTabs keeps it until the result is read
+        self.token = token
+        self.filepath = filepath
+        self.data = data
+        self.error = ""
+        self.signals = _SaveSignals()
+    
+    def run(self):
+        try:
+            with open(self.filepath, 'wb') as f:
+                f.write(self.data)
+        except Exception as e:
+            self.error = str(e)
+        self.data = b""
+        self.signals.finished.emit(self.token)
 
 
 class LineNumberArea(QWidget):
@@ -41,24 +97,17 @@ class LineNumberArea(QWidget):
     def mousePressEvent(self, event):
         """Handle mouse click to toggle breakpoint."""
         if event.button() == Qt.MouseButton.LeftButton:
-            # Calculate which line was clicked
+            # Let Qt map the click to a block, then check it really is on
+            # that block rather than in the empty space below the last line
             y = event.position().y()
-            block = self.code_editor.firstVisibleBlock()
-            top = self.code_editor.blockBoundingGeometry(block).translated(
-                self.code_editor.contentOffset()
+            editor = self.code_editor
+            block = editor.cursorForPosition(QPoint(0, int(y))).block()
+            top = editor.blockBoundingGeometry(block).translated(
+                editor.contentOffset()
             ).top()
             
-            while block.isValid():
-                block_top = top
-                block_height = self.code_editor.blockBoundingRect(block).height()
-                
-                if block_top <= y < block_top + block_height:
-                    line = block.blockNumber() + 1
-                    self.code_editor.toggle_breakpoint(line)
-                    break
-                
-                top += block_height
-                block = block.next()
+            if top <= y < top + editor.blockBoundingRect(block).height():
+                editor.toggle_breakpoint(block.blockNumber() + 1)
         
         super().mousePressEvent(event)
 
@@ -71,6 +120,10 @@ class CodeEditor(QPlainTextEdit):
     breakpoint_toggled = pyqtSignal(int)  # line number
     modified_changed = pyqtSignal(bool)
     cursor_position_changed = pyqtSignal(int, int)  # line, column
+    
+    # Gutter marker colors
+    _COL_BP = QColor("#f44336")  # Red
+    _COL_DBG = QColor("#FFC107")  # Amber/Yellow
 
     def __init__(self, theme: Theme, settings: SettingsManager, parent=None):
         super().__init__(parent)
@@ -78,10 +131,30 @@ class CodeEditor(QPlainTextEdit):
         self.settings_manager = settings
         self.file_path: Optional[str] = None
         self._highlighter: Optional[StepsHighlighter] = None
+        # Set by set_file; the highlighter is attached once the editor is
+        # shown, so tabs opened in the background don't highlight at all
+        self._highlighter_pending = False
         
         # Debugger state
         self._current_debug_line = -1
         self._breakpoints: set[int] = set()
+        # Extra selections for the debug line and the cursor line, rebuilt
+        # separately so moving the cursor leaves the debug one alone
+        self._debug_sel: Optional[QTextEdit.ExtraSelection] = None
+        self._cursor_sel: Optional[QTextEdit.ExtraSelection] = None
+        
+        # Last gutter rendering and the state it was drawn for
+        self._gutter_cache_key = None
+        self._gutter_cache_pm: Optional[QPixmap] = None
+        # Debug arrow triangle at the origin, rebuilt when its size changes
+        self._arrow_template = QPolygonF()
+        self._arrow_template_size = -1
+        # Last stylesheet given to setStyleSheet by _apply_theme
+        self._applied_stylesheet = ""
+        # Gutter width, recomputed after line count, font or settings changes
+        self._lna_width_cache: Optional[int] = None
+        # Line number strings for the gutter, index 0 holding "1"
+        self._line_num_strs: List[str] = []
         
         self._setup_editor()
         self._setup_line_numbers()
@@ -114,22 +187,54 @@ class CodeEditor(QPlainTextEdit):
         """Set up line number area"""
         self.line_number_area = LineNumberArea(self)
         
-        self.blockCountChanged.connect(self.update_line_number_area_width)
+        self.blockCountChanged.connect(self._on_block_count_changed)
         self.updateRequest.connect(self.update_line_number_area)
         self.cursorPositionChanged.connect(self.highlight_current_line)
         
         self.update_line_number_area_width(0)
+        self._grow_line_num_strs(self.blockCount())
         self.highlight_current_line()
     
+    def _on_block_count_changed(self, block_count: int):
+        """Keep the gutter's strings and width in step with the line count."""
+        self._grow_line_num_strs(block_count)
+        self._lna_width_cache = None
+        self.update_line_number_area_width(block_count)
+    
+    def _grow_line_num_strs(self, block_count: int):
+        """Extend the line number strings to cover block_count lines."""
+        strs = self._line_num_strs
+        if block_count > len(strs):
+            strs.extend(str(i) for i in range(len(strs) + 1, block_count + 1))
+    
     def _setup_connections(self):
         """Set up signal connections"""
         self.modificationChanged.connect(self.modified_changed.emit)
         self.cursorPositionChanged.connect(self._emit_cursor_position)
+        
+        # Cursor moves are reported at most once a frame; held-down keys
+        # would otherwise send one signal per autorepeat
+        self._pending_pos = (1, 1)
+        self._cursor_emit_timer = QTimer(self)
+        self._cursor_emit_timer.setSingleShot(True)
+        self._cursor_emit_timer.setInterval(16)
+        self._cursor_emit_timer.timeout.connect(self._flush_cursor_pos)
+        
+        # A burst of Ctrl+wheel zoom steps re-measures tabs and the gutter
+        # once, after the last step
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(0)
+        self._zoom_timer.timeout.connect(self._update_tab_width)
     
     def _apply_theme(self):
         """Apply theme colors to editor"""
         settings = self.settings_manager.settings.editor
-        self.setStyleSheet(f"""
+        # Parsed once per theme rather than on every gutter paint
+        self._col_gutter_bg = QColor(self.theme.editor_gutter_bg)
+        self._col_gutter_fg = QColor(self.theme.editor_gutter_fg)
+        self._col_fg = QColor(self.theme.editor_foreground)
+        stylesheet = f"""
             QPlainTextEdit {{
                 background-color: {self.theme.editor_background};
                 color: {self.theme.editor_foreground};
@@ -138,9 +243,18 @@ class CodeEditor(QPlainTextEdit):
                 font-family: "{settings.font_family}";
                 font-size: {settings.font_size}pt;
             }}
-        """)
+        """
+        # Re-polishing is the expensive part, so skip it when nothing in the
+        # sheet changed. The application stylesheet also styles every
+        # QWidget's colors and font, so a palette or setFont alone would be
+        # overridden; the editor needs its own sheet.
+        if stylesheet != self._applied_stylesheet:
+            self.setStyleSheet(stylesheet)
+            self._applied_stylesheet = stylesheet
         
         # Update line numbers
+        self._lna_width_cache = None
+        self._invalidate_gutter_cache()
         self.line_number_area.update()
         self.highlight_current_line()
     
@@ -151,33 +265,48 @@ class CodeEditor(QPlainTextEdit):
         if self._highlighter:
             self._highlighter.set_theme(theme)
     
-    def refresh_settings(self):
-        """Re-apply all settings from settings manager"""
-        settings = self.settings_manager.settings.editor
-        
-        # Re-apply theme which now includes font settings in stylesheet
-        self._apply_theme()
+    def refresh_settings(self, changed: Optional[set] = None):
+        """Re-apply settings from settings manager
         
-        # Also set font programmatically for line number area
-        font = QFont(settings.font_family, settings.font_size)
-        font.setFixedPitch(True)
-        self.line_number_area.setFont(font)
+        Args:
+            changed: Names of the editor settings that changed, or None to
+                re-apply all of them
+        """
+        settings = self.settings_manager.settings.editor
+        if changed is None:
+            changed = {"font_family", "font_size", "tab_width", "word_wrap",
+                       "show_line_numbers", "highlight_current_line"}
+        font_changed = "font_family" in changed or "font_size" in changed
+        
+        if font_changed:
+            # Re-apply theme which now includes font settings in stylesheet
+            self._apply_theme()
+            
+            # Also set font programmatically for line number area
+            font = QFont(settings.font_family, settings.font_size)
+            font.setFixedPitch(True)
+            self.line_number_area.setFont(font)
         
         # Tab width
-        self._update_tab_width()
+        if font_changed or "tab_width" in changed:
+            self._update_tab_width()
         
         # Word wrap
-        if settings.word_wrap:
-            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
-        else:
-            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        if "word_wrap" in changed:
+            if settings.word_wrap:
+                self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+            else:
+                self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         
         # Line numbers - update width
-        self.update_line_number_area_width(0)
-        self.line_number_area.update()
+        if font_changed or "show_line_numbers" in changed:
+            self._lna_width_cache = None
+            self.update_line_number_area_width(0)
+            self.line_number_area.update()
         
         # Current line highlight
-        self.highlight_current_line()
+        if "highlight_current_line" in changed:
+            self.highlight_current_line()
         
         # Force repaint
         self.viewport().update()
@@ -185,7 +314,11 @@ class CodeEditor(QPlainTextEdit):
     
     def line_number_area_width(self) -> int:
         """Calculate width needed for line numbers"""
+        if self._lna_width_cache is not None:
+            return self._lna_width_cache
+        
         if not self.settings_manager.settings.editor.show_line_numbers:
+            self._lna_width_cache = 0
             return 0
         
         digits = 1
@@ -197,14 +330,20 @@ class CodeEditor(QPlainTextEdit):
         # Minimum 4 digits width + padding + icon space
         digits = max(4, digits)
         space = 24 + self.fontMetrics().horizontalAdvance('9') * digits
+        self._lna_width_cache = space
         return space
     
     def update_line_number_area_width(self, _):
         """Update the viewport margin for line numbers"""
+        self._invalidate_gutter_cache()
         self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
     
     def update_line_number_area(self, rect: QRect, dy: int):
         """Update line number area on scroll"""
+        if not self.settings_manager.settings.editor.show_line_numbers:
+            # The gutter is zero-width; refresh_settings sets it up again
+            # when line numbers are turned back on
+            return
         if dy:
             self.line_number_area.scroll(0, dy)
         else:
@@ -217,6 +356,7 @@ class CodeEditor(QPlainTextEdit):
     def resizeEvent(self, event):
         """Handle resize to update line number area"""
         super().resizeEvent(event)
+        self._invalidate_gutter_cache()
         cr = self.contentsRect()
         self.line_number_area.setGeometry(
             QRect(cr.left(), cr.top(), self.line_number_area_width(), cr.height())
@@ -227,25 +367,67 @@ class CodeEditor(QPlainTextEdit):
         if not self.settings_manager.settings.editor.show_line_numbers:
             return
         
-        painter = QPainter(self.line_number_area)
-        painter.fillRect(event.rect(), QColor(self.theme.editor_gutter_bg))
-        
         block = self.firstVisibleBlock()
-        block_number = block.blockNumber()
         top = round(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-        bottom = top + round(self.blockBoundingRect(block).height())
-        
         current_cursor_line = self.textCursor().blockNumber()
-        height = self.fontMetrics().height()
+        area = self.line_number_area
+        
+        # Repaints with nothing changed (the cursor blinking, focus changes)
+        # just copy the last rendering. Breakpoint, debug line, theme and
+        # size changes clear the key directly. The wrap mode and viewport
+        # width decide how tall wrapped blocks are, so they are part of it.
+        key = (
+            block.blockNumber(), top, self.blockCount(),
+            self.document().revision(), current_cursor_line,
+            area.width(), area.height(), self.fontMetrics().height(),
+            self.lineWrapMode(), self.viewport().width(),
+        )
+        if key != self._gutter_cache_key:
+            ratio = area.devicePixelRatioF()
+            pixmap = QPixmap(
+                max(1, round(area.width() * ratio)),
+                max(1, round(area.height() * ratio))
+            )
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setFont(area.font())
+            self._paint_gutter(pixmap_painter, area.rect(), block, top,
+                               current_cursor_line)
+            pixmap_painter.end()
+            self._gutter_cache_pm = pixmap
+            self._gutter_cache_key = key
+        
+        painter = QPainter(area)
+        painter.drawPixmap(0, 0, self._gutter_cache_pm)
+    
+    def _invalidate_gutter_cache(self):
+        """Make the next gutter paint render again rather than reuse the cache."""
+        self._gutter_cache_key = None
+    
+    def _paint_gutter(self, painter: QPainter, rect: QRect, block, top: int,
+                      current_cursor_line: int):
+        """Render line numbers and debug indicators for rect into painter."""
+        painter.fillRect(rect, self._col_gutter_bg)
         
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
+        block_number = block.blockNumber()
+        bottom = top + round(self.blockBoundingRect(block).height())
+        height = self.fontMetrics().height()
+        line_num_strs = self._line_num_strs
+        # Most files have no breakpoints and no debug line; checking once
+        # here skips the per-line tests for them
+        breakpoints = self._breakpoints
+        has_bp = bool(breakpoints)
+        debug_line = self._current_debug_line
+        text_width = self.line_number_area.width() - 8
+        
+        while block.isValid() and top <= rect.bottom():
+            if block.isVisible() and bottom >= rect.top():
                 line_num = block_number + 1
-                number_str = str(line_num)
+                number_str = line_num_strs[block_number]
                 
                 # Draw Breakpoint (Red Circle)
-                if line_num in self._breakpoints:
-                    painter.setBrush(QColor("#f44336"))  # Red
+                if has_bp and line_num in breakpoints:
+                    painter.setBrush(self._COL_BP)
                     painter.setPen(Qt.PenStyle.NoPen)
                     circle_size = min(height, 12)
                     circle_rect = QRect(
@@ -257,34 +439,27 @@ class CodeEditor(QPlainTextEdit):
                     painter.drawEllipse(circle_rect)
                 
                 # Draw Debug Execution Arrow (Yellow Triangle)
-                if line_num == self._current_debug_line:
-                    painter.setBrush(QColor("#FFC107"))  # Amber/Yellow
+                if debug_line >= 0 and line_num == debug_line:
+                    painter.setBrush(self._COL_DBG)
                     painter.setPen(Qt.PenStyle.NoPen)
                     
                     # Draw a triangle pointing right
                     arrow_size = min(height, 12)
                     arrow_x = 4
                     arrow_y = top + (height - arrow_size) // 2
-                    
-                    from PyQt6.QtGui import QPolygon, QPolygonF
-                    from PyQt6.QtCore import QPointF
-                    
-                    points = [
-                         QPointF(arrow_x, arrow_y),
-                         QPointF(arrow_x + arrow_size, arrow_y + arrow_size / 2),
-                         QPointF(arrow_x, arrow_y + arrow_size)
-                    ]
-                    painter.drawPolygon(QPolygonF(points))
+                    painter.drawPolygon(
+                        self._arrow_polygon(arrow_size).translated(arrow_x, arrow_y)
+                    )
                 
                 # Draw Line Number
-                if block_number == current_cursor_line:
-                    painter.setPen(QColor(self.theme.editor_foreground))
-                else:
-                    painter.setPen(QColor(self.theme.editor_gutter_fg))
+                painter.setPen(
+                    self._col_fg if block_number == current_cursor_line
+                    else self._col_gutter_fg
+                )
                 
                 painter.drawText(
                     0, top,
-                    self.line_number_area.width() - 8, 
+                    text_width, 
                     height,
                     Qt.AlignmentFlag.AlignRight, number_str
                 )
@@ -294,11 +469,35 @@ class CodeEditor(QPlainTextEdit):
             bottom = top + round(self.blockBoundingRect(block).height())
             block_number += 1
     
+    def _arrow_polygon(self, size: int) -> QPolygonF:
+        """Return the debug arrow triangle of the given size, at the origin."""
+        if size != self._arrow_template_size:
+            self._arrow_template = QPolygonF([
+                QPointF(0, 0),
+                QPointF(size, size / 2),
+                QPointF(0, size)
+            ])
+            self._arrow_template_size = size
+        return self._arrow_template
+    
     def highlight_current_line(self):
-        """Highlight the current line and debug execution line"""
-        extra_selections = []
+        """Highlight the current cursor line, keeping the debug line highlight"""
+        if (self.settings_manager.settings.editor.highlight_current_line and 
+            not self.isReadOnly()):
+            selection = QTextEdit.ExtraSelection()
+            line_color = QColor(self.theme.editor_line_highlight)
+            selection.format.setBackground(line_color)
+            selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+            selection.cursor = self.textCursor()
+            selection.cursor.clearSelection()
+            self._cursor_sel = selection
+        else:
+            self._cursor_sel = None
         
-        # 1. Debug Execution Line (Yellow Highlight)
+        self._apply_extra_selections()
+    
+    def _rebuild_debug_selection(self):
+        """Rebuild the debug execution line highlight"""
         if self._current_debug_line != -1:
             selection = QTextEdit.ExtraSelection()
             # Use a slightly transparent yellow/amber
@@ -312,25 +511,23 @@ class CodeEditor(QPlainTextEdit):
             block = self.document().findBlockByLineNumber(self._current_debug_line - 1)
             selection.cursor = QTextCursor(block)
             selection.cursor.clearSelection()
-            extra_selections.append(selection)
-
-        # 2. Current Cursor Line (Standard Highlight)
-        if (self.settings_manager.settings.editor.highlight_current_line and 
-            not self.isReadOnly()):
-            selection = QTextEdit.ExtraSelection()
-            line_color = QColor(self.theme.editor_line_highlight)
-            selection.format.setBackground(line_color)
-            selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
-            selection.cursor = self.textCursor()
-            selection.cursor.clearSelection()
-            extra_selections.append(selection)
+            self._debug_sel = selection
+        else:
+            self._debug_sel = None
         
-        self.setExtraSelections(extra_selections)
+        self._apply_extra_selections()
+    
+    def _apply_extra_selections(self):
+        """Show the debug line highlight under the cursor line highlight"""
+        self.setExtraSelections(
+            [sel for sel in (self._debug_sel, self._cursor_sel) if sel is not None]
+        )
 
     def highlight_debug_line(self, line: int):
         """Highlight a specific line for debugging."""
         self._current_debug_line = line
-        self.highlight_current_line()
+        self._invalidate_gutter_cache()
+        self._rebuild_debug_selection()
         self.line_number_area.update()
         
         # Scroll to line
@@ -342,7 +539,8 @@ class CodeEditor(QPlainTextEdit):
     def clear_debug_highlight(self):
         """Clear the debug line highlighting."""
         self._current_debug_line = -1
-        self.highlight_current_line()
+        self._invalidate_gutter_cache()
+        self._rebuild_debug_selection()
         self.line_number_area.update()
         
     def toggle_breakpoint(self, line: int):
@@ -351,6 +549,7 @@ class CodeEditor(QPlainTextEdit):
             self._breakpoints.remove(line)
         else:
             self._breakpoints.add(line)
+        self._invalidate_gutter_cache()
         self.line_number_area.update()
         self.breakpoint_toggled.emit(line)
         
@@ -358,37 +557,65 @@ class CodeEditor(QPlainTextEdit):
         """Get the set of breakpoint line numbers."""
         return self._breakpoints.copy()
     
+    def has_breakpoints(self) -> bool:
+        """Check whether any line has a breakpoint."""
+        return bool(self._breakpoints)
+    
     def _emit_cursor_position(self):
         """Emit cursor position signal"""
         cursor = self.textCursor()
-        line = cursor.blockNumber() + 1
-        column = cursor.columnNumber() + 1
-        self.cursor_position_changed.emit(line, column)
+        self._pending_pos = (cursor.blockNumber() + 1, cursor.columnNumber() + 1)
+        if not self._cursor_emit_timer.isActive():
+            self._cursor_emit_timer.start()
+    
+    def _flush_cursor_pos(self):
+        """Emit the latest cursor position once the burst of moves settles"""
+        self.cursor_position_changed.emit(*self._pending_pos)
     
     def set_file(self, filepath: str):
         """Load a file into the editor"""
         self.file_path = filepath
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.setPlainText(content)
-            self.document().setModified(False)
-            
-            # Set up appropriate highlighter
-            self._setup_highlighter(filepath)
-            
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(filepath, 'r', encoding='latin-1') as f:
-                    content = f.read()
-                self.setPlainText(content)
-                self.document().setModified(False)
-            except Exception as e:
-                QMessageBox.critical(None, "Error", f"Could not read file: {e}")
+            data = Path(filepath).read_bytes()
         except Exception as e:
             QMessageBox.critical(None, "Error", f"Could not open file: {e}")
+            return
+        
+        try:
+            content = data.decode('utf-8')
+            highlight = True
+        except UnicodeDecodeError:
+            # Try with different encoding
+            content = data.decode('latin-1')
+            highlight = False
+        if '\r' in content:
+            # Match the newline handling of reading in text mode
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        self.setPlainText(content)
+        self.document().setModified(False)
+        
+        if highlight:
+            # Set up appropriate highlighter when the editor is first shown
+            self._highlighter_pending = True
+            if self.isVisible():
+                self.ensure_highlighter()
+    
+    def ensure_highlighter(self):
+        """Attach the highlighter set_file left pending, after the next paint.
+        
+        Deferring to the event loop lets the text appear before a large file
+        is highlighted.
+        """
+        if self._highlighter_pending:
+            QTimer.singleShot(0, self._attach_pending_highlighter)
+    
+    def _attach_pending_highlighter(self):
+        """Attach the pending highlighter, if no earlier call already has."""
+        if self._highlighter_pending:
+            self._highlighter_pending = False
+            self._setup_highlighter(self.file_path)
     
     def _setup_highlighter(self, filepath: str):
         """Set up syntax highlighter based on file extension"""
@@ -410,14 +637,30 @@ class CodeEditor(QPlainTextEdit):
             return False
         
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.write(self.toPlainText())
+            # Written a block at a time, so a large file is never held as
+            # one extra string. Lines end the way text mode wrote them.
+            with open(self.file_path, 'wb') as f:
+                block = self.document().begin()
+                while block.isValid():
+                    f.write(_encode_block(block.text()))
+                    block = block.next()
+                    if block.isValid():
+                        f.write(_NEWLINE)
             self.document().setModified(False)
             return True
         except Exception as e:
             QMessageBox.critical(None, "Error", f"Could not save file: {e}")
             return False
     
+    def encoded_contents(self) -> bytes:
+        """Return the document as the bytes save_file would write"""
+        parts = []
+        block = self.document().begin()
+        while block.isValid():
+            parts.append(_encode_block(block.text()))
+            block = block.next()
+        return _NEWLINE.join(parts)
+    
     def keyPressEvent(self, event: QKeyEvent):
         """Handle key press events"""
         settings = self.settings_manager.settings.editor
@@ -429,16 +672,10 @@ class CodeEditor(QPlainTextEdit):
             text = block.text()
             
             # Get leading whitespace
-            indent = ""
-            for char in text:
-                if char in (' ', '\t'):
-                    indent += char
-                else:
-                    break
+            indent = text[:len(text) - len(text.lstrip(' \t'))]
             
             # Check if line ends with : to add extra indent (Steps uses colons)
-            stripped = text.rstrip()
-            if stripped.endswith(':'):
+            if text.endswith(':') or text.rstrip().endswith(':'):
                 if settings.use_spaces:
                     indent += ' ' * settings.tab_width
                 else:
@@ -483,21 +720,15 @@ class CodeEditor(QPlainTextEdit):
     
     def zoom_in(self):
         """Increase font size"""
-        font = self.font()
-        size = font.pointSize()
-        if size < 48:
-            font.setPointSize(size + 1)
-            self.setFont(font)
-            self._update_tab_width()
+        if self.font().pointSize() < 48:
+            self.zoomIn(1)
+            self._zoom_timer.start()
     
     def zoom_out(self):
         """Decrease font size"""
-        font = self.font()
-        size = font.pointSize()
-        if size > 6:
-            font.setPointSize(size - 1)
-            self.setFont(font)
-            self._update_tab_width()
+        if self.font().pointSize() > 6:
+            self.zoomOut(1)
+            self._zoom_timer.start()
     
     def reset_zoom(self):
         """Reset to default font size"""
@@ -512,6 +743,9 @@ class CodeEditor(QPlainTextEdit):
         tab_width = self.settings_manager.settings.editor.tab_width
         metrics = QFontMetrics(self.font())
         self.setTabStopDistance(metrics.horizontalAdvance(' ') * tab_width)
+        # The font changed, so the gutter needs measuring again
+        self._lna_width_cache = None
+        self.update_line_number_area_width(0)
 
 
 class DiagramViewer(QWidget):
@@ -628,6 +862,23 @@ class EditorTabs(QTabWidget):
         self.settings = settings
         self.theme_manager = theme_manager
         self.editors: Dict[str, CodeEditor] = {}  # filepath -> editor
+        self._paths: Dict[QWidget, str] = {}  # editor -> filepath, mirrors editors
+        # Editors by the fully resolved path of their file, for matching
+        # paths from the debugger without resolving every open tab, and
+        # the resolved path each editor was filed under
+        self._editors_by_resolved: Dict[str, QWidget] = {}
+        self._resolved_paths: Dict[QWidget, str] = {}
+        # Every directory above an open file -> the open files below it, so
+        # a folder delete or rename finds its tabs without scanning them all
+        self._dir_to_files: Dict[str, set] = {}
+        # Open editors that currently have at least one breakpoint
+        self._breakpoint_editors: set = set()
+        # Save All writes in flight: token -> (editor, document revision, task)
+        self._pending_saves: Dict[int, tuple] = {}
+        self._next_save_token = 0
+        # Save All writes get their own pool, so waiting for them never
+        # waits on unrelated work queued on the global one
+        self._save_pool = QThreadPool(self)
         
         self._setup_ui()
         self._setup_connections()
@@ -650,15 +901,15 @@ class EditorTabs(QTabWidget):
     
     def open_file(self, filepath: str):
         """Open a file in a new or existing tab"""
-        filepath = os.path.abspath(filepath)
+        filepath = abspath(filepath)
         
         # Check if already open
         if filepath in self.editors:
             # Switch to existing tab
-            for i in range(self.count()):
-                if self.widget(i) == self.editors[filepath]:
-                    self.setCurrentIndex(i)
-                    return
+            i = self.indexOf(self.editors[filepath])
+            if i >= 0:
+                self.setCurrentIndex(i)
+                return
         
         # Create new editor
         editor = CodeEditor(
@@ -669,9 +920,10 @@ class EditorTabs(QTabWidget):
         editor.set_file(filepath)
         editor.modified_changed.connect(lambda m: self._on_modified_changed(filepath, m))
         editor.cursor_position_changed.connect(self.cursor_position_changed.emit)
+        editor.breakpoint_toggled.connect(lambda _line: self._on_breakpoint_toggled(editor))
         
         # Add tab
-        self.editors[filepath] = editor
+        self._add_editor(filepath, editor)
         filename = os.path.basename(filepath)
         index = self.addTab(editor, filename)
         self.setTabToolTip(index, filepath)
@@ -701,11 +953,12 @@ class EditorTabs(QTabWidget):
         editor.setPlainText(initial_content)
         editor.modified_changed.connect(lambda m: self._on_modified_changed(filepath, m))
         editor.cursor_position_changed.connect(self.cursor_position_changed.emit)
+        editor.breakpoint_toggled.connect(lambda _line: self._on_breakpoint_toggled(editor))
         
         # Set up Steps highlighter by default for new files
         editor._highlighter = StepsHighlighter(editor.document(), editor.theme)
         
-        self.editors[filepath] = editor
+        self._add_editor(filepath, editor)
         index = self.addTab(editor, name)
         self.setCurrentIndex(index)
 
@@ -716,16 +969,16 @@ class EditorTabs(QTabWidget):
         # Check if diagram tab already exists
         if diagram_key in self.editors:
             # Find and update existing diagram tab
-            for i in range(self.count()):
-                widget = self.widget(i)
-                if isinstance(widget, DiagramViewer):
-                    # Update content
-                    widget.diagram_content = diagram_content
-                    widget.project_name = project_name
-                    widget.text_viewer.setPlainText(diagram_content)
-                    # Switch to this tab
-                    self.setCurrentIndex(i)
-                    return
+            widget = self.editors[diagram_key]
+            i = self.indexOf(widget)
+            if i >= 0:
+                # Update content
+                widget.diagram_content = diagram_content
+                widget.project_name = project_name
+                widget.text_viewer.setPlainText(diagram_content)
+                # Switch to this tab
+                self.setCurrentIndex(i)
+                return
 
         # Create new diagram viewer
         viewer = DiagramViewer(
@@ -736,28 +989,57 @@ class EditorTabs(QTabWidget):
         )
 
         # Add to editors dict and create tab
-        self.editors[diagram_key] = viewer
+        self._add_editor(diagram_key, viewer)
         index = self.addTab(viewer, f"📊 {project_name} Diagram")
         self.setTabToolTip(index, f"Project Diagram: {project_name}")
         self.setCurrentIndex(index)
 
+    def _add_editor(self, filepath: str, editor: QWidget):
+        """Register an open tab's widget under filepath."""
+        self.editors[filepath] = editor
+        self._paths[editor] = filepath
+        if isinstance(editor, CodeEditor) and editor.has_breakpoints():
+            self._breakpoint_editors.add(editor)
+        if not filepath.startswith("__"):
+            # Untitled and diagram tabs use "__" keys, not real paths
+            resolved = realpath(filepath)
+            self._editors_by_resolved[resolved] = editor
+            self._resolved_paths[editor] = resolved
+            for directory in _parent_dirs(filepath):
+                self._dir_to_files.setdefault(directory, set()).add(filepath)
+    
+    def _remove_editor(self, filepath: Optional[str]):
+        """Forget the tab registered under filepath, if any."""
+        editor = self.editors.pop(filepath, None)
+        if editor is not None:
+            self._paths.pop(editor, None)
+            self._breakpoint_editors.discard(editor)
+            resolved = self._resolved_paths.pop(editor, None)
+            # Another tab may reach the same file through a symlink
+            if resolved is not None and self._editors_by_resolved.get(resolved) is editor:
+                del self._editors_by_resolved[resolved]
+            if not filepath.startswith("__"):
+                for directory in _parent_dirs(filepath):
+                    files = self._dir_to_files.get(directory)
+                    if files is not None:
+                        files.discard(filepath)
+                        if not files:
+                            del self._dir_to_files[directory]
+    
     def save_current(self) -> bool:
         """Save the current file"""
         editor = self.currentWidget()
         if not isinstance(editor, CodeEditor):
             return False
         
-        # Find filepath for this editor
-        filepath = None
-        for path, ed in self.editors.items():
-            if ed == editor:
-                filepath = path
-                break
+        filepath = self._paths.get(editor)
         
         if filepath and filepath.startswith("__untitled_"):
             # Need to save as
             return self.save_current_as()
         
+        self._finish_background_saves()
+        
         if editor.save_file():
             self.file_saved.emit(filepath)
             return True
@@ -769,12 +1051,7 @@ class EditorTabs(QTabWidget):
         if not isinstance(editor, CodeEditor):
             return False
         
-        # Find old filepath
-        old_filepath = None
-        for path, ed in self.editors.items():
-            if ed == editor:
-                old_filepath = path
-                break
+        old_filepath = self._paths.get(editor)
         
         filepath, _ = QFileDialog.getSaveFileName(
             self, "Save As",
@@ -783,10 +1060,11 @@ class EditorTabs(QTabWidget):
         )
         
         if filepath:
+            self._finish_background_saves()
+            
             # Update references
-            if old_filepath in self.editors:
-                del self.editors[old_filepath]
-            self.editors[filepath] = editor
+            self._remove_editor(old_filepath)
+            self._add_editor(filepath, editor)
             
             # Update tab
             index = self.currentIndex()
@@ -801,26 +1079,69 @@ class EditorTabs(QTabWidget):
         return False
     
     def save_all(self):
-        """Save all open files"""
+        """Save all open files
+        
+        The documents are read here on the GUI thread; the file writes run
+        on the tabs' own thread pool and report back through
+        _on_background_save_finished.
+        """
+        # Writes of a file must land in order
+        self._finish_background_saves()
+        
+        pool = self._save_pool
         for filepath, editor in self.editors.items():
-            if not filepath.startswith("__untitled_"):
-                if editor.document().isModified():
-                    editor.save_file()
-                    self.file_saved.emit(filepath)
+            if filepath.startswith("__untitled_") or not isinstance(editor, CodeEditor):
+                continue
+            document = editor.document()
+            if document.isModified():
+                token = self._next_save_token
+                self._next_save_token += 1
+                task = _SaveTask(token, filepath, editor.encoded_contents())
+                task.signals.finished.connect(self._on_background_save_finished)
+                self._pending_saves[token] = (editor, document.revision(), task)
+                pool.start(task)
+    
+    def _on_background_save_finished(self, token: int):
+        """Apply the result of a Save All write"""
+        entry = self._pending_saves.pop(token, None)
+        if entry is None:
+            # Already applied by _finish_background_saves
+            return
+        editor, revision, task = entry
+        if task.error:
+            QMessageBox.critical(None, "Error", f"Could not save file: {task.error}")
+            return
+        # Edits made while the write ran keep the document marked modified
+        if editor in self._paths and editor.document().revision() == revision:
+            editor.document().setModified(False)
+        self.file_saved.emit(task.filepath)
+    
+    def wait_for_saves(self):
+        """Block until Save All's writes are on disk.
+        
+        Call before anything reads project files back from disk, such as
+        loading the project to run, check or debug it.
+        """
+        self._finish_background_saves()
+    
+    def _finish_background_saves(self):
+        """Wait for any Save All writes and apply their results now"""
+        if self._pending_saves:
+            self._save_pool.waitForDone()
+            for token in list(self._pending_saves):
+                self._on_background_save_finished(token)
     
     def close_tab(self, index: int) -> bool:
         """Close a tab, prompting to save if modified"""
+        # A Save All still writing may be about to clear the modified flag
+        self._finish_background_saves()
+        
         editor = self.widget(index)
         if not isinstance(editor, CodeEditor):
             self.removeTab(index)
             return True
         
-        # Find filepath
-        filepath = None
-        for path, ed in self.editors.items():
-            if ed == editor:
-                filepath = path
-                break
+        filepath = self._paths.get(editor)
         
         # Check if modified
         if editor.document().isModified():
@@ -844,8 +1165,7 @@ class EditorTabs(QTabWidget):
                         return False
         
         # Remove from editors dict
-        if filepath in self.editors:
-            del self.editors[filepath]
+        self._remove_editor(filepath)
         
         self.removeTab(index)
         self.file_closed.emit(filepath or "")
@@ -866,26 +1186,24 @@ class EditorTabs(QTabWidget):
         
         editor = self.widget(index)
         if isinstance(editor, CodeEditor):
-            for filepath, ed in self.editors.items():
-                if ed == editor:
-                    self.current_file_changed.emit(filepath)
-                    return
+            editor.ensure_highlighter()
+            filepath = self._paths.get(editor)
+            if filepath is not None:
+                self.current_file_changed.emit(filepath)
     
     def _on_modified_changed(self, filepath: str, modified: bool):
         """Update tab title when modified state changes"""
         if filepath not in self.editors:
             return
         
-        editor = self.editors[filepath]
-        for i in range(self.count()):
-            if self.widget(i) == editor:
-                name = os.path.basename(filepath)
-                if filepath.startswith("__untitled_"):
-                    name = f"Untitled-{filepath.split('_')[2]}"
-                if modified:
-                    name = "• " + name
-                self.setTabText(i, name)
-                break
+        i = self.indexOf(self.editors[filepath])
+        if i >= 0:
+            name = os.path.basename(filepath)
+            if filepath.startswith("__untitled_"):
+                name = f"Untitled-{filepath.split('_')[2]}"
+            if modified:
+                name = "• " + name
+            self.setTabText(i, name)
     
     def _show_tab_context_menu(self, pos):
         """Show context menu for tabs"""
@@ -924,12 +1242,10 @@ class EditorTabs(QTabWidget):
     
     def _copy_tab_path(self, index: int):
         """Copy the file path of a tab to clipboard"""
-        editor = self.widget(index)
-        for filepath, ed in self.editors.items():
-            if ed == editor and not filepath.startswith("__untitled_"):
-                from PyQt6.QtWidgets import QApplication
-                QApplication.clipboard().setText(filepath)
-                return
+        filepath = self._paths.get(self.widget(index))
+        if filepath is not None and not filepath.startswith("__untitled_"):
+            from PyQt6.QtWidgets import QApplication
+            QApplication.clipboard().setText(filepath)
     
     def get_current_editor(self) -> Optional[CodeEditor]:
         """Get the current editor widget"""
@@ -940,15 +1256,14 @@ class EditorTabs(QTabWidget):
     
     def get_current_filepath(self) -> Optional[str]:
         """Get filepath of current tab"""
-        editor = self.currentWidget()
-        for filepath, ed in self.editors.items():
-            if ed == editor:
-                return filepath if not filepath.startswith("__untitled_") else None
-        return None
+        filepath = self._paths.get(self.currentWidget())
+        if filepath is None or filepath.startswith("__untitled_"):
+            return None
+        return filepath
     
     def get_editor_for_file(self, filepath: str) -> Optional[CodeEditor]:
         """Get the editor for a specific filepath"""
-        filepath = os.path.abspath(filepath)
+        filepath = abspath(filepath)
         return self.editors.get(filepath)
     
     def set_theme(self, theme: Theme):
@@ -957,11 +1272,11 @@ class EditorTabs(QTabWidget):
             if hasattr(widget, 'set_theme'):
                 widget.set_theme(theme)
     
-    def refresh_settings(self):
-        """Refresh settings for all editors"""
+    def refresh_settings(self, changed: Optional[set] = None):
+        """Refresh settings for all editors, limited to changed if given"""
         for widget in self.editors.values():
             if hasattr(widget, 'refresh_settings'):
-                widget.refresh_settings()
+                widget.refresh_settings(changed)
     
     
     def goto_line(self, line: int):
@@ -976,34 +1291,22 @@ class EditorTabs(QTabWidget):
 
     def highlight_debug_line(self, filepath: str, line: int):
         """Highlight execution line in the appropriate editor."""
-        from pathlib import Path
-        
         # Robust path matching
-        target_path = Path(filepath).resolve()
-        target_editor = None
+        target_path = realpath(filepath)
         
         # Try to find matching open editor
-        for open_path, editor in self.editors.items():
-            if Path(open_path).resolve() == target_path:
-                target_editor = editor
-                break
+        target_editor = self._editors_by_resolved.get(target_path)
         
         # If file not open, open it
         if not target_editor:
-            self.open_file(str(target_path))
-            # Try to find it again (using the key format open_file used)
-            for open_path, editor in self.editors.items():
-                if Path(open_path).resolve() == target_path:
-                    target_editor = editor
-                    break
+            self.open_file(target_path)
+            target_editor = self._editors_by_resolved.get(target_path)
             
         # Switch to tab and highlight
         if target_editor:
-            # Find index
-            for i in range(self.count()):
-                if self.widget(i) == target_editor:
-                    self.setCurrentIndex(i)
-                    break
+            i = self.indexOf(target_editor)
+            if i >= 0:
+                self.setCurrentIndex(i)
             
             target_editor.highlight_debug_line(line)
 
@@ -1018,12 +1321,18 @@ class EditorTabs(QTabWidget):
         Returns:
             Dict mapping absolute filepath to set of line numbers
         """
-        all_breakpoints = {}
-        for filepath, editor in self.editors.items():
-            bps = editor.get_breakpoints()
-            if bps:
-                all_breakpoints[filepath] = bps
-        return all_breakpoints
+        paths = self._paths
+        return {paths[editor]: editor.get_breakpoints()
+                for editor in self._breakpoint_editors}
+    
+    def _on_breakpoint_toggled(self, editor: 'CodeEditor'):
+        """Track whether an editor still has any breakpoints"""
+        if editor not in self._paths:
+            return
+        if editor.has_breakpoints():
+            self._breakpoint_editors.add(editor)
+        else:
+            self._breakpoint_editors.discard(editor)
 
     def handle_item_deleted(self, path: str, is_directory: bool):
         """Handle a file or folder being deleted - close affected tabs.
@@ -1031,31 +1340,29 @@ class EditorTabs(QTabWidget):
         For files: close the tab if that exact file was open.
         For directories: close all tabs for files within that directory.
         """
-        path = os.path.abspath(path)
+        path = abspath(path)
         tabs_to_close = []
-        
-        for filepath in list(self.editors.keys()):
-            if is_directory:
-                # Close all files within the deleted directory
-                if filepath.startswith(path + os.sep):
-                    tabs_to_close.append(filepath)
-            else:
-                # Close the exact file
-                if filepath == path:
-                    tabs_to_close.append(filepath)
+        # Don't let a pending Save All write recreate the deleted file
+        self._finish_background_saves()
+        # Paths under it may resolve differently from now on
+        clear_realpath_cache()
+        
+        if is_directory:
+            # Close all files within the deleted directory
+            tabs_to_close.extend(self._dir_to_files.get(path, ()))
+        elif path in self.editors:
+            # Close the exact file
+            tabs_to_close.append(path)
         
         # Close tabs in reverse order to avoid index shifting issues
         for filepath in tabs_to_close:
             if filepath in self.editors:
-                editor = self.editors[filepath]
-                # Find the tab index
-                for i in range(self.count()):
-                    if self.widget(i) == editor:
-                        # Force close without save prompt (file is already deleted)
-                        del self.editors[filepath]
-                        self.removeTab(i)
-                        self.file_closed.emit(filepath)
-                        break
+                i = self.indexOf(self.editors[filepath])
+                if i >= 0:
+                    # Force close without save prompt (file is already deleted)
+                    self._remove_editor(filepath)
+                    self.removeTab(i)
+                    self.file_closed.emit(filepath)
 
     def handle_item_renamed(self, old_path: str, new_path: str):
         """Handle a file or folder being renamed - update affected tabs.
@@ -1063,38 +1370,48 @@ class EditorTabs(QTabWidget):
         For files: update the tab's filepath reference.
         For directories: update all tabs for files within that directory.
         """
-        old_path = os.path.abspath(old_path)
-        new_path = os.path.abspath(new_path)
+        old_path = abspath(old_path)
+        new_path = abspath(new_path)
+        # Don't let a pending Save All write recreate the old path
+        self._finish_background_saves()
+        # Paths under either name may resolve differently from now on
+        clear_realpath_cache()
         
         paths_to_update = []
         
-        for filepath in list(self.editors.keys()):
-            if filepath == old_path:
-                # Exact file renamed
-                paths_to_update.append((filepath, new_path))
-            elif filepath.startswith(old_path + os.sep):
-                # File inside renamed directory
-                relative = filepath[len(old_path):]
-                new_filepath = new_path + relative
-                paths_to_update.append((filepath, new_filepath))
-        
-        # Update editor references and tab titles
-        for old_filepath, new_filepath in paths_to_update:
-            if old_filepath in self.editors:
-                editor = self.editors[old_filepath]
-                # Update the editors dict
-                del self.editors[old_filepath]
-                self.editors[new_filepath] = editor
-                
-                # Update the editor's file_path attribute
-                editor.file_path = new_filepath
-                
-                # Update tab title and tooltip
-                for i in range(self.count()):
-                    if self.widget(i) == editor:
-                        self.setTabText(i, os.path.basename(new_filepath))
+        if old_path in self.editors:
+            # Exact file renamed
+            paths_to_update.append((old_path, new_path))
+        for filepath in self._dir_to_files.get(old_path, ()):
+            # File inside renamed directory
+            new_filepath = os.path.join(new_path, os.path.relpath(filepath, old_path))
+            paths_to_update.append((filepath, new_filepath))
+        
+        if not paths_to_update:
+            return
+        
+        # Update editor references and tab titles, laying out the tab
+        # bar once for the whole batch rather than once per tab
+        self.setUpdatesEnabled(False)
+        try:
+            for old_filepath, new_filepath in paths_to_update:
+                if old_filepath in self.editors:
+                    editor = self.editors[old_filepath]
+                    # Update the editors dict
+                    self._remove_editor(old_filepath)
+                    self._add_editor(new_filepath, editor)
+                    
+                    # Update the editor's file_path attribute
+                    editor.file_path = new_filepath
+                    
+                    # Update tab title and tooltip
+                    i = self.indexOf(editor)
+                    if i >= 0:
+                        # Keys are abspath-normalized, so os.sep is the only separator
+                        self.setTabText(i, new_filepath.rpartition(os.sep)[2])
                         self.setTabToolTip(i, new_filepath)
-                        break
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 def validate_diagram_font(font: QFont) -> tuple[bool, str]:
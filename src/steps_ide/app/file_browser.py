@@ -5,8 +5,9 @@ Full-featured file/folder browser with bookmarks, context menu, and navigation
 
 import os
 import shutil
+from collections import deque
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Deque, Dict
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
@@ -15,14 +16,80 @@ from PyQt6.QtWidgets import (
     QSplitter, QHeaderView, QAbstractItemView, QToolBar, QComboBox
 )
 from PyQt6.QtCore import (
-    Qt, QDir, QModelIndex, pyqtSignal, QFileInfo, QSize, QMimeData, QTimer
+    Qt, QDir, QModelIndex, pyqtSignal, QFileInfo, QSize, QMimeData, QTimer,
+    QObject, QRunnable, QThreadPool, QCoreApplication
 )
 from PyQt6.QtGui import (
     QIcon, QAction, QKeySequence, QFileSystemModel,
-    QDragEnterEvent, QDropEvent
+    QDragEnterEvent, QDropEvent, QShowEvent
 )
 
 from steps_ide.app.settings import SettingsManager
+from steps_ide.app.paths import abspath
+
+
+_shared_model: Optional[QFileSystemModel] = None
+
+
+def _get_model() -> QFileSystemModel:
+    """Return the file system model shared by every file browser.
+    
+    One model means one set of directory watches and one stat cache per
+    process, however many browsers are open. It is owned by the
+    application so it outlives any single browser.
+    """
+    global _shared_model
+    if _shared_model is None:
+        _shared_model = QFileSystemModel(QCoreApplication.instance())
+        _shared_model.setReadOnly(False)
+    return _shared_model
+
+
+class _ExistsSignals(QObject):
+    """Signals for a background existence check, delivered on the GUI thread"""
+    
+    finished = pyqtSignal(int, object)  # check token, set of missing paths
+
+
+class _ExistsTask(QRunnable):
+    """Checks which of a list of paths are missing on a pool thread"""
+    
+    def __init__(self, token: int, paths: List[str]):
+        super().__init__()
+        self.setAutoDelete(False)  # BookmarksWidget keeps it until it reports
+        self.token = token
+        self.paths = paths
+        self.signals = _ExistsSignals()
+    
+    def run(self):
+        missing = {path for path in self.paths if not os.path.exists(path)}
+        self.signals.finished.emit(self.token, missing)
+
+
+class _DeleteSignals(QObject):
+    """Signals for a background folder delete, delivered on the GUI thread"""
+    
+    finished = pyqtSignal(str, str)  # folder path, error message ("" on success)
+
+
+class _DeleteTask(QRunnable):
+    """Deletes a folder tree on a pool thread"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.setAutoDelete(False)  # FileBrowserWidget keeps it until it reports
+        self.path = path
+        self.signals = _DeleteSignals()
+    
+    def run(self):
+        error = ""
+        try:
+            shutil.rmtree(self.path)
+        except Exception as e:
+            # Anything uncaught would skip the report and leave the path
+            # marked as still being deleted
+            error = str(e) or type(e).__name__
+        self.signals.finished.emit(self.path, error)
 
 
 class BookmarksWidget(QWidget):
@@ -34,6 +101,12 @@ class BookmarksWidget(QWidget):
     def __init__(self, settings: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings = settings
+        # Loading settings updates this object in place, so it stays current
+        self._fb_settings = settings.settings.file_browser
+        # List items by bookmarked path, for O(1) membership tests
+        self._items: Dict[str, QListWidgetItem] = {}
+        self._exists_task: Optional[_ExistsTask] = None
+        self._exists_token = 0
         self._setup_ui()
         self._load_bookmarks()
     
@@ -64,19 +137,57 @@ class BookmarksWidget(QWidget):
         layout.addWidget(self.list_widget)
     
     def _load_bookmarks(self):
-        """Load bookmarks from settings"""
+        """Load bookmarks from settings.
+        
+        Bookmarks whose folders no longer exist are hidden once a
+        background check finds them, so slow or offline drives don't
+        block startup.
+        """
         self.list_widget.clear()
-        for path in self.settings.settings.file_browser.bookmarks:
-            if os.path.exists(path):
-                item = QListWidgetItem(os.path.basename(path) or path)
-                item.setData(Qt.ItemDataRole.UserRole, path)
-                item.setToolTip(path)
-                self.list_widget.addItem(item)
+        self._items.clear()
+        paths = list(self._fb_settings.bookmarks)
+        for path in paths:
+            self._add_item(path)
+        if paths:
+            self._exists_token += 1
+            self._exists_task = _ExistsTask(self._exists_token, paths)
+            self._exists_task.signals.finished.connect(self._on_exists_checked)
+            QThreadPool.globalInstance().start(self._exists_task)
+    
+    def _add_item(self, path: str):
+        """Append a list item for a bookmarked path"""
+        item = QListWidgetItem(os.path.basename(path) or path)
+        item.setData(Qt.ItemDataRole.UserRole, path)
+        item.setToolTip(path)
+        self.list_widget.addItem(item)
+        self._items[path] = item
+    
+    def _on_exists_checked(self, token: int, missing: set):
+        """Hide bookmarks the background check found missing"""
+        if token != self._exists_token:
+            return
+        self._exists_task = None
+        for path in missing:
+            item = self._items.get(path)
+            if item is not None:
+                item.setHidden(True)
+    
+    def contains(self, path: str) -> bool:
+        """Check whether path is bookmarked"""
+        return path in self._items
     
     def add_bookmark(self, path: str):
         """Add a new bookmark"""
+        if path in self._items:
+            return
         self.settings.add_bookmark(path)
-        self._load_bookmarks()
+        self._add_item(path)
+    
+    def remove_bookmark(self, path: str):
+        """Remove the bookmark for path, if any"""
+        item = self._items.get(path)
+        if item is not None:
+            self._remove_bookmark(item)
     
     def _on_item_clicked(self, item: QListWidgetItem):
         """Handle bookmark item click"""
@@ -106,7 +217,8 @@ class BookmarksWidget(QWidget):
         """Remove a bookmark"""
         path = item.data(Qt.ItemDataRole.UserRole)
         self.settings.remove_bookmark(path)
-        self._load_bookmarks()
+        self._items.pop(path, None)
+        self.list_widget.takeItem(self.list_widget.row(item))
         self.bookmark_removed.emit(path)
 
 
@@ -122,13 +234,29 @@ class FileBrowserWidget(QWidget):
     def __init__(self, settings: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings = settings
+        # Loading settings updates this object in place, so it stays current
+        self._fb_settings = settings.settings.file_browser
         self.current_root = ""
-        
-        # Timer for distinguishing single vs double clicks
-        self._click_timer = QTimer(self)
-        self._click_timer.setSingleShot(True)
-        self._click_timer.timeout.connect(self._on_single_click_timeout)
-        self._pending_click_index = None
+        # The model isn't pointed at current_root until the browser is
+        # first shown, so a hidden browser never scans the disk
+        self._root_pending = False
+        
+        # Coalesces bursts of create/delete/rename into one rescan
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._refresh_now)
+        self._reload_requested = False
+        
+        # Folder deletes still running on the thread pool, by path
+        self._delete_tasks: Dict[str, _DeleteTask] = {}
+        
+        # Writes settings once browsing settles rather than per folder;
+        # MainWindow saves everything again on close
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.settings.save)
         
         self._setup_ui()
         self._setup_connections()
@@ -214,14 +342,13 @@ class FileBrowserWidget(QWidget):
         self.hidden_toggle.setText("👁")
         self.hidden_toggle.setToolTip("Toggle Hidden Files")
         self.hidden_toggle.setCheckable(True)
-        self.hidden_toggle.setChecked(self.settings.settings.file_browser.show_hidden_files)
+        self.hidden_toggle.setChecked(self._fb_settings.show_hidden_files)
         tree_header_layout.addWidget(self.hidden_toggle)
         
         tree_layout.addWidget(tree_header)
         
         # File system model
-        self.model = QFileSystemModel()
-        self.model.setReadOnly(False)
+        self.model = _get_model()
         self._update_filters()
         
         # Tree view
@@ -230,6 +357,8 @@ class FileBrowserWidget(QWidget):
         self.tree.setHeaderHidden(True)
         self.tree.setAnimated(True)
         self.tree.setIndentation(16)
+        # Single clicks toggle folders; double clicks navigate into them
+        self.tree.setExpandsOnDoubleClick(False)
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.tree.setDragEnabled(True)
@@ -250,7 +379,8 @@ class FileBrowserWidget(QWidget):
         layout.addWidget(splitter)
         
         # History for navigation
-        self.history: List[str] = []
+        # Oldest entries fall off once the cap is reached
+        self.history: Deque[str] = deque(maxlen=100)
         self.history_index = -1
     
     def _setup_connections(self):
@@ -265,7 +395,7 @@ class FileBrowserWidget(QWidget):
         self.forward_btn.clicked.connect(self._go_forward)
         self.up_btn.clicked.connect(self._go_up)
         self.home_btn.clicked.connect(self._go_home)
-        self.refresh_btn.clicked.connect(self._refresh)
+        self.refresh_btn.clicked.connect(self._reload)
         self.bookmark_btn.clicked.connect(self._bookmark_current_folder)
         
         self.hidden_toggle.toggled.connect(self._toggle_hidden_files)
@@ -274,7 +404,7 @@ class FileBrowserWidget(QWidget):
     
     def _load_initial_directory(self):
         """Load the initial directory"""
-        last_dir = self.settings.settings.file_browser.last_directory
+        last_dir = self._fb_settings.last_directory
         if last_dir and os.path.exists(last_dir):
             self.navigate_to(last_dir)
         else:
@@ -282,7 +412,7 @@ class FileBrowserWidget(QWidget):
     
     def _update_filters(self):
         """Update file filters based on settings"""
-        if self.settings.settings.file_browser.show_hidden_files:
+        if self._fb_settings.show_hidden_files:
             self.model.setFilter(
                 QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot | 
                 QDir.Filter.Hidden | QDir.Filter.AllDirs
@@ -295,7 +425,7 @@ class FileBrowserWidget(QWidget):
     
     def navigate_to(self, path: str, add_to_history: bool = True):
         """Navigate to a directory"""
-        path = os.path.abspath(path)
+        path = abspath(path)
         if not os.path.exists(path):
             return
         
@@ -303,16 +433,18 @@ class FileBrowserWidget(QWidget):
             path = os.path.dirname(path)
         
         self.current_root = path
-        self.model.setRootPath(path)
-        self.tree.setRootIndex(self.model.index(path))
+        if self.isVisible():
+            self._apply_root()
+        else:
+            self._root_pending = True
         self.path_bar.setText(path)
         self.folder_label.setText(os.path.basename(path) or path)
         
         # Update history
         if add_to_history:
             # Remove forward history
-            if self.history_index < len(self.history) - 1:
-                self.history = self.history[:self.history_index + 1]
+            while len(self.history) > self.history_index + 1:
+                self.history.pop()
             self.history.append(path)
             self.history_index = len(self.history) - 1
         
@@ -321,40 +453,21 @@ class FileBrowserWidget(QWidget):
         self.forward_btn.setEnabled(self.history_index < len(self.history) - 1)
         
         # Save to settings
-        self.settings.settings.file_browser.last_directory = path
-        self.settings.save()
+        self._fb_settings.last_directory = path
+        self._save_timer.start()
         
         self.folder_changed.emit(path)
     
     def _on_item_clicked(self, index: QModelIndex):
-        """Handle click on item - delay to check for double-click"""
-        path = self.model.filePath(index)
-        if os.path.isdir(path):
-            # Store the index and start timer - if double-click comes, timer is cancelled
-            self._pending_click_index = index
-            self._click_timer.start(250)  # 250ms delay to wait for potential double-click
-    
-    def _on_single_click_timeout(self):
-        """Called when single-click timer expires (no double-click detected)"""
-        if self._pending_click_index is not None:
-            index = self._pending_click_index
-            self._pending_click_index = None
-            path = self.model.filePath(index)
-            if os.path.isdir(path):
-                # Toggle expand/collapse for folders
-                if self.tree.isExpanded(index):
-                    self.tree.collapse(index)
-                else:
-                    self.tree.expand(index)
+        """Handle click on item - toggle expand/collapse for folders"""
+        # The model already knows which entries are folders; no need to stat
+        if self.model.isDir(index):
+            self.tree.setExpanded(index, not self.tree.isExpanded(index))
     
     def _on_item_double_clicked(self, index: QModelIndex):
         """Handle double-click on item"""
-        # Cancel any pending single-click action
-        self._click_timer.stop()
-        self._pending_click_index = None
-        
         path = self.model.filePath(index)
-        if os.path.isdir(path):
+        if self.model.isDir(index):
             self.navigate_to(path)
         else:
             self.file_opened.emit(path)
@@ -362,7 +475,14 @@ class FileBrowserWidget(QWidget):
     def _on_path_entered(self):
         """Handle path entered in path bar"""
         path = self.path_bar.text()
-        if os.path.exists(path):
+        # Reuse what the model already knows about the path when it can
+        index = self.model.index(path)
+        if index.isValid():
+            if self.model.isDir(index):
+                self.navigate_to(path)
+            else:
+                self.file_opened.emit(path)
+        elif os.path.exists(path):
             if os.path.isfile(path):
                 self.file_opened.emit(path)
             else:
@@ -399,17 +519,45 @@ class FileBrowserWidget(QWidget):
             self.bookmarks.add_bookmark(self.current_root)
     
     def _refresh(self):
+        """Schedule a refresh of the current directory"""
+        self._refresh_timer.start()
+    
+    def _reload(self):
+        """Schedule a full rescan of the current directory"""
+        self._reload_requested = True
+        self._refresh_timer.start()
+    
+    def _refresh_now(self):
         """Refresh the current directory"""
-        if self.current_root:
+        reload_requested = self._reload_requested
+        self._reload_requested = False
+        if not self.current_root or self._root_pending:
+            return
+        if reload_requested:
             # Force refresh by re-setting root
             self.model.setRootPath("")
-            self.model.setRootPath(self.current_root)
-            self.tree.setRootIndex(self.model.index(self.current_root))
+        elif self.model.rootPath() == self.current_root:
+            # The model's own watcher already picks up creates,
+            # renames and deletes under its root
+            return
+        self._apply_root()
+    
+    def _apply_root(self):
+        """Point the model and tree at current_root"""
+        self._root_pending = False
+        self.model.setRootPath(self.current_root)
+        self.tree.setRootIndex(self.model.index(self.current_root))
+    
+    def showEvent(self, event: QShowEvent):
+        """Start populating the tree the first time it is needed"""
+        if self._root_pending:
+            self._apply_root()
+        super().showEvent(event)
     
     def _toggle_hidden_files(self, show: bool):
         """Toggle display of hidden files"""
-        self.settings.settings.file_browser.show_hidden_files = show
-        self.settings.save()
+        self._fb_settings.show_hidden_files = show
+        self._save_timer.start()
         self._update_filters()
         self._refresh()
     
@@ -420,7 +568,7 @@ class FileBrowserWidget(QWidget):
         
         if index.isValid():
             path = self.model.filePath(index)
-            is_dir = os.path.isdir(path)
+            is_dir = self.model.isDir(index)
             
             # Open
             if is_dir:
@@ -462,10 +610,10 @@ class FileBrowserWidget(QWidget):
                 menu.addSeparator()
                 
                 # Bookmark
-                if path in self.settings.settings.file_browser.bookmarks:
+                if self.bookmarks.contains(path):
                     bookmark_action = menu.addAction("Remove Bookmark")
                     bookmark_action.triggered.connect(
-                        lambda: self.settings.remove_bookmark(path)
+                        lambda: self.bookmarks.remove_bookmark(path)
                     )
                 else:
                     bookmark_action = menu.addAction("Add to Bookmarks")
@@ -483,7 +631,7 @@ class FileBrowserWidget(QWidget):
             menu.addSeparator()
             
             refresh_action = menu.addAction("Refresh")
-            refresh_action.triggered.connect(self._refresh)
+            refresh_action.triggered.connect(self._reload)
         
         menu.exec(self.tree.viewport().mapToGlobal(pos))
     
@@ -500,8 +648,8 @@ class FileBrowserWidget(QWidget):
         if ok and name:
             filepath = os.path.join(directory, name)
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write("")
+                # O_EXCL refuses to truncate a file that already exists
+                os.close(os.open(filepath, os.O_CREAT | os.O_WRONLY | os.O_EXCL, 0o666))
                 self._refresh()
                 self.file_created.emit(filepath)
                 self.file_opened.emit(filepath)
@@ -559,17 +707,33 @@ class FileBrowserWidget(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            if is_dir:
+                # Large trees can take a while; don't freeze the IDE
+                if path not in self._delete_tasks:
+                    task = self._delete_tasks[path] = _DeleteTask(path)
+                    task.signals.finished.connect(self._on_folder_deleted)
+                    QThreadPool.globalInstance().start(task)
+                return
             try:
-                if is_dir:
-                    shutil.rmtree(path)
-                else:
-                    os.remove(path)
+                os.remove(path)
                 self._refresh()
                 # Notify listeners about the deletion
                 self.item_deleted.emit(path, is_dir)
             except OSError as e:
                 QMessageBox.critical(self, "Error", f"Could not delete: {e}")
     
+    def _on_folder_deleted(self, path: str, error: str):
+        """Finish a background folder delete"""
+        self._delete_tasks.pop(path, None)
+        if error:
+            # Part of the tree may be gone, so show what is left
+            self._refresh()
+            QMessageBox.critical(self, "Error", f"Could not delete: {error}")
+            return
+        self._refresh()
+        # Notify listeners about the deletion
+        self.item_deleted.emit(path, True)
+    
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard"""
         from PyQt6.QtWidgets import QApplication
@@ -3,6 +3,7 @@ Main Window for Steps IDE
 The primary application window integrating all components
 """
 
+import functools
 import os
 import sys
 import subprocess
@@ -18,7 +19,7 @@ from PyQt6.QtWidgets import (
     QCheckBox, QPushButton, QDialogButtonBox, QTabWidget,
     QApplication, QTextBrowser
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QStringListModel
 from PyQt6.QtGui import (
     QAction, QKeySequence, QIcon, QCloseEvent, QFont, QFontDatabase, QTextCursor
 )
@@ -30,10 +31,48 @@ from steps_ide.app.editor import EditorTabs
 from steps_ide.app.terminal import TerminalWidget
 
 
+@functools.lru_cache(maxsize=1)
+def _monospace_fonts() -> tuple:
+    """Get the available monospace fonts, sorted.
+    
+    Checking every installed family is slow on systems with large font
+    collections, so the list is worked out once per session.
+    """
+    monospace_fonts = []
+    
+    # Common monospace fonts to always check/include
+    common = ["Consolas", "Courier New", "Monaco", "Menlo", "Ubuntu Mono", "DejaVu Sans Mono", "Monospace", "Hack", "Fira Code", "JetBrains Mono"]
+    
+    try:
+        # QFontDatabase methods are static in PyQt6
+        families = QFontDatabase.families()
+        
+        for family in families:
+            is_fixed = False
+            try:
+                is_fixed = QFontDatabase.isFixedPitch(family)
+            except:
+                pass
+                
+            if is_fixed or family in common or "Mono" in family or "Code" in family or "Term" in family:
+                if family not in monospace_fonts:
+                    monospace_fonts.append(family)
+    except Exception:
+        # Fallback if QFontDatabase fails completely
+        pass
+        
+    # Ensure we have at least some defaults if detection failed or returned nothing
+    if not monospace_fonts:
+        monospace_fonts = ["Monospace", "Courier New"]
+        
+    monospace_fonts.sort()
+    return tuple(monospace_fonts)
+
+
 class SettingsDialog(QDialog):
     """Settings dialog for configuring the IDE"""
     
-    settings_applied = pyqtSignal()  # Emitted when settings are applied
+    settings_applied = pyqtSignal(object)  # Emits the set of changed setting names
     
     def __init__(self, settings: SettingsManager, theme_manager: ThemeManager, parent=None):
         super().__init__(parent)
@@ -45,65 +84,68 @@ class SettingsDialog(QDialog):
         
         self._setup_ui()
     
-    def _get_monospace_fonts(self):
-        """Get a list of available monospace fonts"""
-        monospace_fonts = []
-        
-        # Common monospace fonts to always check/include
-        common = ["Consolas", "Courier New", "Monaco", "Menlo", "Ubuntu Mono", "DejaVu Sans Mono", "Monospace", "Hack", "Fira Code", "JetBrains Mono"]
-        
-        try:
-            # QFontDatabase methods are static in PyQt6
-            families = QFontDatabase.families()
-            
-            for family in families:
-                is_fixed = False
-                try:
-                    is_fixed = QFontDatabase.isFixedPitch(family)
-                except:
-                    pass
-                    
-                if is_fixed or family in common or "Mono" in family or "Code" in family or "Term" in family:
-                    if family not in monospace_fonts:
-                        monospace_fonts.append(family)
-        except Exception:
-            # Fallback if QFontDatabase fails completely
-            pass
-            
-        # Ensure we have at least some defaults if detection failed or returned nothing
-        if not monospace_fonts:
-            monospace_fonts = ["Monospace", "Courier New"]
-            
-        monospace_fonts.sort()
-        return monospace_fonts
-
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         
-        # Tab widget for different settings categories
-        tabs = QTabWidget()
+        # Tab widget for different settings categories. Only the Editor tab
+        # is filled in up front; the others are built the first time they
+        # are selected.
+        self.tabs = QTabWidget()
+        
+        # One list of fonts behind both font pickers
+        self._font_model = QStringListModel(list(_monospace_fonts()), self)
         
-        # Editor settings
         editor_tab = QWidget()
-        editor_layout = QFormLayout(editor_tab)
+        self._build_editor_tab(editor_tab)
+        self.tabs.addTab(editor_tab, "Editor")
+        self.tabs.addTab(QWidget(), "Appearance")
+        self.tabs.addTab(QWidget(), "Terminal")
         
-        # Get available fonts
-        fonts = self._get_monospace_fonts()
+        self._tab_builders = {
+            1: self._build_theme_tab,
+            2: self._build_terminal_tab,
+        }
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        
+        layout.addWidget(self.tabs)
+        
+        # Dialog buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok |
+            QDialogButtonBox.StandardButton.Cancel |
+            QDialogButtonBox.StandardButton.Apply
+        )
+        buttons.accepted.connect(self._save_and_close)
+        buttons.rejected.connect(self.reject)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
+        
+        layout.addWidget(buttons)
+    
+    def _on_tab_changed(self, index: int):
+        """Build a settings tab the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.tabs.widget(index))
+    
+    def _select_font(self, combo: QComboBox, family: str):
+        """Select family in a font picker, adding it to the shared list if missing"""
+        index = combo.findText(family)
+        if index < 0:
+            # If current font not in detected list, add it and select it
+            index = self._font_model.rowCount()
+            self._font_model.insertRows(index, 1)
+            self._font_model.setData(self._font_model.index(index), family)
+        combo.setCurrentIndex(index)
+    
+    def _build_editor_tab(self, editor_tab: QWidget):
+        """Fill in the Editor settings tab"""
+        editor_layout = QFormLayout(editor_tab)
         
         self.font_family = QComboBox()
         self.font_family.setEditable(False)  # Standard non-editable dropdown
-        self.font_family.addItems(fonts)
+        self.font_family.setModel(self._font_model)
+        self._select_font(self.font_family, self.settings.settings.editor.font_family)
         
-        # Set current font
-        current_font = self.settings.settings.editor.font_family
-        index = self.font_family.findText(current_font)
-        if index >= 0:
-            self.font_family.setCurrentIndex(index)
-        else:
-            # If current font not in detected list, add it and select it
-            self.font_family.addItem(current_font)
-            self.font_family.setCurrentIndex(self.font_family.count() - 1)
-            
         editor_layout.addRow("Font Family:", self.font_family)
         
         self.font_size = QSpinBox()
@@ -135,11 +177,9 @@ class SettingsDialog(QDialog):
         self.bracket_matching = QCheckBox("Auto-close brackets")
         self.bracket_matching.setChecked(self.settings.settings.editor.bracket_matching)
         editor_layout.addRow("", self.bracket_matching)
-        
-        tabs.addTab(editor_tab, "Editor")
-        
-        # Theme settings
-        theme_tab = QWidget()
+    
+    def _build_theme_tab(self, theme_tab: QWidget):
+        """Fill in the Appearance settings tab"""
         theme_layout = QFormLayout(theme_tab)
         
         self.theme_combo = QComboBox()
@@ -151,25 +191,16 @@ class SettingsDialog(QDialog):
                 self.theme_combo.setCurrentIndex(i)
                 break
         theme_layout.addRow("Theme:", self.theme_combo)
-        
-        tabs.addTab(theme_tab, "Appearance")
-        
-        # Terminal settings
-        terminal_tab = QWidget()
+    
+    def _build_terminal_tab(self, terminal_tab: QWidget):
+        """Fill in the Terminal settings tab"""
         terminal_layout = QFormLayout(terminal_tab)
         
         self.terminal_font = QComboBox()
         self.terminal_font.setEditable(False)
-        self.terminal_font.addItems(fonts)
+        self.terminal_font.setModel(self._font_model)
+        self._select_font(self.terminal_font, self.settings.settings.terminal.font_family)
         
-        current_term_font = self.settings.settings.terminal.font_family
-        term_index = self.terminal_font.findText(current_term_font)
-        if term_index >= 0:
-            self.terminal_font.setCurrentIndex(term_index)
-        else:
-            self.terminal_font.addItem(current_term_font)
-            self.terminal_font.setCurrentIndex(self.terminal_font.count() - 1)
-            
         terminal_layout.addRow("Font Family:", self.terminal_font)
         
         self.terminal_font_size = QSpinBox()
@@ -182,49 +213,56 @@ class SettingsDialog(QDialog):
         if self.settings.settings.terminal.position == "right":
             self.terminal_position.setCurrentIndex(1)
         terminal_layout.addRow("Position:", self.terminal_position)
-        
-        tabs.addTab(terminal_tab, "Terminal")
-        
-        layout.addWidget(tabs)
-        
-        # Dialog buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok |
-            QDialogButtonBox.StandardButton.Cancel |
-            QDialogButtonBox.StandardButton.Apply
-        )
-        buttons.accepted.connect(self._save_and_close)
-        buttons.rejected.connect(self.reject)
-        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
-        
-        layout.addWidget(buttons)
     
     def _apply(self):
         """Apply settings without closing"""
+        # Names of the settings that differ from before, so the window only
+        # refreshes what they affect. Editor settings use their field names,
+        # terminal ones are prefixed with "terminal_".
+        changed = set()
+        
         # Editor settings
-        self.settings.settings.editor.font_family = self.font_family.currentText()
-        self.settings.settings.editor.font_size = self.font_size.value()
-        self.settings.settings.editor.tab_width = self.tab_width.value()
-        self.settings.settings.editor.use_spaces = self.use_spaces.isChecked()
-        self.settings.settings.editor.show_line_numbers = self.show_line_numbers.isChecked()
-        self.settings.settings.editor.word_wrap = self.word_wrap.isChecked()
-        self.settings.settings.editor.highlight_current_line = self.highlight_line.isChecked()
-        self.settings.settings.editor.bracket_matching = self.bracket_matching.isChecked()
-        
-        # Theme
-        themes = self.theme_manager.get_available_themes()
-        theme_name = themes[self.theme_combo.currentIndex()]
-        self.theme_manager.set_theme(theme_name)
+        editor_values = {
+            "font_family": self.font_family.currentText(),
+            "font_size": self.font_size.value(),
+            "tab_width": self.tab_width.value(),
+            "use_spaces": self.use_spaces.isChecked(),
+            "show_line_numbers": self.show_line_numbers.isChecked(),
+            "word_wrap": self.word_wrap.isChecked(),
+            "highlight_current_line": self.highlight_line.isChecked(),
+            "bracket_matching": self.bracket_matching.isChecked(),
+        }
+        editor = self.settings.settings.editor
+        for name, value in editor_values.items():
+            if getattr(editor, name) != value:
+                setattr(editor, name, value)
+                changed.add(name)
+        
+        # Theme (tabs never opened can't have been changed)
+        if hasattr(self, 'theme_combo'):
+            themes = self.theme_manager.get_available_themes()
+            theme_name = themes[self.theme_combo.currentIndex()]
+            if theme_name != self.settings.settings.theme.current_theme:
+                self.theme_manager.set_theme(theme_name)
+                changed.add("theme")
         
         # Terminal settings
-        self.settings.settings.terminal.font_family = self.terminal_font.currentText()
-        self.settings.settings.terminal.font_size = self.terminal_font_size.value()
-        self.settings.settings.terminal.position = self.terminal_position.currentText().lower()
+        if hasattr(self, 'terminal_font'):
+            terminal_values = {
+                "font_family": self.terminal_font.currentText(),
+                "font_size": self.terminal_font_size.value(),
+                "position": self.terminal_position.currentText().lower(),
+            }
+            terminal = self.settings.settings.terminal
+            for name, value in terminal_values.items():
+                if getattr(terminal, name) != value:
+                    setattr(terminal, name, value)
+                    changed.add("terminal_" + name)
         
         self.settings.save()
         
         # Notify parent to refresh UI
-        self.settings_applied.emit()
+        self.settings_applied.emit(changed)
     
     def _save_and_close(self):
         """Save settings and close dialog"""
@@ -495,6 +533,7 @@ class StepsIDEMainWindow(QMainWindow):
         self.debug_panel.continue_clicked.connect(self._continue_debug)
         self.debug_panel.stop_clicked.connect(self._stop_debug)
         self.debug_panel.frame_selected.connect(self._on_frame_selected)
+        self.debug_dock.visibilityChanged.connect(self._on_debug_dock_visibility_changed)
     
     def _update_terminal_position(self):
         """Update terminal position based on settings"""
@@ -1233,30 +1272,41 @@ class StepsIDEMainWindow(QMainWindow):
     
     def _show_settings(self):
         dialog = SettingsDialog(self.settings, self.theme_manager, self)
+        # OK applies through settings_applied as well, so nothing more to do
+        # once the dialog closes
         dialog.settings_applied.connect(self._apply_settings)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Also refresh on OK
-            self._apply_settings()
+        dialog.exec()
     
-    def _apply_settings(self):
-        """Apply settings changes to UI"""
+    def _apply_settings(self, changed: Optional[set] = None):
+        """Apply settings changes to UI
+        
+        Args:
+            changed: Names of the settings that changed, as emitted by
+                SettingsDialog.settings_applied, or None to refresh everything
+        """
         theme = self.theme_manager.get_current_theme()
+        theme_changed = changed is None or "theme" in changed
         
-        # Update stylesheet
-        QApplication.instance().setStyleSheet(
-            self.theme_manager.get_current_stylesheet()
-        )
+        if theme_changed:
+            # Update stylesheet
+            QApplication.instance().setStyleSheet(
+                self.theme_manager.get_current_stylesheet()
+            )
+            self.editor_tabs.set_theme(theme)
         
-        # Update editor themes and settings
-        self.editor_tabs.set_theme(theme)
-        self.editor_tabs.refresh_settings()
+        # Update editor settings
+        self.editor_tabs.refresh_settings(changed)
         
         # Update terminal theme and settings
-        self.terminal.set_theme(theme)
-        self.terminal._apply_theme()  # Refresh terminal with new font settings
+        if theme_changed:
+            self.terminal.set_theme(theme)
+        if (theme_changed or "terminal_font_family" in changed
+                or "terminal_font_size" in changed):
+            self.terminal._apply_theme()  # Refresh terminal with new font settings
         
         # Update terminal position
-        self._update_terminal_position()
+        if changed is None or "terminal_position" in changed:
+            self._update_terminal_position()
         
         # Update theme menu checkmarks
         current = self.settings.settings.theme.current_theme
@@ -1298,6 +1348,11 @@ class StepsIDEMainWindow(QMainWindow):
         self.debug_dock.setVisible(not visible)
         self.toggle_debug_panel_action.setChecked(not visible)
     
+    def _on_debug_dock_visibility_changed(self, visible: bool):
+        """Only ask for call/return updates while the debug panel is shown."""
+        if self._debug_thread:
+            self._debug_thread.set_ui_wants_details(visible)
+    
     def _set_terminal_position(self, position: str):
         self.settings.settings.terminal.position = position
         self.settings.save()
@@ -1394,7 +1449,7 @@ class StepsIDEMainWindow(QMainWindow):
     
     def _set_theme(self, theme_name: str):
         self.theme_manager.set_theme(theme_name)
-        self._apply_settings()
+        self._apply_settings({"theme"})
 
     def _show_diagram(self):
         """Show project diagram for the current project"""
@@ -1462,6 +1517,7 @@ class StepsIDEMainWindow(QMainWindow):
                 return
 
         # Load project and generate diagram
+        self.editor_tabs.wait_for_saves()
         try:
             building, environment, errors = load_project(project_path)
 
@@ -1514,7 +1570,8 @@ class StepsIDEMainWindow(QMainWindow):
         if not self.terminal_container.isVisible():
             self._toggle_terminal()
         
-        # Run in terminal
+        # Run in terminal, once Save All's writes have landed
+        self.editor_tabs.wait_for_saves()
         self.terminal.run_steps_file(filepath)
     
     def _check_file_syntax(self):
@@ -1627,6 +1684,7 @@ class StepsIDEMainWindow(QMainWindow):
             self.terminal.write_output("-" * 40 + "\n")
             
             # Load the project to check for errors
+            self.editor_tabs.wait_for_saves()
             building, env, errors = load_project(project_path)
             
             if errors:
@@ -1731,11 +1789,21 @@ class StepsIDEMainWindow(QMainWindow):
         # Collect breakpoints from all open editors
         breakpoints = self.editor_tabs.get_all_breakpoints()
         
+        # The debug thread loads the project from disk
+        self.editor_tabs.wait_for_saves()
+        
         self._debug_thread = DebugThread(filepath, breakpoints, self)
-        self._debug_thread.debug_event.connect(self._on_debug_event)
-        self._debug_thread.finished_signal.connect(self._on_debug_finished)
-        self._debug_thread.output_signal.connect(self._on_debug_output)
-        self._debug_thread.input_request_signal.connect(self._on_input_request)
+        self._debug_thread.set_ui_wants_details(self.debug_dock.isVisible())
+        # These are only ever emitted from the debug thread, so queue them
+        # explicitly rather than leave Qt to decide on every emit
+        queued = Qt.ConnectionType.QueuedConnection
+        self._debug_thread.debug_event.connect(self._on_debug_events, queued)
+        self._debug_thread.finished_signal.connect(self._on_debug_finished, queued)
+        self._debug_thread.output_signal.connect(self._on_debug_output, queued)
+        self._debug_thread.input_request_signal.connect(self._on_input_request, queued)
+        # The thread is parented to the window, so without this every
+        # finished session would stay alive until the IDE closes
+        self._debug_thread.finished.connect(self._debug_thread.deleteLater)
         self._debug_thread.start()
         
         self.statusbar.showMessage("Debugging started...", 3000)
@@ -1785,6 +1853,15 @@ class StepsIDEMainWindow(QMainWindow):
                     else:
                         self._debug_thread.remove_breakpoint(filepath, line)
 
+    def _on_debug_events(self, events):
+        """Handle a batch of events from the debug thread."""
+        # Each stepping event redraws the same views, so only the latest
+        # one in the batch needs showing
+        for event in reversed(events):
+            if event.event_type in ('paused', 'breakpoint', 'call', 'return'):
+                self._on_debug_event(event)
+                break
+    
     def _on_debug_event(self, event):
         """Handle event from debug thread."""
         if event.event_type in ('paused', 'breakpoint', 'call', 'return'):
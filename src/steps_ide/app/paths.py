@@ -0,0 +1,28 @@
+"""
+Path helpers for Steps IDE
+Cached path normalization shared by the editor tabs and the file browser
+"""
+
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=1024)
+def abspath(path: str) -> str:
+    """Return os.path.abspath(path), cached.
+
+    The IDE process never changes its working directory, so a relative
+    path always normalizes the same way.
+    """
+    return os.path.abspath(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def realpath(path: str) -> str:
+    """Return os.path.realpath(path), cached until clear_realpath_cache()."""
+    return os.path.realpath(path)
+
+
+def clear_realpath_cache():
+    """Forget resolved paths, after files or folders are renamed or deleted."""
+    realpath.cache_clear()
@@ -3,6 +3,8 @@ Steps Language Syntax Highlighter for PyQt6
 Provides syntax highlighting for the Steps programming language
 """
 
+import re
+
 from PyQt6.QtCore import QRegularExpression
 from PyQt6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
 from typing import Dict, List, Tuple
@@ -89,6 +91,36 @@ STEPS_COMPARISON_OPERATORS = [
     'modulo'
 ]
 
+# Block comment delimiters, shared by every highlighter and block
+_COMMENT_START = QRegularExpression(r'note block:')
+_COMMENT_END = QRegularExpression(r'end note')
+
+# Leading run of plain characters in a rule pattern
+_LITERAL_PREFIX = re.compile(r'[A-Za-z:"\'/#]+')
+
+
+def _required_literal(pattern: str) -> str:
+    """Return text that every match of pattern must contain, or "" if unsure"""
+    if pattern.startswith(r'\b'):
+        pattern = pattern[2:]
+    # An alternative at the top level need not contain the prefix
+    depth = 0
+    for char in pattern:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return ""
+    match = _LITERAL_PREFIX.match(pattern)
+    if not match:
+        return ""
+    literal = match.group()
+    # A quantifier after the run makes its last character optional
+    if pattern[len(literal):len(literal) + 1] in ('?', '*', '{'):
+        literal = literal[:-1]
+    return literal
+
 
 class StepsHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for the Steps programming language"""
@@ -97,7 +129,8 @@ class StepsHighlighter(QSyntaxHighlighter):
         super().__init__(parent)
         self.theme = theme
         self._formats: Dict[str, QTextCharFormat] = {}
-        self._rules: List[Tuple[QRegularExpression, str]] = []
+        # (pattern, format name, text a match must contain)
+        self._rules: List[Tuple[QRegularExpression, str, str]] = []
         
         self._setup_formats()
         self._setup_rules()
@@ -266,11 +299,20 @@ class StepsHighlighter(QSyntaxHighlighter):
         
         # end note for block comments
         self._rules.append((QRegularExpression(r'\bend note\b'), 'comment'))
+        
+        # Most rules are a keyword, so a line without that keyword can skip
+        # the regex entirely
+        self._rules = [
+            (pattern, format_name, _required_literal(pattern.pattern()))
+            for pattern, format_name in self._rules
+        ]
     
     def highlightBlock(self, text: str):
         """Highlight a single block of text"""
         # Apply regular rules
-        for pattern, format_name in self._rules:
+        for pattern, format_name, literal in self._rules:
+            if literal not in text:
+                continue
             iterator = pattern.globalMatch(text)
             while iterator.hasNext():
                 match = iterator.next()
@@ -283,13 +325,16 @@ class StepsHighlighter(QSyntaxHighlighter):
     
     def _handle_multiline_comments(self, text: str):
         """Handle multi-line block comments"""
-        comment_start = QRegularExpression(r'note block:')
-        comment_end = QRegularExpression(r'end note')
+        comment_start = _COMMENT_START
+        comment_end = _COMMENT_END
         
         self.setCurrentBlockState(0)
         
         start_index = 0
         if self.previousBlockState() != 1:
+            if 'note block:' not in text:
+                # Most lines: nothing opens a comment here
+                return
             match = comment_start.match(text)
             if match.hasMatch():
                 start_index = match.capturedStart()
@@ -323,7 +368,8 @@ class GenericHighlighter(QSyntaxHighlighter):
         self.theme = theme
         self.language = language.lower()
         self._formats: Dict[str, QTextCharFormat] = {}
-        self._rules: List[Tuple[QRegularExpression, str]] = []
+        # (pattern, format name, text a match must contain)
+        self._rules: List[Tuple[QRegularExpression, str, str]] = []
         
         self._setup_formats()
         self._setup_rules()
@@ -379,10 +425,17 @@ class GenericHighlighter(QSyntaxHighlighter):
         # Comments (common styles)  
         self._rules.append((QRegularExpression(r'//[^\n]*'), 'comment'))
         self._rules.append((QRegularExpression(r'#[^\n]*'), 'comment'))
+        
+        self._rules = [
+            (pattern, format_name, _required_literal(pattern.pattern()))
+            for pattern, format_name in self._rules
+        ]
     
     def highlightBlock(self, text: str):
         """Highlight a single block of text"""
-        for pattern, format_name in self._rules:
+        for pattern, format_name, literal in self._rules:
+            if literal not in text:
+                continue
             iterator = pattern.globalMatch(text)
             while iterator.hasNext():
                 match = iterator.next()
@@ -7,13 +7,6 @@ Based on the EZ IDE codebase
 import sys
 import os
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QIcon
-
-from steps_ide.app.main_window import StepsIDEMainWindow
-from steps_ide.app.settings import SettingsManager
-
 
 def main():
     """Main entry point for the Steps IDE"""
@@ -28,6 +21,15 @@ def main():
         except ImportError as e:
             print(f"Error: Could not import steps interpreter: {e}")
             sys.exit(1)
+    
+    # Qt and the IDE modules are imported here so --cli runs don't pay for
+    # them. main_window pulls in QtWebEngine, which has to be imported before
+    # the QApplication is created.
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QIcon
+    
+    from steps_ide.app.main_window import StepsIDEMainWindow
+    from steps_ide.app.settings import SettingsManager
             
     # Enable high DPI scaling
     app = QApplication(sys.argv)
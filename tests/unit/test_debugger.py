@@ -1,15 +1,18 @@
 """Unit tests for the Steps Debugger."""
 
+import threading
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, call
 
-from steps.debugger import DebugInterpreter, DebugMode, DebugEvent
+from steps.debugger import DebugInterpreter, DebugMode, DebugEvent, DebuggerStopped
 from steps.environment import Environment
 from steps.ast_nodes import (
     BuildingNode, StepNode, DisplayStatement, SourceLocation,
     SetStatement, ExpressionNode, NumberLiteral
 )
+from steps.errors import StepsError
 from steps.types import StepsNumber
 
 class TestDebugger:
@@ -91,3 +94,67 @@ class TestDebugger:
         # Return to depth 4
         debugger._call_depth = 4
         assert debugger._should_pause(stmt) is True
+
+    def test_safe_point_hook_runs_before_statement(self, debugger):
+        path = Path("test.steps")
+        debugger.set_mode(DebugMode.RUN_TO_BREAKPOINT)
+        # A hook that adds a breakpoint is seen by the pause check that follows
+        hook = Mock(side_effect=lambda: debugger.add_breakpoint(path, 5))
+        debugger.set_safe_point_hook(hook)
+        # Stop at the pause so the dummy statement isn't executed
+        debugger._wait_for_resume = Mock(side_effect=debugger.stop)
+        
+        with pytest.raises(DebuggerStopped):
+            debugger.execute_statement(self.create_dummy_stmt(5))
+        
+        hook.assert_called_once_with()
+        debugger._wait_for_resume.assert_called_once_with()
+
+    def test_stop_unwinds_running_program(self, debugger):
+        debugger.set_mode(DebugMode.RUN_TO_BREAKPOINT)
+        debugger.stop()
+        with pytest.raises(DebuggerStopped):
+            debugger.execute_statement(self.create_dummy_stmt(5))
+
+    def test_resume_sets_mode_while_running(self, debugger):
+        debugger.set_mode(DebugMode.RUN_TO_BREAKPOINT)
+        # Stepping during Continue pauses at the next statement
+        debugger.resume(DebugMode.STEP_INTO)
+        assert debugger.get_mode() == DebugMode.STEP_INTO
+        assert debugger._should_pause(self.create_dummy_stmt(5))
+
+    def test_resume_during_pause_event_is_not_lost(self, debugger, mock_callback):
+        debugger._create_snapshot = Mock()
+        debugger.set_mode(DebugMode.STEP_INTO)
+        # The UI answers the pause before the interpreter starts waiting
+        mock_callback.side_effect = lambda event: debugger.resume(DebugMode.STEP_INTO)
+        stmt = self.create_dummy_stmt(5)
+        
+        def run_statement():
+            # Only getting past the pause matters, not running the statement
+            try:
+                debugger.execute_statement(stmt)
+            except Exception:
+                pass
+        
+        waiter = threading.Thread(target=run_statement, daemon=True)
+        waiter.start()
+        waiter.join(2)
+        alive = waiter.is_alive()
+        debugger.stop()
+        assert not alive
+
+    def test_wait_returns_after_earlier_stop(self, debugger):
+        # A stop between execute_statement's check and the wait isn't lost
+        debugger._stop_requested = True
+        debugger._wait_for_resume()
+
+    def test_call_events_can_be_skipped_while_running(self, debugger, mock_callback):
+        debugger._create_snapshot = Mock()
+        debugger.set_mode(DebugMode.RUN_TO_BREAKPOINT)
+        debugger.set_call_events_while_running(False)
+        debugger._emit_event('paused')
+        with pytest.raises(StepsError):
+            debugger.call_step("missing_step", [])
+        # Only the explicit pause was reported
+        assert mock_callback.call_count == 1
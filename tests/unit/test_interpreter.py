@@ -330,6 +330,15 @@ class TestArithmeticExpressions:
         assert result.success
         assert "20" in result.output_lines[0]
 
+    def test_chained_left_associative(self):
+        result = run("""building: test
+    display 10 - 3 - 2 + 1
+    display 100 / 5 / 2 * 3
+""")
+        assert result.success
+        assert result.output_lines[0] == "6\n"
+        assert result.output_lines[1] == "30\n"
+
 
 class TestComparisonExpressions:
     """Tests for comparison expressions."""
@@ -412,6 +421,18 @@ class TestBooleanExpressions:
         assert result.success
         assert result.output_lines[0] == "yes\n"
 
+    def test_chained_and_or(self):
+        result = run("""building: test
+    if true and true and false
+        display "yes"
+    otherwise
+        display "no"
+    if false or false or true
+        display "yes"
+""")
+        assert result.success
+        assert result.output_lines == ["no\n", "yes\n"]
+
     def test_not(self):
         result = run("""building: test
     if not false
@@ -431,6 +452,13 @@ class TestTextOperations:
         assert result.success
         assert result.output_lines[0] == "Hello, World!\n"
 
+    def test_added_to_chain(self):
+        result = run("""building: test
+    display "a" added to 1 added to true added to "b" added to 2.5
+""")
+        assert result.success
+        assert result.output_lines[0] == "a1trueb2.5\n"
+
     def test_length_of(self):
         result = run("""building: test
     display length of "Hello"
@@ -583,6 +611,20 @@ class TestErrorHandling:
         assert not result.success
         assert result.error is not None
 
+    def test_error_in_operator_chain_points_at_failing_operator(self):
+        # "    display 8 / 2 / 0": the second "/" is at column 19
+        result = run("""building: test
+    display 8 / 2 / 0
+""")
+        assert not result.success
+        assert result.error.column == 19
+
+        result = run("""building: test
+    display 1 + 2 + "x" + 4
+""")
+        assert not result.success
+        assert result.error.column == 19
+
     def test_index_out_of_bounds(self):
         result = run("""building: test
     set items to [1, 2, 3]
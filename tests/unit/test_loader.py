@@ -0,0 +1,51 @@
+"""Unit tests for the Steps project loader."""
+
+import os
+import shutil
+from pathlib import Path
+
+from steps.loader import load_project
+
+
+PROJECTS_DIR = Path(__file__).resolve().parents[2] / "projects"
+
+
+class TestParseCache:
+    """Tests for reusing parsed files across project loads."""
+    
+    def copy_project(self, tmp_path: Path) -> Path:
+        project = tmp_path / "tip_calculator"
+        shutil.copytree(PROJECTS_DIR / "tip_calculator", project)
+        return project
+    
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        project = self.copy_project(tmp_path)
+        building1, env1, errors1 = load_project(project)
+        building2, env2, errors2 = load_project(project)
+        assert not errors1 and not errors2
+        assert building2 is building1
+        # Each load still gets its own environment
+        assert env2 is not env1
+        assert env2.steps.keys() == env1.steps.keys()
+    
+    def test_changed_file_is_reparsed(self, tmp_path):
+        project = self.copy_project(tmp_path)
+        building_file = project / "tip_calculator.building"
+        building1, _, _ = load_project(project)
+        
+        building_file.write_text(building_file.read_text() + "\n")
+        stat = building_file.stat()
+        os.utime(building_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        building2, _, errors = load_project(project)
+        assert not errors
+        assert building2 is not building1
+    
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        from steps import loader
+        monkeypatch.setattr(loader, "_PARSE_CACHE_SIZE", 2)
+        monkeypatch.setattr(loader, "_PARSE_CACHE", loader.OrderedDict())
+        project = self.copy_project(tmp_path)
+        _, _, errors = load_project(project)
+        assert not errors
+        assert len(loader._PARSE_CACHE) == 2
@@ -22,7 +22,7 @@ from steps.ast_nodes import (
     AttemptStatement, AddToListStatement, RemoveFromListStatement,
     NumberLiteral, TextLiteral, BooleanLiteral, NothingLiteral,
     ListLiteral, TableLiteral, IdentifierNode, InputNode,
-    BinaryOpNode, UnaryOpNode, TypeConversionNode, TableAccessNode,
+    BinaryOpNode, NAryOpNode, UnaryOpNode, TypeConversionNode, TableAccessNode,
     LengthOfNode, CharacterAtNode, AddedToNode, SplitByNode,
     ContainsNode, StartsWithNode, EndsWithNode, IsInNode,
 )
@@ -569,7 +569,21 @@ class TestParseLiterals:
         expr = result.ast.body[0].expression
         assert isinstance(expr, TableLiteral)
         assert len(expr.pairs) == 2
-    
+
+    def test_nested_list_literal_with_trailing_comma(self):
+        source = """building: test
+
+    display [1, [2, 3], (4 + 5), 6,]
+"""
+        result = parse_building(source)
+        assert result.success
+        expr = result.ast.body[0].expression
+        assert isinstance(expr, ListLiteral)
+        assert len(expr.elements) == 4
+        assert isinstance(expr.elements[1], ListLiteral)
+        assert len(expr.elements[1].elements) == 2
+        assert isinstance(expr.elements[3], NumberLiteral)
+
     def test_input_expression(self):
         source = """building: test
 
@@ -669,6 +683,30 @@ class TestParseOperators:
         assert isinstance(expr, BinaryOpNode)
         assert expr.operator == "-"
     
+    def test_addition_chain(self):
+        source = """building: test
+
+    display 1 + 2 - 3 + 4
+"""
+        result = parse_building(source)
+        assert result.success
+        expr = result.ast.body[0].expression
+        assert isinstance(expr, NAryOpNode)
+        assert expr.operators == ["+", "-", "+"]
+        assert len(expr.operands) == 4
+    
+    def test_addition_chain_split_by_text_operation(self):
+        source = """building: test
+
+    display a + b + c added to d
+"""
+        result = parse_building(source)
+        assert result.success
+        expr = result.ast.body[0].expression
+        assert isinstance(expr, AddedToNode)
+        assert isinstance(expr.left, NAryOpNode)
+        assert expr.left.operators == ["+", "+"]
+    
     def test_boolean_and(self):
         source = """building: test
 
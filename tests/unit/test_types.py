@@ -26,6 +26,11 @@ class TestStepsNumber:
         num = StepsNumber(-7.0)
         assert num.display_string() == "-7"
     
+    def test_special_display(self):
+        assert StepsNumber(42).display_string() == "42"
+        assert StepsNumber(float("inf")).display_string() == "inf"
+        assert StepsNumber(float("nan")).display_string() == "nan"
+    
     def test_truthiness_nonzero(self):
         assert StepsNumber(42.0).is_truthy() is True
     
@@ -68,6 +73,10 @@ class TestStepsNumber:
         assert StepsNumber(42) == StepsNumber(42)
         assert not StepsNumber(42) == StepsNumber(43)
     
+    def test_equality_requires_same_type(self):
+        assert StepsNumber(1) != StepsBoolean(True)
+        assert StepsNumber(1) != StepsText("1")
+    
     def test_as_text(self):
         num = StepsNumber(42)
         text = num.as_text()
@@ -102,6 +111,10 @@ class TestStepsText:
         assert result.elements[0].value == "a"
         assert result.elements[1].value == "b"
         assert result.elements[2].value == "c"
+        assert result.elements[0] == StepsText("a")
+        assert result.contains(StepsText("b")).value is True
+        result.add(StepsList())
+        assert result.python_value() == ["a", "b", "c", []]
     
     def test_character_at(self):
         result = StepsText("hello").character_at(0)
@@ -190,6 +203,11 @@ class TestStepsList:
         assert lst.length() == 3
         assert lst.display_string() == "[1, 2, 3]"
     
+    def test_nested_display(self):
+        table = StepsTable({"a": StepsList([StepsText("x"), StepsBoolean(False)])})
+        lst = StepsList([StepsNumber(1.5), table, StepsList(), StepsNothing()])
+        assert lst.display_string() == '[1.5, ["a": [x, false]], [], nothing]'
+    
     def test_truthiness(self):
         assert StepsList([StepsNumber(1)]).is_truthy() is True
         assert StepsList().is_truthy() is False
@@ -227,6 +245,42 @@ class TestStepsList:
         assert lst.contains(StepsNumber(1)).value is True
         assert lst.contains(StepsNumber(99)).value is False
     
+    def test_set_element(self):
+        lst = StepsList([StepsNumber(1), StepsNumber(2)])
+        lst.set(1, StepsText("two"))
+        assert lst.get(1) == StepsText("two")
+        with pytest.raises(IndexError):
+            lst.set(5, StepsNumber(0))
+    
+    def test_python_value_tracks_mutation(self):
+        lst = StepsList([StepsNumber(1), StepsText("a")])
+        assert lst.python_value() == [1, "a"]
+        lst.add(StepsList([StepsBoolean(True)]))
+        assert lst.python_value() == [1, "a", [True]]
+        lst.set(0, StepsNothing())
+        assert lst.python_value() == [None, "a", [True]]
+    
+    def test_repeated_contains(self):
+        lst = StepsList([StepsNumber(i) for i in range(10)] + [StepsText("a")])
+        for _ in range(6):
+            assert lst.contains(StepsNumber(3)).value is True
+            assert lst.contains(StepsText("b")).value is False
+        assert lst.contains(StepsBoolean(True)).value is False
+        assert lst.contains(StepsList()).value is False
+        lst.add(StepsText("b"))
+        assert lst.contains(StepsText("b")).value is True
+        lst.remove(StepsNumber(3))
+        assert lst.contains(StepsNumber(3)).value is False
+        lst.set(0, StepsNothing())
+        assert lst.contains(StepsNothing()).value is True
+    
+    def test_nested_equality(self):
+        a = StepsList([StepsNumber(1), StepsList([StepsText("x")])])
+        b = StepsList([StepsNumber(1), StepsList([StepsText("x")])])
+        assert a == b
+        assert a != StepsList([StepsNumber(1), StepsList([StepsBoolean(True)])])
+        assert StepsList([StepsNumber(1)]) != StepsTable({"0": StepsNumber(1)})
+    
     def test_iteration(self):
         lst = StepsList([StepsNumber(1), StepsNumber(2)])
         values = [item.value for item in lst]
@@ -275,6 +329,15 @@ class TestStepsTable:
         key_values = [k.value for k in keys]
         assert "a" in key_values
         assert "b" in key_values
+    
+    def test_keys_after_set(self):
+        table = StepsTable({"a": StepsNumber(1)})
+        keys = table.keys()
+        keys.add(StepsText("z"))
+        assert table.keys().python_value() == ["a"]
+        table.set("a", StepsNumber(2))
+        table.set("b", StepsNumber(3))
+        assert table.keys().python_value() == ["a", "b"]
 
 
 class TestStepsNothing:
@@ -350,6 +413,52 @@ class TestMakeValue:
         original = StepsNumber(42)
         result = make_value(original)
         assert result is original
+    
+    def test_from_subclasses(self):
+        from collections import OrderedDict
+        
+        class Label(str):
+            pass
+        
+        assert make_value(Label("hi")) == StepsText("hi")
+        assert make_value(OrderedDict(a=1)).get("a") == StepsNumber(1)
+        with pytest.raises(TypeError):
+            make_value(object())
+
+
+class TestSharedInstances:
+    """Tests for the shared boolean, nothing and small-number instances."""
+    
+    def test_booleans_are_shared(self):
+        assert StepsBoolean(True) is StepsBoolean(1 == 1)
+        assert StepsBoolean(False) is StepsBoolean(0)
+        assert StepsBoolean(True).value is True
+    
+    def test_nothing_is_shared(self):
+        assert StepsNothing() is StepsNothing()
+        assert make_value(None) is StepsNothing()
+    
+    def test_small_whole_numbers_are_shared(self):
+        assert StepsNumber.of(3.0) is StepsNumber.of(3)
+        assert (StepsNumber(1) + StepsNumber(2)) is StepsNumber.of(3)
+        assert StepsNumber.of(256) is StepsNumber.of(256.0)
+    
+    def test_other_numbers_are_not_cached(self):
+        assert StepsNumber.of(1000) is not StepsNumber.of(1000)
+        assert StepsNumber.of(2.5).value == 2.5
+        assert StepsNumber.of(2.5) == StepsNumber(2.5)
+        assert hash(StepsNumber.of(1000.0)) == hash(StepsNumber(1000.0))
+    
+    def test_copy_keeps_shared_instances(self):
+        import copy
+        assert copy.deepcopy(StepsBoolean(True)) is StepsBoolean(True)
+        assert copy.deepcopy(StepsNothing()) is StepsNothing()
+    
+    def test_scalars_are_hashable(self):
+        assert hash(StepsNumber(2.5)) == hash(StepsNumber(2.5))
+        assert hash(StepsText("a")) == hash(StepsText("a"))
+        assert len({StepsNumber(1), StepsNumber(1.0), StepsText("1"), StepsBoolean(True)}) == 3
+        assert StepsText("a") != StepsText("b")
 
 
 class TestTypeHelpers: